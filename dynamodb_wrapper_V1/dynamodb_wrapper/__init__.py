@@ -14,6 +14,7 @@ from .repositories import (
     BaseDynamoRepository,
     PipelineConfigRepository,
     PipelineRunLogsRepository,
+    RepositoryContainer,
     TableConfigRepository,
 )
 
@@ -23,6 +24,7 @@ __all__ = [
     "PipelineConfigRepository",
     "TableConfigRepository",
     "PipelineRunLogsRepository",
+    "RepositoryContainer",
     "PipelineConfig",
     "TableConfig",
     "PipelineRunLog",
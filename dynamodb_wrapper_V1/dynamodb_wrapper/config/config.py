@@ -1,5 +1,7 @@
+import hashlib
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -10,6 +12,12 @@ load_dotenv()
 # Import at top level to avoid circular imports - only imported when method is called
 # This is acceptable since get_timezone_manager is only called after config initialization
 
+# Resources whose clients are shared, keyed by DynamoDBConfig._connection_key().
+# Kept off the config so configs stay picklable and copies with other
+# connection settings get their own client.
+_shared_resources: Dict[Tuple[Any, ...], Any] = {}
+_shared_client_lock = threading.Lock()
+
 
 class DynamoDBConfig(BaseModel):
     """Configuration for DynamoDB connection and operations."""
@@ -57,6 +65,16 @@ class DynamoDBConfig(BaseModel):
         description="Request timeout in seconds"
     )
 
+    connect_timeout_seconds: float = Field(
+        default=1.0,
+        description="Connection establishment timeout in seconds"
+    )
+
+    retry_mode: str = Field(
+        default="adaptive",
+        description="botocore retry mode (legacy, standard, adaptive)"
+    )
+
     # Environment settings
     environment: str = Field(
         default_factory=lambda: os.getenv("ENVIRONMENT", "dev"),
@@ -102,6 +120,15 @@ class DynamoDBConfig(BaseModel):
             raise ValueError(f"Environment must be one of: {valid_environments}")
         return v
 
+    @field_validator('retry_mode')
+    @classmethod
+    def validate_retry_mode(cls, v):
+        """Validate botocore retry mode."""
+        valid_modes = ['legacy', 'standard', 'adaptive']
+        if v not in valid_modes:
+            raise ValueError(f"Retry mode must be one of: {valid_modes}")
+        return v
+
     @field_validator('default_timezone', 'user_timezone')
     @classmethod
     def validate_timezone(cls, v):
@@ -112,14 +139,10 @@ class DynamoDBConfig(BaseModel):
         # Try to create ZoneInfo to validate timezone
         try:
             # Import here to avoid circular imports
-            import sys
-            if sys.version_info >= (3, 9):
+            try:
                 from zoneinfo import ZoneInfo
-            else:
-                try:
-                    from backports.zoneinfo import ZoneInfo  # type: ignore
-                except ImportError:
-                    from zoneinfo import ZoneInfo  # type: ignore
+            except ImportError:  # Python < 3.9
+                from backports.zoneinfo import ZoneInfo  # type: ignore
 
             ZoneInfo(v)
             return v
@@ -224,6 +247,78 @@ class DynamoDBConfig(BaseModel):
         config.default_timezone = timezone_str
         return config
 
+    def get_shared_client(self) -> Any:
+        """Get the low-level DynamoDB client shared by repositories using this config.
+
+        Built once per set of connection settings, so every repository
+        created from equivalent configs reuses one boto3 Session, service
+        model and connection pool. Clients are thread-safe.
+
+        Returns:
+            boto3 DynamoDB client (cached)
+        """
+        return self._get_root_resource().meta.client
+
+    def create_resource(self) -> Any:
+        """Create a DynamoDB resource on top of the shared client.
+
+        boto3 resources are not thread-safe, so each repository, and each
+        thread that talks to DynamoDB, should use its own. They are cheap to
+        create because the client underneath is shared.
+
+        Returns:
+            New boto3 DynamoDB service resource
+        """
+        root = self._get_root_resource()
+        return type(root)(client=root.meta.client)
+
+    def _connection_key(self) -> Tuple[Any, ...]:
+        """Key identifying the client settings; credentials are hashed, not kept."""
+        credentials = f"{self.aws_access_key_id}:{self.aws_secret_access_key}".encode()
+        return (
+            self.endpoint_url,
+            self.region_name,
+            hashlib.sha256(credentials).hexdigest(),
+            self.max_pool_connections,
+            self.retries,
+            self.timeout_seconds,
+            self.connect_timeout_seconds,
+            self.retry_mode,
+        )
+
+    def _get_root_resource(self) -> Any:
+        """Build the resource whose client is shared, once per connection key."""
+        key = self._connection_key()
+        with _shared_client_lock:
+            resource = _shared_resources.get(key)
+            if resource is None:
+                import boto3
+                from botocore.config import Config
+
+                session = boto3.Session(
+                    aws_access_key_id=self.aws_access_key_id,
+                    aws_secret_access_key=self.aws_secret_access_key,
+                    region_name=self.region_name
+                )
+
+                resource_kwargs = {
+                    'region_name': self.region_name,
+                    'config': Config(
+                        # total_max_attempts counts the first call, so retries keeps its meaning
+                        retries={'total_max_attempts': self.retries + 1, 'mode': self.retry_mode},
+                        max_pool_connections=self.max_pool_connections,
+                        read_timeout=self.timeout_seconds,
+                        connect_timeout=self.connect_timeout_seconds,
+                        tcp_keepalive=True
+                    )
+                }
+                if self.endpoint_url:
+                    resource_kwargs['endpoint_url'] = self.endpoint_url
+
+                resource = session.resource('dynamodb', **resource_kwargs)
+                _shared_resources[key] = resource
+        return resource
+
     def get_timezone_manager(self):
         """Get a TimezoneManager configured with this config's settings.
 
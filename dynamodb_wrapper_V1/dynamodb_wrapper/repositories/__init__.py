@@ -1,4 +1,5 @@
-from .base import BaseDynamoRepository
+from .base import BaseDynamoRepository, batch_create_models, batch_get_models
+from .container import RepositoryContainer
 from .pipeline_config import PipelineConfigRepository
 from .pipeline_run_logs import PipelineRunLogsRepository
 from .table_config import TableConfigRepository
@@ -8,4 +9,7 @@ __all__ = [
     "PipelineConfigRepository",
     "TableConfigRepository",
     "PipelineRunLogsRepository",
+    "RepositoryContainer",
+    "batch_create_models",
+    "batch_get_models",
 ]
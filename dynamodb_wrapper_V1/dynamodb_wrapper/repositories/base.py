@@ -1,11 +1,12 @@
+import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, tzinfo
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
 
-import boto3
-from boto3.dynamodb.conditions import Key
-from botocore.config import Config
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 
@@ -16,18 +17,65 @@ T = TypeVar('T', bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+# Guard so botocore's parser is only patched once per process
+_fast_json_installed = False
+
+# DynamoDB BatchWriteItem accepts at most 25 put requests per call
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+
+
+class _FastJSONAdapter:
+    """Stand-in for the ``json`` module that swaps in orjson's ``loads``.
+
+    Anything other than ``loads`` falls through to the stdlib module, so
+    botocore keeps working if it starts using other ``json`` attributes.
+    """
+
+    def __init__(self, loads):
+        self.loads = loads
+
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+
+def _install_fast_json() -> None:
+    """Make botocore parse response bodies with orjson when it is installed.
+
+    Scan/query payloads are deserialized by ``botocore.parsers`` with stdlib
+    ``json.loads``, which dominates CPU on list-heavy workloads. orjson is an
+    optional dependency (``pip install dynamodb-wrapper-v1[fast]``); without it
+    this is a no-op. orjson's decode error subclasses ``ValueError``, so
+    botocore's existing error handling is unaffected.
+    """
+    global _fast_json_installed
+    if _fast_json_installed:
+        return
+    _fast_json_installed = True
+
+    try:
+        import orjson
+    except ImportError:
+        return
+
+    import botocore.parsers
+    botocore.parsers.json = _FastJSONAdapter(orjson.loads)
+    logger.debug("Using orjson for botocore response parsing")
+
 
 class BaseDynamoRepository(Generic[T], ABC):
     """Base repository class for DynamoDB operations with Pydantic models."""
 
-    def __init__(self, config: DynamoDBConfig):
+    def __init__(self, config: DynamoDBConfig, resource: Optional[Any] = None):
         """Initialize repository with DynamoDB configuration.
 
         Args:
             config: DynamoDB configuration object
+            resource: boto3 DynamoDB resource to use; defaults to a new one on
+                the client shared through ``config.get_shared_client()``
         """
         self.config = config
-        self._dynamodb = None
+        self._dynamodb = resource
         self._table = None
         self._timezone_manager = None
 
@@ -35,31 +83,9 @@ class BaseDynamoRepository(Generic[T], ABC):
     def dynamodb(self):
         """Lazy initialization of DynamoDB resource."""
         if self._dynamodb is None:
+            _install_fast_json()
             try:
-                session = boto3.Session(
-                    aws_access_key_id=self.config.aws_access_key_id,
-                    aws_secret_access_key=self.config.aws_secret_access_key,
-                    region_name=self.config.region_name
-                )
-
-                # Configure connection parameters
-                dynamodb_config = {
-                    'region_name': self.config.region_name
-                }
-
-                if self.config.endpoint_url:
-                    dynamodb_config['endpoint_url'] = self.config.endpoint_url
-
-                # Add retry and timeout configuration
-                boto_config = Config(
-                    retries={'max_attempts': self.config.retries},
-                    max_pool_connections=self.config.max_pool_connections,
-                    read_timeout=self.config.timeout_seconds,
-                    connect_timeout=self.config.timeout_seconds
-                )
-                dynamodb_config['config'] = boto_config
-
-                self._dynamodb = session.resource('dynamodb', **dynamodb_config)
+                self._dynamodb = self.config.create_resource()
             except Exception as e:
                 logger.error(f"Failed to create DynamoDB resource: {e}")
                 raise ConnectionError(f"Failed to connect to DynamoDB: {e}", e) from e
@@ -76,6 +102,15 @@ class BaseDynamoRepository(Generic[T], ABC):
                 raise ConnectionError(f"Failed to access table '{self.table_name}': {e}", e) from e
         return self._table
 
+    def _worker_table(self) -> Any:
+        """Table handle on a new resource that shares this repository's client.
+
+        boto3 resources are not thread-safe but their clients are, so each
+        worker thread gets its own resource on the same connection pool.
+        """
+        resource = self.dynamodb
+        return type(resource)(client=resource.meta.client).Table(self.table_name)
+
     @property
     def timezone_manager(self):
         """Lazy initialization of timezone manager."""
@@ -84,6 +119,12 @@ class BaseDynamoRepository(Generic[T], ABC):
             self._timezone_manager = TimezoneManager(self.config.default_timezone)
         return self._timezone_manager
 
+    @property
+    def default_tz(self) -> tzinfo:
+        """The configured default timezone, resolved from the current config value."""
+        from ..utils.timezone import resolve_timezone
+        return resolve_timezone(self.config.default_timezone)
+
     @property
     @abstractmethod
     def table_name(self) -> str:
@@ -110,6 +151,8 @@ class BaseDynamoRepository(Generic[T], ABC):
     def _item_to_model(self, item: Dict[str, Any]) -> T:
         """Convert DynamoDB item to Pydantic model."""
         try:
+            from ..utils.timezone import parse_iso_datetime
+
             # Convert ISO string datetime back to datetime objects
             def convert_datetime_strings(obj):
                 if isinstance(obj, dict):
@@ -119,7 +162,7 @@ class BaseDynamoRepository(Generic[T], ABC):
                 elif isinstance(obj, str) and 'T' in obj and obj.count('-') >= 2:
                     # Try to parse as datetime
                     try:
-                        dt = datetime.fromisoformat(obj.replace('Z', '+00:00'))
+                        dt = parse_iso_datetime(obj)
                         # Convert to user's preferred timezone if specified
                         if self.config.user_timezone:
                             dt = self.timezone_manager.to_timezone(dt, self.config.user_timezone)
@@ -140,23 +183,32 @@ class BaseDynamoRepository(Generic[T], ABC):
         item = model.model_dump(exclude_none=True)
 
         # Convert datetime objects to ISO strings for DynamoDB
+        from ..utils.timezone import ensure_utc_for_storage
+        default_tz = self.default_tz
+        store_in_utc = self.config.store_timestamps_in_utc
+
         def convert_datetime(obj):
             if isinstance(obj, dict):
                 return {k: convert_datetime(v) for k, v in obj.items()}
             elif isinstance(obj, list):
                 return [convert_datetime(item) for item in obj]
             elif isinstance(obj, datetime):
-                # Ensure timezone-aware and convert to storage format
-                from ..utils.timezone import ensure_timezone_aware, to_utc
-                dt = ensure_timezone_aware(obj, self.config.default_timezone)
-                if self.config.store_timestamps_in_utc:
-                    dt = to_utc(dt)
-                return dt.isoformat()
+                if store_in_utc:
+                    return ensure_utc_for_storage(obj, default_tz).isoformat()
+                # Keep the original offset, only attaching the default zone to naive values
+                if obj.tzinfo is None:
+                    obj = obj.replace(tzinfo=default_tz)
+                return obj.isoformat()
             else:
                 return obj
 
         return convert_datetime(item)
 
+    def _invalidate_config_cache(self) -> None:
+        """Drop cached Spark configuration reads served from this table."""
+        from ..utils.config_cache import invalidate_table_cache
+        invalidate_table_cache(self.config, self.table_name)
+
     def _get_key(self, pk_value: Any, sk_value: Any = None) -> Dict[str, Any]:
         """Build key dictionary for DynamoDB operations."""
         key = {self.primary_key: pk_value}
@@ -180,18 +232,65 @@ class BaseDynamoRepository(Generic[T], ABC):
         try:
             item = self._model_to_item(model)
             self.table.put_item(Item=item)
+            self._invalidate_config_cache()
             logger.info(f"Created item in {self.table_name}: {item}")
             return model
         except ClientError as e:
             logger.error(f"Failed to create item in {self.table_name}: {e}")
             raise ConnectionError(f"Failed to create item: {e}", e) from e
 
-    def get(self, pk_value: Any, sk_value: Any = None) -> Optional[T]:
+    def put_if_absent(self, model: T) -> bool:
+        """Create an item only if no item with the same key exists.
+
+        A conditional PutItem replaces a separate existence check, so the
+        common path is one round trip whether or not the item is already there.
+
+        Args:
+            model: Pydantic model instance to create
+
+        Returns:
+            True if the item was created, False if it already existed
+
+        Raises:
+            ConnectionError: If DynamoDB operation fails
+        """
+        try:
+            item = self._model_to_item(model)
+            self.table.put_item(
+                Item=item,
+                ConditionExpression=Attr(self.primary_key).not_exists()
+            )
+            self._invalidate_config_cache()
+            logger.info(f"Created item in {self.table_name}: {item}")
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+                return False
+            logger.error(f"Failed to create item in {self.table_name}: {e}")
+            raise ConnectionError(f"Failed to create item: {e}", e) from e
+
+    def batch_create(self, models: List[T], max_retries: int = 3) -> List[T]:
+        """Create several items with BatchWriteItem instead of one PutItem each.
+
+        Args:
+            models: Pydantic model instances to create
+            max_retries: Retries for items DynamoDB returns as unprocessed
+
+        Returns:
+            The created model instances
+
+        Raises:
+            ConnectionError: If DynamoDB operation fails or items stay unprocessed
+        """
+        return batch_create_models([(self, model) for model in models], max_retries=max_retries)
+
+    def get(self, pk_value: Any, sk_value: Any = None, consistent: bool = False) -> Optional[T]:
         """Get an item by primary key (and sort key if applicable).
 
         Args:
             pk_value: Primary key value
             sk_value: Sort key value (if table has sort key)
+            consistent: Use a strongly consistent read (default: eventually consistent)
 
         Returns:
             Model instance if found, None otherwise
@@ -201,7 +300,7 @@ class BaseDynamoRepository(Generic[T], ABC):
         """
         try:
             key = self._get_key(pk_value, sk_value)
-            response = self.table.get_item(Key=key)
+            response = self.table.get_item(Key=key, ConsistentRead=consistent)
 
             if 'Item' in response:
                 return self._item_to_model(response['Item'])
@@ -211,12 +310,13 @@ class BaseDynamoRepository(Generic[T], ABC):
             logger.error(f"Failed to get item from {self.table_name}: {e}")
             raise ConnectionError(f"Failed to get item: {e}", e) from e
 
-    def get_or_raise(self, pk_value: Any, sk_value: Any = None) -> T:
+    def get_or_raise(self, pk_value: Any, sk_value: Any = None, consistent: bool = False) -> T:
         """Get an item or raise ItemNotFoundError if not found.
 
         Args:
             pk_value: Primary key value
             sk_value: Sort key value (if table has sort key)
+            consistent: Use a strongly consistent read (default: eventually consistent)
 
         Returns:
             Model instance
@@ -225,7 +325,7 @@ class BaseDynamoRepository(Generic[T], ABC):
             ItemNotFoundError: If item not found
             ConnectionError: If DynamoDB operation fails
         """
-        item = self.get(pk_value, sk_value)
+        item = self.get(pk_value, sk_value, consistent=consistent)
         if item is None:
             key = self._get_key(pk_value, sk_value)
             raise ItemNotFoundError(self.table_name, key)
@@ -247,6 +347,7 @@ class BaseDynamoRepository(Generic[T], ABC):
         try:
             item = self._model_to_item(model)
             self.table.put_item(Item=item)
+            self._invalidate_config_cache()
             logger.info(f"Updated item in {self.table_name}: {item}")
             return model
         except ClientError as e:
@@ -275,6 +376,7 @@ class BaseDynamoRepository(Generic[T], ABC):
 
             deleted = 'Attributes' in response
             if deleted:
+                self._invalidate_config_cache()
                 logger.info(f"Deleted item from {self.table_name}: {key}")
             return deleted
 
@@ -282,9 +384,15 @@ class BaseDynamoRepository(Generic[T], ABC):
             logger.error(f"Failed to delete item from {self.table_name}: {e}")
             raise ConnectionError(f"Failed to delete item: {e}", e) from e
 
-    def list_all(self) -> List[T]:
+    def list_all(self, consistent: bool = False, segments: int = 1) -> List[T]:
         """List all items in the table.
 
+        Args:
+            consistent: Use strongly consistent reads (default: eventually consistent)
+            segments: Number of parallel scan segments; above 1 the segments
+                are scanned concurrently on a thread pool, each worker with
+                its own Table handle
+
         Returns:
             List of model instances
 
@@ -292,19 +400,17 @@ class BaseDynamoRepository(Generic[T], ABC):
             ConnectionError: If DynamoDB operation fails
         """
         try:
-            response = self.table.scan()
-            items = []
-
-            for item in response.get('Items', []):
-                items.append(self._item_to_model(item))
-
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
-                response = self.table.scan(
-                    ExclusiveStartKey=response['LastEvaluatedKey']
-                )
-                for item in response.get('Items', []):
-                    items.append(self._item_to_model(item))
+            if segments > 1:
+                with ThreadPoolExecutor(max_workers=segments) as pool:
+                    pages = list(pool.map(
+                        lambda segment: self._scan_segment(
+                            consistent, segment, segments, table=self._worker_table()
+                        ),
+                        range(segments)
+                    ))
+                items = [item for page in pages for item in page]
+            else:
+                items = self._scan_segment(consistent)
 
             logger.info(f"Retrieved {len(items)} items from {self.table_name}")
             return items
@@ -313,11 +419,37 @@ class BaseDynamoRepository(Generic[T], ABC):
             logger.error(f"Failed to scan table {self.table_name}: {e}")
             raise ConnectionError(f"Failed to scan table: {e}", e) from e
 
-    def query_by_pk(self, pk_value: Any, **kwargs) -> List[T]:
+    def _scan_segment(
+        self,
+        consistent: bool,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+        table: Optional[Any] = None
+    ) -> List[T]:
+        """Scan the whole table, or one segment of a parallel scan, following pagination."""
+        table = table if table is not None else self.table
+        scan_kwargs: Dict[str, Any] = {'ConsistentRead': consistent}
+        if total_segments is not None:
+            scan_kwargs['Segment'] = segment
+            scan_kwargs['TotalSegments'] = total_segments
+
+        response = table.scan(**scan_kwargs)
+        items = [self._item_to_model(item) for item in response.get('Items', [])]
+
+        # Handle pagination
+        while 'LastEvaluatedKey' in response:
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            response = table.scan(**scan_kwargs)
+            items.extend(self._item_to_model(item) for item in response.get('Items', []))
+
+        return items
+
+    def query_by_pk(self, pk_value: Any, consistent: bool = False, **kwargs) -> List[T]:
         """Query items by primary key.
 
         Args:
             pk_value: Primary key value
+            consistent: Use strongly consistent reads (default: eventually consistent)
             **kwargs: Additional query parameters
 
         Returns:
@@ -329,6 +461,7 @@ class BaseDynamoRepository(Generic[T], ABC):
         try:
             query_kwargs = {
                 'KeyConditionExpression': Key(self.primary_key).eq(pk_value),
+                'ConsistentRead': consistent,
                 **kwargs
             }
 
@@ -352,13 +485,20 @@ class BaseDynamoRepository(Generic[T], ABC):
             logger.error(f"Failed to query table {self.table_name}: {e}")
             raise ConnectionError(f"Failed to query table: {e}", e) from e
 
-    def get_with_timezone(self, pk_value: Any, sk_value: Any = None, user_timezone: Optional[str] = None) -> Optional[T]:
+    def get_with_timezone(
+        self,
+        pk_value: Any,
+        sk_value: Any = None,
+        user_timezone: Optional[str] = None,
+        consistent: bool = False
+    ) -> Optional[T]:
         """Get an item and convert datetime fields to specified timezone.
 
         Args:
             pk_value: Primary key value
             sk_value: Sort key value (if table has sort key)
             user_timezone: Timezone to convert datetime fields to
+            consistent: Use a strongly consistent read (default: eventually consistent)
 
         Returns:
             Model instance with datetime fields in user timezone, None if not found
@@ -369,15 +509,22 @@ class BaseDynamoRepository(Generic[T], ABC):
             self.config.user_timezone = user_timezone
 
         try:
-            return self.get(pk_value, sk_value)
+            return self.get(pk_value, sk_value, consistent=consistent)
         finally:
             self.config.user_timezone = original_tz
 
-    def list_all_with_timezone(self, user_timezone: Optional[str] = None) -> List[T]:
+    def list_all_with_timezone(
+        self,
+        user_timezone: Optional[str] = None,
+        consistent: bool = False,
+        segments: int = 1
+    ) -> List[T]:
         """List all items with datetime fields converted to specified timezone.
 
         Args:
             user_timezone: Timezone to convert datetime fields to
+            consistent: Use strongly consistent reads (default: eventually consistent)
+            segments: Number of parallel scan segments
 
         Returns:
             List of model instances with datetime fields in user timezone
@@ -388,7 +535,7 @@ class BaseDynamoRepository(Generic[T], ABC):
             self.config.user_timezone = user_timezone
 
         try:
-            return self.list_all()
+            return self.list_all(consistent=consistent, segments=segments)
         finally:
             self.config.user_timezone = original_tz
 
@@ -416,3 +563,131 @@ class BaseDynamoRepository(Generic[T], ABC):
                 self.timezone_manager.default_timezone = original_tz
         else:
             return self.create(model)
+
+
+def batch_create_models(
+    entries: Sequence[Tuple[BaseDynamoRepository, BaseModel]],
+    max_retries: int = 3
+) -> List[BaseModel]:
+    """Create models in one or more repositories' tables with BatchWriteItem.
+
+    Items for different tables share requests, so bootstrapping a pipeline with
+    its tables and first run log takes a single round trip instead of one
+    PutItem per item. Unprocessed items are resubmitted with exponential backoff.
+
+    Args:
+        entries: (repository, model) pairs; each model is written to its repository's table
+        max_retries: Retries for items DynamoDB returns as unprocessed
+
+    Returns:
+        The created model instances, in input order
+
+    Raises:
+        ConnectionError: If DynamoDB operation fails or items stay unprocessed
+    """
+    if not entries:
+        return []
+
+    requests = [
+        (repo.table_name, {'PutRequest': {'Item': repo._model_to_item(model)}})
+        for repo, model in entries
+    ]
+    repos_by_table = {repo.table_name: repo for repo, _ in entries}
+    # Any repository's resource can write to every table on the same endpoint
+    dynamodb = entries[0][0].dynamodb
+
+    for start in range(0, len(requests), BATCH_WRITE_LIMIT):
+        request_items: Dict[str, List[Dict[str, Any]]] = {}
+        for table_name, request in requests[start:start + BATCH_WRITE_LIMIT]:
+            request_items.setdefault(table_name, []).append(request)
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = dynamodb.batch_write_item(RequestItems=request_items)
+            except ClientError as e:
+                logger.error(f"Failed to batch write items to {list(request_items)}: {e}")
+                raise ConnectionError(f"Failed to batch write items: {e}", e) from e
+
+            for table_name in request_items:
+                repos_by_table[table_name]._invalidate_config_cache()
+            request_items = response.get('UnprocessedItems') or {}
+            if not request_items:
+                break
+            if attempt == max_retries:
+                unprocessed = sum(len(items) for items in request_items.values())
+                raise ConnectionError(
+                    f"{unprocessed} items still unprocessed after {max_retries} retries",
+                    context={'unprocessed_items': request_items}
+                )
+            time.sleep((2 ** attempt) + (time.time() % 1))
+
+    logger.info(f"Batch created {len(entries)} items")
+    return [model for _, model in entries]
+
+
+def batch_get_models(
+    entries: Sequence[Tuple[BaseDynamoRepository, Any]],
+    consistent: bool = False,
+    max_retries: int = 3
+) -> List[Optional[BaseModel]]:
+    """Get models from one or more repositories' tables with BatchGetItem.
+
+    Keys for different tables share requests, so reading a pipeline together
+    with its tables takes a single round trip instead of one GetItem per key.
+    Unprocessed keys are resubmitted with exponential backoff.
+
+    Args:
+        entries: (repository, primary key value) pairs
+        consistent: Use strongly consistent reads (default: eventually consistent)
+        max_retries: Retries for keys DynamoDB returns as unprocessed
+
+    Returns:
+        Model instances in input order, None where no item exists
+
+    Raises:
+        ConnectionError: If DynamoDB operation fails or keys stay unprocessed
+    """
+    if not entries:
+        return []
+
+    repos_by_table = {repo.table_name: repo for repo, _ in entries}
+    requested = list(dict.fromkeys(
+        (repo.table_name, pk_value) for repo, pk_value in entries
+    ))
+    # Any repository's resource can read every table on the same endpoint
+    dynamodb = entries[0][0].dynamodb
+    found: Dict[Tuple[str, Any], BaseModel] = {}
+
+    for start in range(0, len(requested), BATCH_GET_LIMIT):
+        request_items: Dict[str, Dict[str, Any]] = {}
+        for table_name, pk_value in requested[start:start + BATCH_GET_LIMIT]:
+            table_request = request_items.setdefault(
+                table_name, {'Keys': [], 'ConsistentRead': consistent}
+            )
+            table_request['Keys'].append(repos_by_table[table_name]._get_key(pk_value))
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = dynamodb.batch_get_item(RequestItems=request_items)
+            except ClientError as e:
+                logger.error(f"Failed to batch get items from {list(request_items)}: {e}")
+                raise ConnectionError(f"Failed to batch get items: {e}", e) from e
+
+            for table_name, items in response.get('Responses', {}).items():
+                repo = repos_by_table[table_name]
+                for item in items:
+                    found[(table_name, item[repo.primary_key])] = repo._item_to_model(item)
+
+            request_items = response.get('UnprocessedKeys') or {}
+            if not request_items:
+                break
+            if attempt == max_retries:
+                unprocessed = sum(len(request['Keys']) for request in request_items.values())
+                raise ConnectionError(
+                    f"{unprocessed} keys still unprocessed after {max_retries} retries",
+                    context={'unprocessed_keys': request_items}
+                )
+            time.sleep((2 ** attempt) + (time.time() % 1))
+
+    logger.info(f"Batch got {len(found)} of {len(requested)} items")
+    return [found.get((repo.table_name, pk_value)) for repo, pk_value in entries]
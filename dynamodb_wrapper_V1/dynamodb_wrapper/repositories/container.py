@@ -0,0 +1,28 @@
+from typing import Any, Optional
+
+from ..config import DynamoDBConfig
+from .pipeline_config import PipelineConfigRepository
+from .pipeline_run_logs import PipelineRunLogsRepository
+from .table_config import TableConfigRepository
+
+
+class RepositoryContainer:
+    """Pipeline, table and run log repositories sharing one DynamoDB resource.
+
+    The resource is not thread-safe, so use a container from one thread and
+    build another (cheap, since the client is shared) for each extra thread.
+    """
+
+    def __init__(self, config: DynamoDBConfig, resource: Optional[Any] = None):
+        """Build all repositories on a single boto3 resource.
+
+        Args:
+            config: DynamoDB configuration object
+            resource: boto3 DynamoDB resource to share; defaults to a new
+                one from ``config.create_resource()``
+        """
+        self.config = config
+        self.resource = resource if resource is not None else config.create_resource()
+        self.pipelines = PipelineConfigRepository(config, self.resource)
+        self.tables = TableConfigRepository(config, self.resource)
+        self.run_logs = PipelineRunLogsRepository(config, self.resource)
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from ..config import DynamoDBConfig
 from ..models import PipelineConfig
@@ -9,9 +9,9 @@ from .base import BaseDynamoRepository
 class PipelineConfigRepository(BaseDynamoRepository[PipelineConfig]):
     """Repository for pipeline configuration operations."""
 
-    def __init__(self, config: DynamoDBConfig):
+    def __init__(self, config: DynamoDBConfig, resource: Optional[Any] = None):
         """Initialize repository with DynamoDB configuration."""
-        super().__init__(config)
+        super().__init__(config, resource)
 
     @property
     def table_name(self) -> str:
@@ -28,33 +28,40 @@ class PipelineConfigRepository(BaseDynamoRepository[PipelineConfig]):
         """Return the primary key field name."""
         return "pipeline_id"
 
-    def get_by_pipeline_id(self, pipeline_id: str, user_timezone: Optional[str] = None) -> Optional[PipelineConfig]:
+    def get_by_pipeline_id(
+        self,
+        pipeline_id: str,
+        user_timezone: Optional[str] = None,
+        consistent: bool = False
+    ) -> Optional[PipelineConfig]:
         """Get pipeline configuration by pipeline ID.
 
         Args:
             pipeline_id: The pipeline identifier
             user_timezone: Optional timezone to convert datetime fields to
+            consistent: Use a strongly consistent read (default: eventually consistent)
 
         Returns:
             PipelineConfig if found, None otherwise
         """
         if user_timezone:
-            return self.get_with_timezone(pipeline_id, user_timezone=user_timezone)
-        return self.get(pipeline_id)
+            return self.get_with_timezone(pipeline_id, user_timezone=user_timezone, consistent=consistent)
+        return self.get(pipeline_id, consistent=consistent)
 
-    def get_active_pipelines(self, user_timezone: Optional[str] = None) -> List[PipelineConfig]:
+    def get_active_pipelines(self, user_timezone: Optional[str] = None, consistent: bool = False) -> List[PipelineConfig]:
         """Get all active pipeline configurations.
 
         Args:
             user_timezone: Optional timezone to convert datetime fields to
+            consistent: Use strongly consistent reads (default: eventually consistent)
 
         Returns:
             List of active PipelineConfig instances
         """
         if user_timezone:
-            all_pipelines = self.list_all_with_timezone(user_timezone)
+            all_pipelines = self.list_all_with_timezone(user_timezone, consistent=consistent)
         else:
-            all_pipelines = self.list_all()
+            all_pipelines = self.list_all(consistent=consistent)
         return [pipeline for pipeline in all_pipelines if pipeline.is_active]
 
     def get_pipelines_by_environment(self, environment: str, user_timezone: Optional[str] = None) -> List[PipelineConfig]:
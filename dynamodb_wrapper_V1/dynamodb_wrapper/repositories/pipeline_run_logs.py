@@ -1,8 +1,12 @@
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
 
 from ..config import DynamoDBConfig
+from ..exceptions import ConnectionError
 from ..models import PipelineRunLog, RunStatus
 from .base import BaseDynamoRepository
 
@@ -10,9 +14,9 @@ from .base import BaseDynamoRepository
 class PipelineRunLogsRepository(BaseDynamoRepository[PipelineRunLog]):
     """Repository for pipeline run log operations."""
 
-    def __init__(self, config: DynamoDBConfig):
+    def __init__(self, config: DynamoDBConfig, resource: Optional[Any] = None):
         """Initialize repository with DynamoDB configuration."""
-        super().__init__(config)
+        super().__init__(config, resource)
 
     @property
     def table_name(self) -> str:
@@ -68,6 +72,74 @@ class PipelineRunLogsRepository(BaseDynamoRepository[PipelineRunLog]):
 
         return pipeline_runs
 
+    def iter_runs_by_pipeline(self, pipeline_id: str, page_size: int = 10) -> Iterator[List[PipelineRunLog]]:
+        """Lazily iterate over pipeline run logs for a pipeline, one page at a time.
+
+        The run logs table is keyed on run_id only, so pages come from a
+        filtered Scan; each request evaluates at most ``page_size`` items and
+        the next page is only fetched when the caller asks for it. Pages are
+        therefore at most ``page_size`` long and are not ordered by start_time.
+
+        Args:
+            pipeline_id: The pipeline identifier
+            page_size: Maximum number of items evaluated per request
+
+        Yields:
+            Non-empty lists of PipelineRunLog instances
+
+        Raises:
+            ConnectionError: If DynamoDB operation fails
+        """
+        scan_kwargs = {
+            'FilterExpression': Attr('pipeline_id').eq(pipeline_id),
+            'Limit': page_size,
+        }
+
+        while True:
+            try:
+                response = self.table.scan(**scan_kwargs)
+            except ClientError as e:
+                raise ConnectionError(f"Failed to scan table: {e}", e) from e
+
+            page = [self._item_to_model(item) for item in response.get('Items', [])]
+            if page:
+                yield page
+
+            if 'LastEvaluatedKey' not in response:
+                return
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def count_runs_by_pipeline(self, pipeline_id: str) -> int:
+        """Count pipeline run logs for a pipeline without fetching them.
+
+        Uses Select='COUNT', so DynamoDB returns only counts and no item
+        attributes cross the wire.
+
+        Args:
+            pipeline_id: The pipeline identifier
+
+        Returns:
+            Number of runs recorded for the pipeline
+
+        Raises:
+            ConnectionError: If DynamoDB operation fails
+        """
+        scan_kwargs = {
+            'FilterExpression': Attr('pipeline_id').eq(pipeline_id),
+            'Select': 'COUNT',
+        }
+        count = 0
+
+        try:
+            while True:
+                response = self.table.scan(**scan_kwargs)
+                count += response.get('Count', 0)
+                if 'LastEvaluatedKey' not in response:
+                    return count
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        except ClientError as e:
+            raise ConnectionError(f"Failed to scan table: {e}", e) from e
+
     def get_runs_by_status(self, status: RunStatus, pipeline_id: Optional[str] = None, user_timezone: Optional[str] = None) -> List[PipelineRunLog]:
         """Get pipeline runs by status.
 
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from ..config import DynamoDBConfig
 from ..models import TableConfig, TableType
@@ -9,9 +9,9 @@ from .base import BaseDynamoRepository
 class TableConfigRepository(BaseDynamoRepository[TableConfig]):
     """Repository for table configuration operations."""
 
-    def __init__(self, config: DynamoDBConfig):
+    def __init__(self, config: DynamoDBConfig, resource: Optional[Any] = None):
         """Initialize repository with DynamoDB configuration."""
-        super().__init__(config)
+        super().__init__(config, resource)
 
     @property
     def table_name(self) -> str:
@@ -42,20 +42,26 @@ class TableConfigRepository(BaseDynamoRepository[TableConfig]):
             return self.get_with_timezone(table_id, user_timezone=user_timezone)
         return self.get(table_id)
 
-    def get_tables_by_pipeline(self, pipeline_id: str, user_timezone: Optional[str] = None) -> List[TableConfig]:
+    def get_tables_by_pipeline(
+        self,
+        pipeline_id: str,
+        user_timezone: Optional[str] = None,
+        segments: int = 1
+    ) -> List[TableConfig]:
         """Get all table configurations for a specific pipeline.
 
         Args:
             pipeline_id: The pipeline identifier
             user_timezone: Optional timezone to convert datetime fields to
+            segments: Number of parallel scan segments to read the table with
 
         Returns:
             List of TableConfig instances for the pipeline
         """
         if user_timezone:
-            all_tables = self.list_all_with_timezone(user_timezone)
+            all_tables = self.list_all_with_timezone(user_timezone, segments=segments)
         else:
-            all_tables = self.list_all()
+            all_tables = self.list_all(segments=segments)
         return [table for table in all_tables if table.pipeline_id == pipeline_id]
 
     def get_active_tables_by_pipeline(self, pipeline_id: str, user_timezone: Optional[str] = None) -> List[TableConfig]:
@@ -1,3 +1,4 @@
+from .config_cache import TTLCache, invalidate_pipeline_cache, invalidate_table_cache
 from .pyspark_integration import (
     SparkDynamoDBIntegration,
     create_spark_session_with_dynamodb,
@@ -5,12 +6,16 @@ from .pyspark_integration import (
     get_table_configs_for_spark,
     log_pipeline_run_from_spark,
 )
+from .stats_writer import StatsWriter
 from .timezone import (
     TimezoneManager,
     configure_timezone_from_config,
     ensure_timezone_aware,
+    ensure_utc_for_storage,
     get_timezone_manager,
     now_in_tz,
+    parse_iso_datetime,
+    resolve_timezone,
     set_global_timezone,
     to_user_timezone,
     to_utc,
@@ -23,6 +28,10 @@ __all__ = [
     "get_table_configs_for_spark",
     "log_pipeline_run_from_spark",
     "create_spark_session_with_dynamodb",
+    "TTLCache",
+    "invalidate_pipeline_cache",
+    "invalidate_table_cache",
+    "StatsWriter",
     "TimezoneManager",
     "get_timezone_manager",
     "set_global_timezone",
@@ -32,4 +41,7 @@ __all__ = [
     "to_user_timezone",
     "to_utc",
     "ensure_timezone_aware",
+    "ensure_utc_for_storage",
+    "resolve_timezone",
+    "parse_iso_datetime",
 ]
@@ -0,0 +1,36 @@
+"""ZoneInfo fallbacks for Python versions without the zoneinfo module.
+
+Only imported by ``utils.timezone`` when ``from zoneinfo import ZoneInfo``
+fails, so supported Python 3.9+ processes never load it.
+"""
+
+from datetime import datetime
+
+try:
+    from backports.zoneinfo import ZoneInfo  # type: ignore
+except ImportError:
+    # Fallback to pytz if available
+    try:
+        import pytz
+
+        class ZoneInfo:  # type: ignore
+            """Fallback ZoneInfo implementation using pytz."""
+
+            def __init__(self, key: str):
+                self.key = key
+                self._tz = pytz.timezone(key)
+
+            def __str__(self) -> str:
+                return self.key
+
+            def localize(self, dt: datetime) -> datetime:
+                return self._tz.localize(dt)
+
+            def normalize(self, dt: datetime) -> datetime:
+                return self._tz.normalize(dt)
+
+    except ImportError as e:
+        raise ImportError(
+            "No timezone library available. Please install 'zoneinfo' or 'pytz' "
+            "for timezone support."
+        ) from e
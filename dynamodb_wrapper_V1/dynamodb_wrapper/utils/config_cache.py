@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from ..config import DynamoDBConfig
+
+
+class TTLCache:
+    """Small thread-safe mapping whose entries expire after ``ttl`` seconds.
+
+    Used as a read-aside cache for pipeline and table configuration, which
+    changes rarely but is looked up repeatedly by Spark jobs. When full, the
+    oldest inserted entry is evicted.
+    """
+
+    __slots__ = ('maxsize', 'ttl', '_data', '_lock')
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries to hold
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry if full."""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value, or default if not cached."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def evict(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Keyed on (endpoint_url, region_name, table_name, pipeline_id); see config_cache_key
+pipeline_config_cache = TTLCache(maxsize=1024, ttl=60.0)
+table_configs_cache = TTLCache(maxsize=1024, ttl=60.0)
+
+
+def config_cache_key(config: DynamoDBConfig, table_name: str, pipeline_id: str) -> Tuple[Any, ...]:
+    """Build the cache key for a pipeline's configuration read from table_name.
+
+    The resolved table name carries the table prefix and environment, and the
+    endpoint and region tell apart tables of the same name on different
+    DynamoDB instances (e.g. DynamoDB Local and AWS).
+
+    Args:
+        config: Configuration the pipeline configuration was read with
+        table_name: Resolved name of the table the configuration was read from
+        pipeline_id: Pipeline identifier
+    """
+    return (config.endpoint_url, config.region_name, table_name, pipeline_id)
+
+
+def invalidate_table_cache(config: DynamoDBConfig, table_name: str) -> None:
+    """Drop cached configuration read from a table.
+
+    Called by repositories after every write, so cached reads never outlive
+    a change made through this process.
+
+    Args:
+        config: Configuration of the repository that wrote to the table
+        table_name: Resolved name of the table that was written to
+    """
+    table = (config.endpoint_url, config.region_name, table_name)
+    for cache in (pipeline_config_cache, table_configs_cache):
+        cache.evict(lambda key: key[:3] == table)
+
+
+def invalidate_pipeline_cache(pipeline_id: str) -> None:
+    """Drop cached pipeline and table configuration for a pipeline.
+
+    Args:
+        pipeline_id: Pipeline identifier; entries for every endpoint, region
+            and table are dropped
+    """
+    for cache in (pipeline_config_cache, table_configs_cache):
+        cache.evict(lambda key: key[3] == pipeline_id)
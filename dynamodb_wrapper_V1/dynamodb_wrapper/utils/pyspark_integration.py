@@ -1,8 +1,9 @@
 import logging
 import uuid
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Union
 
 try:
     from pyspark.sql import SparkSession
@@ -20,6 +21,8 @@ from ..repositories import (
     PipelineRunLogsRepository,
     TableConfigRepository,
 )
+from .config_cache import config_cache_key, pipeline_config_cache, table_configs_cache
+from .stats_writer import StatsWriter
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,10 @@ class SparkDynamoDBIntegration:
         self.pipeline_repo = PipelineConfigRepository(config)
         self.table_repo = TableConfigRepository(config)
         self.logs_repo = PipelineRunLogsRepository(config)
+        # Writer of the innermost pipeline_run_context in the current thread or task
+        self._stats_writer: ContextVar[Optional[StatsWriter]] = ContextVar(
+            f"stats_writer_{id(self)}", default=None
+        )
 
     def get_spark_config_from_pipeline(self, pipeline_id: str) -> Dict[str, str]:
         """Get Spark configuration from pipeline configuration.
@@ -104,16 +111,16 @@ class SparkDynamoDBIntegration:
         logger.info(f"Created Spark session for pipeline {pipeline_id}")
         return spark
 
-    def get_table_read_options(self, table_id: str) -> Dict[str, Any]:
+    def get_table_read_options(self, table: Union[str, TableConfig]) -> Dict[str, Any]:
         """Get read options for a table from its configuration.
 
         Args:
-            table_id: Table identifier
+            table: Table identifier, or an already loaded TableConfig to skip the lookup
 
         Returns:
             Dictionary of read options for Spark
         """
-        table_config = self.table_repo.get_or_raise(table_id)
+        table_config = table if isinstance(table, TableConfig) else self.table_repo.get_or_raise(table)
 
         read_options = {
             "format": table_config.data_format.value,
@@ -130,16 +137,16 @@ class SparkDynamoDBIntegration:
 
         return read_options
 
-    def get_table_write_options(self, table_id: str) -> Dict[str, Any]:
+    def get_table_write_options(self, table: Union[str, TableConfig]) -> Dict[str, Any]:
         """Get write options for a table from its configuration.
 
         Args:
-            table_id: Table identifier
+            table: Table identifier, or an already loaded TableConfig to skip the lookup
 
         Returns:
             Dictionary of write options for Spark
         """
-        table_config = self.table_repo.get_or_raise(table_id)
+        table_config = table if isinstance(table, TableConfig) else self.table_repo.get_or_raise(table)
 
         write_options = {
             "format": table_config.data_format.value,
@@ -161,6 +168,12 @@ class SparkDynamoDBIntegration:
     def pipeline_run_context(self, pipeline_id: str, trigger_type: str = "manual", created_by: str = None):
         """Context manager for pipeline runs with automatic logging.
 
+        Table statistics reported through update_table_stats_after_write
+        inside the context are buffered by a StatsWriter and flushed before
+        the final run status is recorded. Each context gets its own writer,
+        with its own repositories for the background thread, so nested or
+        concurrent runs do not share one.
+
         Args:
             pipeline_id: Pipeline identifier
             trigger_type: What triggered the run
@@ -181,7 +194,16 @@ class SparkDynamoDBIntegration:
             self.logs_repo.update_run_status(run_id, RunStatus.RUNNING)
             logger.info(f"Started pipeline run {run_id} for pipeline {pipeline_id}")
 
-            yield run_id
+            stats_writer = StatsWriter(
+                TableConfigRepository(self.config),
+                PipelineRunLogsRepository(self.config)
+            )
+            token = self._stats_writer.set(stats_writer)
+            try:
+                yield run_id
+            finally:
+                self._stats_writer.reset(token)
+                stats_writer.flush_and_join()
 
             # If we get here, the pipeline completed successfully
             self.logs_repo.update_run_status(run_id, RunStatus.SUCCESS)
@@ -198,16 +220,32 @@ class SparkDynamoDBIntegration:
             logger.error(f"Pipeline run {run_id} failed: {error_message}")
             raise
 
-    def update_table_stats_after_write(self, table_id: str, df, run_id: str = None):
+    def update_table_stats_after_write(
+        self,
+        table_id: str,
+        df,
+        run_id: str = None,
+        record_count: Optional[int] = None
+    ):
         """Update table statistics after writing data.
 
+        Inside pipeline_run_context the update is queued on the run's
+        StatsWriter instead of being written immediately.
+
         Args:
             table_id: Table identifier
             df: Spark DataFrame that was written
             run_id: Optional run ID to update in logs
+            record_count: Row count of df if already known, to skip a count job
         """
         try:
-            record_count = df.count()
+            if record_count is None:
+                record_count = df.count()
+
+            stats_writer = self._stats_writer.get()
+            if stats_writer is not None:
+                stats_writer.submit(table_id, record_count, run_id=run_id)
+                return
 
             # Update table configuration with new stats
             self.table_repo.update_table_statistics(
@@ -238,6 +276,10 @@ class SparkDynamoDBIntegration:
 def get_pipeline_config_for_spark(pipeline_id: str, config: DynamoDBConfig = None) -> PipelineConfig:
     """Get pipeline configuration for Spark usage.
 
+    Results are cached in-process for a short TTL, keyed on pipeline ID and
+    the resolved table and endpoint, and dropped whenever a repository writes
+    to the pipeline config table. Callers get their own copy to modify.
+
     Args:
         pipeline_id: Pipeline identifier
         config: Optional DynamoDB config, uses environment if not provided
@@ -249,12 +291,21 @@ def get_pipeline_config_for_spark(pipeline_id: str, config: DynamoDBConfig = Non
         config = DynamoDBConfig.for_pyspark()
 
     repo = PipelineConfigRepository(config)
-    return repo.get_or_raise(pipeline_id)
+    cache_key = config_cache_key(config, repo.table_name, pipeline_id)
+    pipeline_config = pipeline_config_cache.get(cache_key)
+    if pipeline_config is None:
+        pipeline_config = repo.get_or_raise(pipeline_id)
+        pipeline_config_cache.set(cache_key, pipeline_config)
+    return pipeline_config.model_copy(deep=True)
 
 
 def get_table_configs_for_spark(pipeline_id: str, config: DynamoDBConfig = None) -> List[TableConfig]:
     """Get table configurations for a pipeline for Spark usage.
 
+    Results are cached in-process for a short TTL, keyed on pipeline ID and
+    the resolved table and endpoint, and dropped whenever a repository writes
+    to the table config table. Callers get their own copies to modify.
+
     Args:
         pipeline_id: Pipeline identifier
         config: Optional DynamoDB config, uses environment if not provided
@@ -266,7 +317,12 @@ def get_table_configs_for_spark(pipeline_id: str, config: DynamoDBConfig = None)
         config = DynamoDBConfig.for_pyspark()
 
     repo = TableConfigRepository(config)
-    return repo.get_active_tables_by_pipeline(pipeline_id)
+    cache_key = config_cache_key(config, repo.table_name, pipeline_id)
+    table_configs = table_configs_cache.get(cache_key)
+    if table_configs is None:
+        table_configs = repo.get_active_tables_by_pipeline(pipeline_id)
+        table_configs_cache.set(cache_key, table_configs)
+    return [table_config.model_copy(deep=True) for table_config in table_configs]
 
 
 def log_pipeline_run_from_spark(
@@ -0,0 +1,144 @@
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from ..repositories import PipelineRunLogsRepository, TableConfigRepository
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _StatsUpdate(NamedTuple):
+    table_id: str
+    record_count: int
+    last_updated_data: datetime
+    run_id: Optional[str]
+
+
+class StatsWriter:
+    """Buffer table statistics updates and write them from a background thread.
+
+    Updates are queued by :meth:`submit` and flushed once ``flush_every``
+    updates are pending or ``flush_interval_s`` seconds have passed since the
+    first pending one. Each flush coalesces the batch so every table gets one
+    statistics write with its latest record count, and every run log gets a
+    single read-modify-write with the combined output tables and record total.
+    """
+
+    def __init__(
+        self,
+        table_repo: "TableConfigRepository",
+        logs_repo: "PipelineRunLogsRepository",
+        flush_every: int = 25,
+        flush_interval_s: float = 1.0
+    ):
+        """Start the background writer thread.
+
+        Args:
+            table_repo: Repository used to write table statistics
+            logs_repo: Repository used to update run logs
+            flush_every: Number of pending updates that triggers a flush
+            flush_interval_s: Maximum seconds an update waits before a flush
+        """
+        self.table_repo = table_repo
+        self.logs_repo = logs_repo
+        self.flush_every = flush_every
+        self.flush_interval_s = flush_interval_s
+        self._queue: queue.Queue[object] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="dynamodb-stats-writer", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        table_id: str,
+        record_count: int,
+        run_id: Optional[str] = None,
+        last_updated_data: Optional[datetime] = None
+    ) -> None:
+        """Queue a statistics update for a table.
+
+        Args:
+            table_id: Table identifier
+            record_count: Number of records written to the table
+            run_id: Optional run ID whose log should record the write
+            last_updated_data: When data was written (default: now)
+        """
+        if last_updated_data is None:
+            last_updated_data = datetime.now(timezone.utc)
+        self._queue.put(_StatsUpdate(table_id, record_count, last_updated_data, run_id))
+
+    def flush_and_join(self, timeout: Optional[float] = None) -> None:
+        """Flush pending updates and stop the writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to finish
+        """
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        pending: List[_StatsUpdate] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                update = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                update = None
+
+            if update is _STOP:
+                if pending:
+                    self._flush(pending)
+                return
+
+            if update is not None:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval_s
+                pending.append(update)
+
+            if pending and (len(pending) >= self.flush_every or time.monotonic() >= deadline):
+                self._flush(pending)
+                pending = []
+
+    def _flush(self, updates: List[_StatsUpdate]) -> None:
+        latest_by_table: Dict[str, _StatsUpdate] = {}
+        runs: Dict[str, List[_StatsUpdate]] = {}
+        for update in updates:
+            latest_by_table[update.table_id] = update
+            if update.run_id:
+                runs.setdefault(update.run_id, []).append(update)
+
+        for table_id, update in latest_by_table.items():
+            try:
+                self.table_repo.update_table_statistics(
+                    table_id=table_id,
+                    record_count=update.record_count,
+                    last_updated_data=update.last_updated_data
+                )
+                logger.info(f"Updated stats for table {table_id}: {update.record_count} records")
+            except Exception as e:
+                logger.warning(f"Failed to update table stats for {table_id}: {e}")
+
+        for run_id, run_updates in runs.items():
+            try:
+                run_log = self.logs_repo.get(run_id)
+                if run_log is None:
+                    continue
+                if not run_log.output_tables:
+                    run_log.output_tables = []
+                for update in run_updates:
+                    if update.table_id not in run_log.output_tables:
+                        run_log.output_tables.append(update.table_id)
+                run_log.total_records_processed = (
+                    (run_log.total_records_processed or 0)
+                    + sum(update.record_count for update in run_updates)
+                )
+                self.logs_repo.update(run_log)
+            except Exception as e:
+                logger.warning(f"Failed to update run log {run_id} with table stats: {e}")
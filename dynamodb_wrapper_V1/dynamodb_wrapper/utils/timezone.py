@@ -2,49 +2,34 @@
 
 import os
 import sys
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Optional, Union
 
-# Import zoneinfo with fallback for older Python versions
-if sys.version_info >= (3, 9):
+try:
     from zoneinfo import ZoneInfo
-else:
-    try:
-        from backports.zoneinfo import ZoneInfo  # type: ignore
-    except ImportError:
-        try:
-            from zoneinfo import ZoneInfo  # type: ignore
-        except ImportError:
-            # Fallback to pytz if available
-            try:
-                import pytz
+except ImportError:  # Python < 3.9 - fallbacks are only imported when needed
+    from ._zoneinfo_fallback import ZoneInfo  # type: ignore
 
-                class ZoneInfo:  # type: ignore
-                    """Fallback ZoneInfo implementation using pytz."""
 
-                    def __init__(self, key: str):
-                        self.key = key
-                        self._tz = pytz.timezone(key)
+_UTC = timezone.utc
+_ZERO_OFFSET = timedelta(0)
 
-                    def __str__(self) -> str:
-                        return self.key
+# datetime.fromisoformat accepts a trailing 'Z' natively from Python 3.11
+_NEEDS_Z_FIXUP = sys.version_info < (3, 11)
 
-                    def localize(self, dt: datetime) -> datetime:
-                        return self._tz.localize(dt)
 
-                    def normalize(self, dt: datetime) -> datetime:
-                        return self._tz.normalize(dt)
-
-            except ImportError as e:
-                raise ImportError(
-                    "No timezone library available. Please install 'zoneinfo' or 'pytz' "
-                    "for timezone support."
-                ) from e
+@lru_cache(maxsize=64)
+def _get_zone(tz_string: str) -> ZoneInfo:
+    """Return a cached ZoneInfo for a timezone string."""
+    return ZoneInfo(tz_string)
 
 
 class TimezoneManager:
     """Manages timezone configuration and conversions for the DynamoDB wrapper."""
 
+    __slots__ = ('_default_timezone', '_default_zone')
+
     def __init__(self, default_timezone: Optional[str] = None):
         """Initialize timezone manager.
 
@@ -54,6 +39,17 @@ class TimezoneManager:
         """
         self.default_timezone = self._resolve_timezone(default_timezone)
 
+    @property
+    def default_timezone(self) -> str:
+        """Default timezone string used for naive datetimes."""
+        return self._default_timezone
+
+    @default_timezone.setter
+    def default_timezone(self, tz_string: str) -> None:
+        # Keep the resolved zone in step with the string
+        self._default_zone = _get_zone(tz_string)
+        self._default_timezone = tz_string
+
     def _resolve_timezone(self, tz_string: Optional[str]) -> str:
         """Resolve timezone string from parameter, environment, or default."""
         if tz_string:
@@ -80,8 +76,9 @@ class TimezoneManager:
         Returns:
             ZoneInfo object for the timezone
         """
-        tz_string = tz_override or self.default_timezone
-        return ZoneInfo(tz_string)
+        if not tz_override:
+            return self._default_zone
+        return _get_zone(tz_override)
 
     def now(self, tz_override: Optional[str] = None) -> datetime:
         """Get current datetime in specified timezone.
@@ -120,8 +117,10 @@ class TimezoneManager:
 
         # If datetime is naive, assume it's in the default timezone
         if dt.tzinfo is None:
-            source_zone = self.get_timezone()
-            dt = dt.replace(tzinfo=source_zone)
+            dt = dt.replace(tzinfo=self._default_zone)
+
+        if dt.tzinfo is target_zone:
+            return dt
 
         return dt.astimezone(target_zone)
 
@@ -137,6 +136,13 @@ class TimezoneManager:
         if dt is None:
             return None
 
+        if dt.tzinfo is _UTC:
+            return dt
+
+        if dt.tzinfo is not None and dt.utcoffset() == _ZERO_OFFSET:
+            # Zero-offset zone - relabel instead of converting
+            return dt.replace(tzinfo=_UTC)
+
         return self.to_timezone(dt, "UTC")
 
     def ensure_timezone(
@@ -158,7 +164,7 @@ class TimezoneManager:
 
         if dt.tzinfo is None:
             # Naive datetime - add timezone
-            tz = self.get_timezone(assumed_tz)
+            tz = self._default_zone if assumed_tz is None else self.get_timezone(assumed_tz)
             return dt.replace(tzinfo=tz)
 
         return dt
@@ -175,8 +181,9 @@ class TimezoneManager:
         if dt is None:
             return None
 
-        # Ensure timezone-aware
-        dt = self.ensure_timezone(dt)
+        # Ensure timezone-aware, attaching the default zone to naive values
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=self._default_zone)
         return dt.isoformat()
 
     def parse_iso(
@@ -197,7 +204,7 @@ class TimezoneManager:
             return None
 
         # Parse ISO string
-        dt = datetime.fromisoformat(iso_string.replace('Z', '+00:00'))
+        dt = parse_iso_datetime(iso_string)
 
         # Convert to target timezone if specified
         if target_tz:
@@ -225,6 +232,55 @@ class TimezoneManager:
         return self.to_timezone(utc_dt, user_tz)
 
 
+def ensure_utc_for_storage(dt: datetime, default_tz: Union[tzinfo, str] = "UTC") -> datetime:
+    """Return a timezone-aware UTC datetime ready to be stored.
+
+    Naive datetimes are taken to be in ``default_tz``. Pass a pre-resolved
+    ``tzinfo`` on hot paths; strings are resolved through the zone cache.
+    Values already in ``timezone.utc`` are returned unchanged.
+    """
+    if dt is None:
+        return None
+    tz = dt.tzinfo
+    if tz is None:
+        tz = default_tz if isinstance(default_tz, tzinfo) else resolve_timezone(default_tz)
+        dt = dt.replace(tzinfo=tz)
+    return dt if tz is _UTC else dt.astimezone(_UTC)
+
+
+def parse_iso_datetime(iso_string: str) -> datetime:
+    """Parse an ISO 8601 string, accepting a trailing 'Z' for UTC.
+
+    The string is only rewritten on Python versions whose ``fromisoformat``
+    does not understand 'Z', and only when it actually ends with one.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 datetime
+    """
+    if _NEEDS_Z_FIXUP and iso_string.endswith('Z'):
+        iso_string = iso_string[:-1] + '+00:00'
+    return datetime.fromisoformat(iso_string)
+
+
+@lru_cache(maxsize=64)
+def resolve_timezone(tz_string: str) -> tzinfo:
+    """Resolve a timezone string to a tzinfo, using the ``timezone.utc`` singleton for UTC.
+
+    Results are cached per string, so callers can resolve on every access
+    and still pass the tzinfo to hot-path helpers such as
+    ``ensure_timezone_aware``.
+
+    Args:
+        tz_string: Timezone string (e.g., 'UTC', 'America/New_York')
+
+    Returns:
+        tzinfo object for the timezone
+    """
+    if tz_string == "UTC":
+        return _UTC
+    return _get_zone(tz_string)
+
+
 # Global timezone manager instance
 _global_tz_manager: Optional[TimezoneManager] = None
 
@@ -260,26 +316,49 @@ def configure_timezone_from_config(config) -> TimezoneManager:
 
 
 # Convenience functions
+#
+# These only defer to the global manager when its default timezone matters
+# (naive datetimes or no explicit timezone); aware datetimes are converted
+# directly.
 def now_in_tz(tz: Optional[str] = None) -> datetime:
     """Get current datetime in specified timezone."""
-    return get_timezone_manager().now(tz)
+    if tz:
+        return datetime.now(_get_zone(tz))
+    return get_timezone_manager().now()
 
 
 def utcnow() -> datetime:
     """Get current UTC datetime."""
-    return get_timezone_manager().utcnow()
+    return datetime.now(_UTC)
 
 
 def to_user_timezone(dt: datetime, user_tz: Optional[str] = None) -> datetime:
     """Convert datetime to user's timezone."""
+    if dt is not None and user_tz and dt.tzinfo is not None:
+        return dt.astimezone(_get_zone(user_tz))
     return get_timezone_manager().to_timezone(dt, user_tz)
 
 
 def to_utc(dt: datetime) -> datetime:
     """Convert datetime to UTC."""
+    if dt is None:
+        return None
+    tz = dt.tzinfo
+    if tz is _UTC:
+        return dt
+    if tz is not None:
+        return dt.astimezone(_UTC)
     return get_timezone_manager().to_utc(dt)
 
 
-def ensure_timezone_aware(dt: datetime, assumed_tz: Optional[str] = None) -> datetime:
-    """Ensure datetime is timezone-aware."""
+def ensure_timezone_aware(dt: datetime, assumed_tz: Optional[Union[tzinfo, str]] = None) -> datetime:
+    """Ensure datetime is timezone-aware.
+
+    A pre-resolved ``tzinfo`` is attached directly to naive datetimes; a string
+    or None is resolved through the global timezone manager.
+    """
+    if dt is None or dt.tzinfo is not None:
+        return dt
+    if isinstance(assumed_tz, tzinfo):
+        return dt.replace(tzinfo=assumed_tz)
     return get_timezone_manager().ensure_timezone(dt, assumed_tz)
@@ -4,25 +4,40 @@ Basic usage examples for the DynamoDB wrapper library.
 
 This example demonstrates:
 1. Setting up configuration
-2. Creating and managing pipeline configurations
-3. Creating and managing table configurations
-4. Creating and tracking pipeline run logs
+2. Creating a pipeline, its tables and a run log in one batch write
+3. Managing pipeline and table configurations
+4. Tracking pipeline run logs
 5. Basic CRUD operations
 """
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from decimal import Decimal
 
 from dynamodb_wrapper_V1.dynamodb_wrapper import (
     DynamoDBConfig,
+    PipelineConfig,
     PipelineConfigRepository,
+    PipelineRunLog,
     PipelineRunLogsRepository,
+    RepositoryContainer,
+    TableConfig,
     TableConfigRepository,
 )
+from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import batch_create_models, batch_get_models
 from dynamodb_wrapper_V1.dynamodb_wrapper.models.pipeline_run_log import RunStatus
 from dynamodb_wrapper_V1.dynamodb_wrapper.models.table_config import DataFormat, TableType
 
 
+def bootstrap_pipeline(pipeline_repo, table_repo, logs_repo, pipeline, tables, run_log):
+    """Write a pipeline, its tables and its first run log in a single BatchWriteItem."""
+    return batch_create_models(
+        [(pipeline_repo, pipeline)]
+        + [(table_repo, table) for table in tables]
+        + [(logs_repo, run_log)]
+    )
+
+
 def main():
     """Demonstrate basic usage of the DynamoDB wrapper."""
 
@@ -35,13 +50,14 @@ def main():
 
     # 2. Initialize repositories
     print("2. Initializing repositories...")
-    pipeline_repo = PipelineConfigRepository(config)
-    table_repo = TableConfigRepository(config)
-    logs_repo = PipelineRunLogsRepository(config)
-
-    # 3. Create a pipeline configuration
-    print("3. Creating pipeline configuration...")
-    pipeline_config = pipeline_repo.create_pipeline_config(
+    repos = RepositoryContainer(config)  # One boto3 resource for all three
+    pipeline_repo = repos.pipelines
+    table_repo = repos.tables
+    logs_repo = repos.run_logs
+
+    # 3. Build a pipeline configuration
+    print("3. Building pipeline configuration...")
+    pipeline_config = PipelineConfig(
         pipeline_id="sales-analytics-pipeline",
         pipeline_name="Sales Analytics Pipeline",
         description="Daily sales data processing pipeline",
@@ -58,15 +74,15 @@ def main():
         tags={"team": "analytics", "project": "sales"},
         created_by="data_engineer"
     )
-    print(f"Created pipeline: {pipeline_config.pipeline_id}")
+    pipeline_id = pipeline_config.pipeline_id
 
-    # 4. Create table configurations
-    print("4. Creating table configurations...")
+    # 4. Build table configurations
+    print("4. Building table configurations...")
 
     # Source table configuration
-    source_table = table_repo.create_table_config(
+    source_table = TableConfig(
         table_id="sales-raw-data",
-        pipeline_id=pipeline_config.pipeline_id,
+        pipeline_id=pipeline_id,
         table_name="sales_raw",
         table_type=TableType.SOURCE,
         data_format=DataFormat.JSON,
@@ -87,9 +103,9 @@ def main():
     )
 
     # Destination table configuration
-    dest_table = table_repo.create_table_config(
+    dest_table = TableConfig(
         table_id="sales-processed-data",
-        pipeline_id=pipeline_config.pipeline_id,
+        pipeline_id=pipeline_id,
         table_name="sales_processed",
         table_type=TableType.DESTINATION,
         data_format=DataFormat.PARQUET,
@@ -100,17 +116,22 @@ def main():
         }
     )
 
-    print(f"Created source table: {source_table.table_id}")
-    print(f"Created destination table: {dest_table.table_id}")
-
-    # 5. Create a pipeline run log
-    print("5. Creating pipeline run log...")
-    run_log = logs_repo.create_run_log(
+    # 5. Build a pipeline run log and write everything in one BatchWriteItem
+    print("5. Creating pipeline, tables and run log in one batch...")
+    run_log = PipelineRunLog(
         run_id="run-20241210-001",
-        pipeline_id=pipeline_config.pipeline_id,
+        pipeline_id=pipeline_id,
         trigger_type="schedule",
+        status=RunStatus.PENDING,
         created_by="scheduler"
     )
+    bootstrap_pipeline(
+        pipeline_repo, table_repo, logs_repo,
+        pipeline_config, [source_table, dest_table], run_log
+    )
+    print(f"Created pipeline: {pipeline_id}")
+    print(f"Created source table: {source_table.table_id}")
+    print(f"Created destination table: {dest_table.table_id}")
     print(f"Created run log: {run_log.run_id}")
 
     # 6. Update run status as pipeline progresses
@@ -119,40 +140,64 @@ def main():
     # Start the run
     logs_repo.update_run_status(run_log.run_id, RunStatus.RUNNING)
 
-    # Simulate pipeline completion
-    end_time = datetime.now()
+    # Simulate pipeline completion; one timestamp serves the rest of the run
+    now = datetime.now(timezone.utc)
     logs_repo.update_run_status(
         run_log.run_id,
         RunStatus.SUCCESS,
-        end_time=end_time
+        end_time=now
     )
     print("Pipeline run completed successfully")
 
     # 7. Query examples
     print("7. Querying data...")
 
-    # Get pipeline configuration
-    retrieved_pipeline = pipeline_repo.get_by_pipeline_id(pipeline_config.pipeline_id)
+    # Fetch the pipeline and both of its tables by key in one BatchGetItem;
+    # config metadata tolerates eventual consistency, which costs half the read units
+    retrieved_pipeline, retrieved_source, retrieved_dest = batch_get_models(
+        [
+            (pipeline_repo, pipeline_id),
+            (table_repo, source_table.table_id),
+            (table_repo, dest_table.table_id),
+        ],
+        consistent=False
+    )
     print(f"Retrieved pipeline: {retrieved_pipeline.pipeline_name}")
+    print(f"Retrieved tables: {retrieved_source.table_name}, {retrieved_dest.table_name}")
+
+    # The remaining reads are independent, so issue them concurrently. boto3
+    # resources are not thread-safe, so each thread gets its own repository;
+    # they all share the config's client and connection pool
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        active_future = pool.submit(
+            lambda: PipelineConfigRepository(config).get_active_pipelines(consistent=False)
+        )
+        tables_future = pool.submit(
+            lambda: TableConfigRepository(config).get_tables_by_pipeline(pipeline_id)
+        )
+        # Only the number of runs is printed, so count them server-side
+        runs_future = pool.submit(
+            lambda: PipelineRunLogsRepository(config).count_runs_by_pipeline(pipeline_id)
+        )
 
     # Get all active pipelines
-    active_pipelines = pipeline_repo.get_active_pipelines()
+    active_pipelines = active_future.result()
     print(f"Active pipelines: {len(active_pipelines)}")
 
     # Get tables for pipeline
-    pipeline_tables = table_repo.get_tables_by_pipeline(pipeline_config.pipeline_id)
+    pipeline_tables = tables_future.result()
     print(f"Tables for pipeline: {len(pipeline_tables)}")
 
-    # Get recent runs
-    recent_runs = logs_repo.get_runs_by_pipeline(pipeline_config.pipeline_id, limit=10)
-    print(f"Recent runs: {len(recent_runs)}")
+    # Count runs for pipeline
+    run_count = runs_future.result()
+    print(f"Runs for pipeline: {run_count}")
 
     # 8. Update examples
     print("8. Updating configurations...")
 
     # Update pipeline status
     pipeline_repo.update_pipeline_status(
-        pipeline_config.pipeline_id,
+        pipeline_id,
         is_active=False,
         updated_by="admin"
     )
@@ -163,7 +208,7 @@ def main():
         source_table.table_id,
         record_count=10000,
         size_bytes=5000000,
-        last_updated_data=datetime.now()
+        last_updated_data=now
     )
     print("Table statistics updated")
 
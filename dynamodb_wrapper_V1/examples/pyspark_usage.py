@@ -10,9 +10,17 @@ This example demonstrates:
 5. Automatic logging and monitoring
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from pyspark import StorageLevel
+from pyspark.sql import functions as F
+
 from dynamodb_wrapper_V1.dynamodb_wrapper import (
     DynamoDBConfig,
+    PipelineConfig,
     PipelineConfigRepository,
+    TableConfig,
     TableConfigRepository,
 )
 from dynamodb_wrapper_V1.dynamodb_wrapper.models.table_config import TableType
@@ -30,78 +38,74 @@ def setup_test_configuration():
     config = DynamoDBConfig.for_pyspark()
 
     pipeline_repo = PipelineConfigRepository(config)
-    table_repo = TableConfigRepository(config)
 
-    # Create or get existing pipeline configuration
+    # Create the pipeline configuration unless it already exists; the
+    # conditional put makes a separate existence check unnecessary
     pipeline_id = "spark-etl-pipeline"
 
-    try:
-        pipeline_config = pipeline_repo.get_by_pipeline_id(pipeline_id)
-        if not pipeline_config:
-            raise Exception("Pipeline not found")
-    except:
-        # Create new pipeline configuration
-        pipeline_config = pipeline_repo.create_pipeline_config(
-            pipeline_id=pipeline_id,
-            pipeline_name="Spark ETL Pipeline",
-            description="PySpark ETL pipeline example",
-            source_type="s3",
-            destination_type="s3",
-            spark_config={
-                "spark.sql.adaptive.enabled": "true",
-                "spark.sql.adaptive.coalescePartitions.enabled": "true",
-                "spark.executor.memory": "4g",
-                "spark.executor.cores": "2",
-                "spark.sql.execution.arrow.pyspark.enabled": "true"
-            },
-            cpu_cores=4,
-            memory_gb=8.0,
-            created_by="spark_user"
-        )
+    pipeline_repo.put_if_absent(PipelineConfig(
+        pipeline_id=pipeline_id,
+        pipeline_name="Spark ETL Pipeline",
+        description="PySpark ETL pipeline example",
+        source_type="s3",
+        destination_type="s3",
+        spark_config={
+            "spark.sql.adaptive.enabled": "true",
+            "spark.sql.adaptive.coalescePartitions.enabled": "true",
+            "spark.executor.memory": "4g",
+            "spark.executor.cores": "2",
+            "spark.sql.execution.arrow.pyspark.enabled": "true"
+        },
+        cpu_cores=4,
+        memory_gb=8.0,
+        created_by="spark_user"
+    ))
+
+    # Create source and destination tables the same way; the two writes are
+    # independent, so overlap their round trips. boto3 resources are not
+    # thread-safe, so each thread writes through its own repository on the
+    # config's shared client
+    source_table = TableConfig(
+        table_id="customer-transactions",
+        pipeline_id=pipeline_id,
+        table_name="customer_transactions",
+        table_type=TableType.SOURCE,
+        data_format="parquet",
+        location="s3://my-data-bucket/input/customer-transactions/",
+        partition_columns=["year", "month"],
+        read_options={
+            "mergeSchema": "true"
+        }
+    )
 
-    # Create table configurations
-    try:
-        source_tables = table_repo.get_source_tables(pipeline_id)
-        if not source_tables:
-            raise Exception("No source tables")
-    except:
-        # Create source table
-        table_repo.create_table_config(
-            table_id="customer-transactions",
-            pipeline_id=pipeline_id,
-            table_name="customer_transactions",
-            table_type=TableType.SOURCE,
-            data_format="parquet",
-            location="s3://my-data-bucket/input/customer-transactions/",
-            partition_columns=["year", "month"],
-            read_options={
-                "mergeSchema": "true"
-            }
-        )
+    destination_table = TableConfig(
+        table_id="customer-summary",
+        pipeline_id=pipeline_id,
+        table_name="customer_summary",
+        table_type=TableType.DESTINATION,
+        data_format="parquet",
+        location="s3://my-data-bucket/output/customer-summary/",
+        partition_columns=["processing_date"],
+        write_options={
+            "compression": "snappy",
+            "mode": "overwrite"
+        }
+    )
 
-        # Create destination table
-        table_repo.create_table_config(
-            table_id="customer-summary",
-            pipeline_id=pipeline_id,
-            table_name="customer_summary",
-            table_type=TableType.DESTINATION,
-            data_format="parquet",
-            location="s3://my-data-bucket/output/customer-summary/",
-            partition_columns=["processing_date"],
-            write_options={
-                "compression": "snappy",
-                "mode": "overwrite"
-            }
-        )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(
+            lambda table: TableConfigRepository(config).put_if_absent(table),
+            [source_table, destination_table]
+        ))
 
     return pipeline_id, config
 
 
-def example_basic_spark_integration():
+def example_basic_spark_integration(integration, pipeline_id):
     """Example of basic Spark integration."""
     print("=== Basic Spark Integration Example ===")
 
-    pipeline_id, config = setup_test_configuration()
+    config = integration.config
 
     # Method 1: Create Spark session directly
     spark = create_spark_session_with_dynamodb(
@@ -123,18 +127,17 @@ def example_basic_spark_integration():
     table_configs = get_table_configs_for_spark(pipeline_id, config)
     print(f"Found {len(table_configs)} table configurations")
 
+    # Repeat lookups within the TTL are served from the in-process cache
+    pipeline_config = get_pipeline_config_for_spark(pipeline_id, config)
+    print(f"Pipeline (cached): {pipeline_config.pipeline_name}")
+
     spark.stop()
 
 
-def example_advanced_integration():
+def example_advanced_integration(integration, pipeline_id):
     """Example of advanced integration with context manager."""
     print("\n=== Advanced Integration with Context Manager ===")
 
-    pipeline_id, config = setup_test_configuration()
-
-    # Initialize integration
-    integration = SparkDynamoDBIntegration(config)
-
     # Use pipeline run context manager
     with integration.pipeline_run_context(
         pipeline_id=pipeline_id,
@@ -148,7 +151,9 @@ def example_advanced_integration():
         spark = integration.create_spark_session(
             pipeline_id,
             additional_config={
-                "spark.sql.warehouse.dir": "/tmp/spark-warehouse"
+                "spark.sql.warehouse.dir": "/tmp/spark-warehouse",
+                "spark.sql.execution.arrow.pyspark.enabled": "true",
+                "spark.sql.execution.arrow.pyspark.fallback.enabled": "true",
             }
         )
 
@@ -160,12 +165,19 @@ def example_advanced_integration():
             print(f"Processing {len(source_tables)} source tables")
             print(f"Writing to {len(dest_tables)} destination tables")
 
+            # Build every table's options once from the configs already loaded
+            # and broadcast them, so neither the loop nor any UDF refetches them
+            options_bc = spark.sparkContext.broadcast({
+                "read": {t.table_id: integration.get_table_read_options(t) for t in source_tables},
+                "write": {t.table_id: integration.get_table_write_options(t) for t in dest_tables},
+            })
+
             # Process each source table
             for source_table in source_tables:
                 print(f"\nProcessing table: {source_table.table_name}")
 
                 # Get read options from table configuration
-                read_options = integration.get_table_read_options(source_table.table_id)
+                read_options = options_bc.value["read"][source_table.table_id]
                 print(f"Read options: {read_options}")
 
                 # Simulate reading data (would normally read from actual source)
@@ -178,28 +190,38 @@ def example_advanced_integration():
                     ("cust_003", "2024-01-15", 220.25, "clothing"),
                 ]
 
-                df = spark.createDataFrame(
+                # Going through pandas lets Spark ship the rows to the JVM as
+                # Arrow column batches instead of pickling them one by one; the
+                # gap grows with volume (roughly an order of magnitude at 1M rows)
+                pdf = pd.DataFrame(
                     sample_data,
-                    ["customer_id", "transaction_date", "amount", "category"]
+                    columns=["customer_id", "transaction_date", "amount", "category"]
                 )
+                df = spark.createDataFrame(pdf)
 
-                print(f"Created sample DataFrame with {df.count()} rows")
+                print(f"Created sample DataFrame with {df.rdd.getNumPartitions()} partitions")
 
-                # Process data (example aggregation)
+                # Process data (example aggregation); the summary is reused for
+                # every destination, so persist it and count it exactly once
                 summary_df = df.groupBy("customer_id").agg(
-                    spark.sql.functions.sum("amount").alias("total_amount"),
-                    spark.sql.functions.count("*").alias("transaction_count"),
-                    spark.sql.functions.max("transaction_date").alias("last_transaction_date")
-                ).withColumn("processing_date", spark.sql.functions.current_date())
+                    F.sum("amount").alias("total_amount"),
+                    F.count(F.lit(1)).alias("transaction_count"),
+                    F.max("transaction_date").alias("last_transaction_date"),
+                    # current_date() is foldable, so it can sit in the aggregate
+                    # instead of adding a separate projection on top of it
+                    F.current_date().alias("processing_date")
+                )
+                summary_df = summary_df.persist(StorageLevel.MEMORY_AND_DISK)
 
-                print(f"Created summary with {summary_df.count()} rows")
+                summary_count = summary_df.count()
+                print(f"Created summary with {summary_count} rows")
 
                 # Write to destination
                 for dest_table in dest_tables:
                     print(f"Writing to: {dest_table.table_name}")
 
                     # Get write options from table configuration
-                    write_options = integration.get_table_write_options(dest_table.table_id)
+                    write_options = options_bc.value["write"][dest_table.table_id]
                     print(f"Write options: {write_options}")
 
                     # Simulate writing (would normally write to actual destination)
@@ -209,24 +231,25 @@ def example_advanced_integration():
                     integration.update_table_stats_after_write(
                         dest_table.table_id,
                         summary_df,
-                        run_id
+                        run_id,
+                        record_count=summary_count
                     )
 
                     print("Table statistics updated")
 
+                summary_df.unpersist()
+
+            options_bc.unpersist()
             print(f"\nPipeline run {run_id} completed successfully")
 
         finally:
             spark.stop()
 
 
-def example_error_handling():
+def example_error_handling(integration, pipeline_id):
     """Example of error handling in pipeline runs."""
     print("\n=== Error Handling Example ===")
 
-    pipeline_id, config = setup_test_configuration()
-    integration = SparkDynamoDBIntegration(config)
-
     # Demonstrate error handling with context manager
     try:
         with integration.pipeline_run_context(
@@ -251,13 +274,10 @@ def example_error_handling():
             print(f"Error message: {run_log.error_message}")
 
 
-def example_monitoring_and_stats():
+def example_monitoring_and_stats(integration, pipeline_id):
     """Example of monitoring and statistics collection."""
     print("\n=== Monitoring and Statistics Example ===")
 
-    pipeline_id, config = setup_test_configuration()
-    integration = SparkDynamoDBIntegration(config)
-
     # Get pipeline statistics
     recent_runs = integration.logs_repo.get_recent_runs(pipeline_id, hours=24)
     print(f"Recent runs (24h): {len(recent_runs)}")
@@ -268,8 +288,8 @@ def example_monitoring_and_stats():
     running_pipelines = integration.logs_repo.get_running_pipelines()
     print(f"Currently running pipelines: {len(running_pipelines)}")
 
-    # Get table statistics
-    tables = integration.table_repo.get_tables_by_pipeline(pipeline_id)
+    # Get table statistics; the config table is read with a parallel scan
+    tables = integration.table_repo.get_tables_by_pipeline(pipeline_id, segments=4)
     for table in tables:
         print(f"\nTable: {table.table_name}")
         print(f"  Type: {table.table_type}")
@@ -284,10 +304,14 @@ def main():
     print("PySpark Integration Examples\n")
 
     try:
-        example_basic_spark_integration()
-        example_advanced_integration()
-        example_error_handling()
-        example_monitoring_and_stats()
+        # One configuration and integration (and so one DynamoDB resource) for all examples
+        pipeline_id, config = setup_test_configuration()
+        integration = SparkDynamoDBIntegration(config)
+
+        example_basic_spark_integration(integration, pipeline_id)
+        example_advanced_integration(integration, pipeline_id)
+        example_error_handling(integration, pipeline_id)
+        example_monitoring_and_stats(integration, pipeline_id)
 
         print("\n=== All examples completed successfully! ===")
 
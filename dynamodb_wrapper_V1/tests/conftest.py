@@ -4,21 +4,26 @@ from pathlib import Path
 # Add parent directory to path so we can import dynamodb_wrapper_V1
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import boto3
 import pytest
-from moto import mock_aws
 
-from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
-from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
-    PipelineConfigRepository,
-    PipelineRunLogsRepository,
-    TableConfigRepository,
-)
+# boto3, moto and the wrapper package are imported inside the fixtures that
+# use them, so runs that never request a DynamoDB fixture don't pay for them.
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_clients():
+    """Drop DynamoDB clients shared through the config so tests don't reuse each other's."""
+    yield
+    config_module = sys.modules.get("dynamodb_wrapper_V1.dynamodb_wrapper.config.config")
+    if config_module is not None:
+        config_module._shared_resources.clear()
 
 
 @pytest.fixture
 def dynamodb_config():
     """DynamoDB configuration for testing."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
+
     return DynamoDBConfig(
         aws_access_key_id="test_key",
         aws_secret_access_key="test_secret",
@@ -31,6 +36,8 @@ def dynamodb_config():
 @pytest.fixture
 def mock_dynamodb_config():
     """DynamoDB configuration for mocked testing."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
+
     return DynamoDBConfig(
         aws_access_key_id="test_key",
         aws_secret_access_key="test_secret",
@@ -40,16 +47,55 @@ def mock_dynamodb_config():
     )
 
 
-@pytest.fixture
-def mock_dynamodb_resource():
-    """Mock DynamoDB resource."""
+@pytest.fixture(scope="session")
+def _boto_session():
+    """One boto3 session for every test resource, so service models load once."""
+    # moto must be imported before the session is built: it installs its
+    # botocore hooks at import and sessions only pick up hooks present then.
+    import boto3
+    import moto  # noqa: F401
+
+    return boto3.Session(
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1"
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_dynamodb_resource(_boto_session):
+    """Mock DynamoDB resource shared by every test in a module.
+
+    The moto mock stays active until the module finishes, so tables are
+    created once per module and emptied between tests instead.
+    """
+    from moto import mock_aws
+
     with mock_aws():
-        yield boto3.resource('dynamodb', region_name='us-east-1')
+        yield _boto_session.resource('dynamodb')
+
+
+def _truncate_table(table):
+    """Delete every item from a table, leaving its schema in place."""
+    key_names = [key['AttributeName'] for key in table.key_schema]
+    projection = ', '.join(f'#k{i}' for i in range(len(key_names)))
+    names = {f'#k{i}': name for i, name in enumerate(key_names)}
+    scan_kwargs = {'ProjectionExpression': projection, 'ExpressionAttributeNames': names}
+
+    with table.batch_writer() as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            for key in response.get('Items', []):
+                batch.delete_item(Key=key)
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    return table
 
 
-@pytest.fixture
-def pipeline_config_table(mock_dynamodb_resource):
-    """Create pipeline_config table for testing."""
+@pytest.fixture(scope="module")
+def _module_pipeline_config_table(mock_dynamodb_resource):
+    """Create pipeline_config table once per module."""
     table = mock_dynamodb_resource.create_table(
         TableName='pipeline_config',
         KeySchema=[
@@ -64,8 +110,14 @@ def pipeline_config_table(mock_dynamodb_resource):
 
 
 @pytest.fixture
-def table_config_table(mock_dynamodb_resource):
-    """Create table_config table for testing."""
+def pipeline_config_table(_module_pipeline_config_table):
+    """Empty pipeline_config table for testing."""
+    return _truncate_table(_module_pipeline_config_table)
+
+
+@pytest.fixture(scope="module")
+def _module_table_config_table(mock_dynamodb_resource):
+    """Create table_config table once per module."""
     table = mock_dynamodb_resource.create_table(
         TableName='table_config',
         KeySchema=[
@@ -80,8 +132,14 @@ def table_config_table(mock_dynamodb_resource):
 
 
 @pytest.fixture
-def pipeline_run_logs_table(mock_dynamodb_resource):
-    """Create pipeline_run_logs table for testing."""
+def table_config_table(_module_table_config_table):
+    """Empty table_config table for testing."""
+    return _truncate_table(_module_table_config_table)
+
+
+@pytest.fixture(scope="module")
+def _module_pipeline_run_logs_table(mock_dynamodb_resource):
+    """Create pipeline_run_logs table once per module."""
     table = mock_dynamodb_resource.create_table(
         TableName='pipeline_run_logs',
         KeySchema=[
@@ -96,8 +154,14 @@ def pipeline_run_logs_table(mock_dynamodb_resource):
 
 
 @pytest.fixture
-def test_table(mock_dynamodb_resource):
-    """Create a generic test table for base repository testing."""
+def pipeline_run_logs_table(_module_pipeline_run_logs_table):
+    """Empty pipeline_run_logs table for testing."""
+    return _truncate_table(_module_pipeline_run_logs_table)
+
+
+@pytest.fixture(scope="module")
+def _module_test_table(mock_dynamodb_resource):
+    """Create a generic test table once per module."""
     table = mock_dynamodb_resource.create_table(
         TableName='dev_test_table',
         KeySchema=[
@@ -111,6 +175,12 @@ def test_table(mock_dynamodb_resource):
     return table
 
 
+@pytest.fixture
+def test_table(_module_test_table):
+    """Empty generic test table for base repository testing."""
+    return _truncate_table(_module_test_table)
+
+
 @pytest.fixture
 def all_tables(pipeline_config_table, table_config_table, pipeline_run_logs_table, test_table):
     """Create all DynamoDB tables needed for comprehensive testing."""
@@ -125,34 +195,54 @@ def all_tables(pipeline_config_table, table_config_table, pipeline_run_logs_tabl
 @pytest.fixture
 def pipeline_repo(dynamodb_config):
     """Pipeline configuration repository."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
+        PipelineConfigRepository,
+    )
+
     return PipelineConfigRepository(dynamodb_config)
 
 
 @pytest.fixture
 def table_repo(dynamodb_config):
     """Table configuration repository."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import TableConfigRepository
+
     return TableConfigRepository(dynamodb_config)
 
 
 @pytest.fixture
 def logs_repo(dynamodb_config):
     """Pipeline run logs repository."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
+        PipelineRunLogsRepository,
+    )
+
     return PipelineRunLogsRepository(dynamodb_config)
 
 
 @pytest.fixture
 def mock_pipeline_repo(mock_dynamodb_config):
     """Mock pipeline configuration repository."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
+        PipelineConfigRepository,
+    )
+
     return PipelineConfigRepository(mock_dynamodb_config)
 
 
 @pytest.fixture
 def mock_table_repo(mock_dynamodb_config):
     """Mock table configuration repository."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import TableConfigRepository
+
     return TableConfigRepository(mock_dynamodb_config)
 
 
 @pytest.fixture
 def mock_logs_repo(mock_dynamodb_config):
     """Mock pipeline run logs repository."""
+    from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
+        PipelineRunLogsRepository,
+    )
+
     return PipelineRunLogsRepository(mock_dynamodb_config)
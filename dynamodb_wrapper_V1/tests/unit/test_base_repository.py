@@ -1,8 +1,9 @@
+import json
+from datetime import timezone
 from typing import Optional
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
-from moto import mock_aws
 
 from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
 from dynamodb_wrapper_V1.dynamodb_wrapper.exceptions import (
@@ -11,7 +12,11 @@ from dynamodb_wrapper_V1.dynamodb_wrapper.exceptions import (
     ValidationError,
 )
 from dynamodb_wrapper_V1.dynamodb_wrapper.models import PipelineConfig
-from dynamodb_wrapper_V1.dynamodb_wrapper.repositories.base import BaseDynamoRepository
+from dynamodb_wrapper_V1.dynamodb_wrapper.repositories.base import (
+    BaseDynamoRepository,
+    _FastJSONAdapter,
+    batch_get_models,
+)
 
 
 class _TestRepository(BaseDynamoRepository[PipelineConfig]):
@@ -74,7 +79,6 @@ class TestBaseDynamoRepository:
         assert repository.primary_key == "pipeline_id"
         assert repository.sort_key is None
 
-    @mock_aws 
     def test_create_table_resource(self, repository, test_table):
         """Test DynamoDB table resource creation."""
         # Access table property to initialize it
@@ -91,6 +95,15 @@ class TestBaseDynamoRepository:
         assert item["source_type"] == "s3"
         assert item["destination_type"] == "redshift"
 
+    def test_default_tz_follows_config(self, repository):
+        """Test default timezone is resolved from the current config value."""
+        assert repository.default_tz is timezone.utc
+
+        repository.config.default_timezone = "America/New_York"
+
+        assert repository.default_tz.key == "America/New_York"
+        assert repository.default_tz is repository.default_tz
+
     def test_item_to_model_conversion(self, repository):
         """Test converting DynamoDB item to Pydantic model."""
         item = {
@@ -135,7 +148,6 @@ class TestBaseDynamoRepository:
 
         assert key == {"pipeline_id": "test-id", "sort_field": "sort-value"}
 
-    @mock_aws
     def test_create_item(self, repository, sample_pipeline, test_table):
         """Test creating an item in DynamoDB."""
         # Create item
@@ -148,7 +160,100 @@ class TestBaseDynamoRepository:
         assert 'Item' in response
         assert response['Item']['pipeline_id'] == 'test-pipeline'
 
-    @mock_aws
+    def test_put_if_absent(self, repository, sample_pipeline, test_table):
+        """Test conditional create only writes when the key is free."""
+        assert repository.put_if_absent(sample_pipeline) is True
+
+        changed = sample_pipeline.model_copy(update={'pipeline_name': 'Changed'})
+        assert repository.put_if_absent(changed) is False
+
+        response = test_table.get_item(Key={'pipeline_id': 'test-pipeline'})
+        assert response['Item']['pipeline_name'] == sample_pipeline.pipeline_name
+
+    def test_batch_create_items(self, repository, test_table):
+        """Test creating more items than one BatchWriteItem request holds."""
+        pipelines = [
+            PipelineConfig(
+                pipeline_id=f"batch-pipeline-{i}",
+                pipeline_name=f"Batch Pipeline {i}",
+                source_type="s3",
+                destination_type="redshift"
+            )
+            for i in range(30)
+        ]
+
+        result = repository.batch_create(pipelines)
+
+        assert result == pipelines
+        assert test_table.scan(Select='COUNT')['Count'] == 30
+
+    def test_batch_create_retries_unprocessed_items(self, repository, sample_pipeline):
+        """Test unprocessed items are resubmitted and eventually raise."""
+        item = repository._model_to_item(sample_pipeline)
+        unprocessed = {'dev_test_table': [{'PutRequest': {'Item': item}}]}
+        mock_dynamodb = Mock()
+        mock_dynamodb.batch_write_item.side_effect = [
+            {'UnprocessedItems': unprocessed},
+            {'UnprocessedItems': {}},
+        ]
+        repository._dynamodb = mock_dynamodb
+
+        with patch('dynamodb_wrapper_V1.dynamodb_wrapper.repositories.base.time.sleep') as mock_sleep:
+            repository.batch_create([sample_pipeline])
+
+            assert mock_dynamodb.batch_write_item.call_count == 2
+            assert mock_dynamodb.batch_write_item.call_args.kwargs['RequestItems'] == unprocessed
+            mock_sleep.assert_called_once()
+
+            mock_dynamodb.batch_write_item.side_effect = None
+            mock_dynamodb.batch_write_item.return_value = {'UnprocessedItems': unprocessed}
+            with pytest.raises(ConnectionError, match="still unprocessed"):
+                repository.batch_create([sample_pipeline], max_retries=1)
+
+    def test_batch_get_models(self, repository, sample_pipeline, test_table):
+        """Test batch get returns models in input order with None for missing keys."""
+        test_table.put_item(Item=repository._model_to_item(sample_pipeline))
+
+        result = batch_get_models([
+            (repository, 'missing-pipeline'),
+            (repository, 'test-pipeline'),
+            (repository, 'test-pipeline'),
+        ])
+
+        assert result[0] is None
+        assert result[1].pipeline_id == 'test-pipeline'
+        assert result[2].pipeline_id == 'test-pipeline'
+        assert batch_get_models([]) == []
+
+    def test_list_all_parallel_segments(self, repository, test_table):
+        """Test a segmented scan returns the same items as a serial scan."""
+        pipelines = [
+            PipelineConfig(
+                pipeline_id=f"scan-pipeline-{i}",
+                pipeline_name=f"Scan Pipeline {i}",
+                source_type="s3",
+                destination_type="redshift"
+            )
+            for i in range(12)
+        ]
+        repository.batch_create(pipelines)
+
+        serial = {pipeline.pipeline_id for pipeline in repository.list_all()}
+        parallel = repository.list_all(segments=4)
+
+        assert len(parallel) == 12
+        assert {pipeline.pipeline_id for pipeline in parallel} == serial
+
+    def test_list_all_segments_use_own_tables(self, repository, test_table):
+        """Test each scan worker gets its own Table on the repository's client."""
+        with patch.object(repository, '_scan_segment', wraps=repository._scan_segment) as scan_segment:
+            repository.list_all(segments=3)
+
+        tables = [call.kwargs['table'] for call in scan_segment.call_args_list]
+        assert len({id(table) for table in tables}) == 3
+        assert all(table is not repository.table for table in tables)
+        assert all(table.meta.client is repository.dynamodb.meta.client for table in tables)
+
     def test_get_item_exists(self, repository, sample_pipeline, test_table):
         """Test getting an existing item."""
         # Put item directly in table
@@ -162,14 +267,12 @@ class TestBaseDynamoRepository:
         assert isinstance(result, PipelineConfig)
         assert result.pipeline_id == "test-pipeline"
 
-    @mock_aws
     def test_get_item_not_exists(self, repository, test_table):
         """Test getting a non-existent item."""
         result = repository.get("non-existent")
 
         assert result is None
 
-    @mock_aws
     def test_get_or_raise_exists(self, repository, sample_pipeline, test_table):
         """Test get_or_raise with existing item."""
         item_data = repository._model_to_item(sample_pipeline)
@@ -180,7 +283,6 @@ class TestBaseDynamoRepository:
         assert isinstance(result, PipelineConfig)
         assert result.pipeline_id == "test-pipeline"
 
-    @mock_aws
     def test_get_or_raise_not_exists(self, repository, test_table):
         """Test get_or_raise with non-existent item."""
         with pytest.raises(ItemNotFoundError) as exc_info:
@@ -189,7 +291,6 @@ class TestBaseDynamoRepository:
         assert "dev_test_table" in str(exc_info.value)
         assert "non-existent" in str(exc_info.value)
 
-    @mock_aws
     def test_update_item(self, repository, sample_pipeline, test_table):
         """Test updating an item."""
         # Create original item
@@ -206,7 +307,6 @@ class TestBaseDynamoRepository:
         response = test_table.get_item(Key={'pipeline_id': 'test-pipeline'})
         assert response['Item']['pipeline_name'] == 'Updated Pipeline'
 
-    @mock_aws
     def test_delete_item_exists(self, repository, sample_pipeline, test_table):
         """Test deleting an existing item."""
         repository.create(sample_pipeline)
@@ -220,7 +320,6 @@ class TestBaseDynamoRepository:
         response = test_table.get_item(Key={'pipeline_id': 'test-pipeline'})
         assert 'Item' not in response
 
-    @mock_aws
     def test_delete_item_not_exists(self, repository, test_table):
         """Test deleting a non-existent item."""
         result = repository.delete("non-existent")
@@ -238,3 +337,18 @@ class TestBaseDynamoRepository:
 
                 with pytest.raises(ConnectionError):
                     repository.get("test-id")
+
+    def test_fast_json_parser_installed(self, repository):
+        """Test botocore response parsing is switched to orjson when available."""
+        import botocore.parsers
+
+        orjson = pytest.importorskip("orjson")
+
+        with patch.object(botocore.parsers, 'json', botocore.parsers.json), \
+                patch('dynamodb_wrapper_V1.dynamodb_wrapper.repositories.base._fast_json_installed', False):
+            resource = repository.dynamodb
+
+            assert resource is repository.dynamodb
+            assert isinstance(botocore.parsers.json, _FastJSONAdapter)
+            assert botocore.parsers.json.loads is orjson.loads
+            assert botocore.parsers.json.dumps is json.dumps
@@ -108,7 +108,7 @@ class TestPipelineConfigRepository:
 
             result = repository.get_by_pipeline_id('test-pipeline')
 
-            mock_get.assert_called_once_with('test-pipeline')
+            mock_get.assert_called_once_with('test-pipeline', consistent=False)
             assert result == mock_pipeline
 
     def test_get_by_pipeline_id_with_timezone(self, repository):
@@ -124,7 +124,8 @@ class TestPipelineConfigRepository:
 
             mock_get_tz.assert_called_once_with(
                 'test-pipeline',
-                user_timezone='Europe/London'
+                user_timezone='Europe/London',
+                consistent=False
             )
             assert result == mock_pipeline
 
@@ -145,6 +146,19 @@ class TestPipelineConfigRepository:
             assert len(result) == 1
             assert result[0] == active_pipeline
 
+    def test_get_by_pipeline_id_consistent_read(self, repository):
+        """Test get_by_pipeline_id forwards consistent to GetItem."""
+        mock_table = Mock()
+        mock_table.get_item.return_value = {}
+        repository._table = mock_table
+
+        assert repository.get_by_pipeline_id('test-pipeline', consistent=True) is None
+
+        mock_table.get_item.assert_called_once_with(
+            Key={'pipeline_id': 'test-pipeline'},
+            ConsistentRead=True
+        )
+
     def test_get_active_pipelines_with_timezone(self, repository):
         """Test get_active_pipelines with timezone parameter."""
         with patch.object(repository, 'list_all_with_timezone') as mock_list_tz:
@@ -155,7 +169,7 @@ class TestPipelineConfigRepository:
 
             result = repository.get_active_pipelines(user_timezone='Asia/Tokyo')
 
-            mock_list_tz.assert_called_once_with('Asia/Tokyo')
+            mock_list_tz.assert_called_once_with('Asia/Tokyo', consistent=False)
             assert len(result) == 1
             assert result[0] == active_pipeline
 
@@ -365,6 +379,7 @@ class TestTableConfigRepository:
              patch.object(repository, 'update') as mock_update:
 
             mock_table = Mock(spec=TableConfig)
+            mock_table.pipeline_id = 'test-pipeline'
             mock_get.return_value = mock_table
             mock_update.return_value = mock_table
 
@@ -473,6 +488,44 @@ class TestPipelineRunLogsRepository:
             assert result[1].start_time.hour == 13
             assert result[2].start_time.hour == 12
 
+    def test_count_runs_by_pipeline(self, repository):
+        """Test count_runs_by_pipeline sums COUNT-only Scan pages."""
+        mock_table = Mock()
+        mock_table.scan.side_effect = [
+            {'Count': 3, 'LastEvaluatedKey': {'run_id': 'run-3'}},
+            {'Count': 2},
+        ]
+        repository._table = mock_table
+
+        assert repository.count_runs_by_pipeline('test-pipeline') == 5
+        assert mock_table.scan.call_count == 2
+        assert all(call.kwargs['Select'] == 'COUNT' for call in mock_table.scan.call_args_list)
+        assert mock_table.scan.call_args_list[1].kwargs['ExclusiveStartKey'] == {'run_id': 'run-3'}
+
+    def test_iter_runs_by_pipeline_pages_lazily(self, repository):
+        """Test iter_runs_by_pipeline fetches one Scan page per iteration."""
+        mock_table = Mock()
+        mock_table.scan.side_effect = [
+            {'Items': [{'run_id': 'run-1'}], 'LastEvaluatedKey': {'run_id': 'run-1'}},
+            {'Items': [], 'LastEvaluatedKey': {'run_id': 'run-2'}},
+            {'Items': [{'run_id': 'run-3'}]},
+        ]
+        repository._table = mock_table
+
+        with patch.object(repository, '_item_to_model', side_effect=lambda item: item['run_id']):
+            pages = repository.iter_runs_by_pipeline('test-pipeline', page_size=2)
+
+            assert next(pages) == ['run-1']
+            assert mock_table.scan.call_count == 1
+            first_kwargs = mock_table.scan.call_args_list[0].kwargs
+            assert first_kwargs['Limit'] == 2
+            assert 'ExclusiveStartKey' not in first_kwargs
+
+            # Empty filtered pages are skipped rather than yielded
+            assert list(pages) == [['run-3']]
+            assert mock_table.scan.call_count == 3
+            assert mock_table.scan.call_args_list[2].kwargs['ExclusiveStartKey'] == {'run_id': 'run-2'}
+
     def test_get_runs_by_status(self, repository):
         """Test get_runs_by_status method."""
         with patch.object(repository, 'list_all') as mock_list:
@@ -1,9 +1,14 @@
 import os
+import pickle
 from unittest.mock import patch
 
 import pytest
 
 from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
+from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
+    PipelineConfigRepository,
+    RepositoryContainer,
+)
 
 
 class TestDynamoDBConfig:
@@ -106,3 +111,62 @@ class TestDynamoDBConfig:
         """Test region validation."""
         with pytest.raises(ValueError, match="AWS region name is required"):
             DynamoDBConfig(region_name="")
+
+    def test_retry_mode_validation(self):
+        """Test retry mode validation."""
+        with pytest.raises(ValueError, match="Retry mode must be one of"):
+            DynamoDBConfig(retry_mode="aggressive")
+
+    def test_shared_client_config(self):
+        """Test the shared client uses bounded timeouts and adaptive retries."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+        with patch('boto3.Session') as mock_session_class:
+            config.get_shared_client()
+
+            client_config = mock_session_class.return_value.resource.call_args.kwargs['config']
+            assert client_config.connect_timeout == 1.0
+            assert client_config.read_timeout == 30.0
+            assert client_config.retries == {'total_max_attempts': 4, 'mode': 'adaptive'}
+            assert client_config.tcp_keepalive is True
+
+    def test_shared_client_cached_per_config(self):
+        """Test one client is built per config and each repository gets its own resource on it."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+        client = config.get_shared_client()
+
+        assert config.get_shared_client() is client
+        repos = RepositoryContainer(config)
+        assert repos.pipelines.dynamodb is repos.tables.dynamodb is repos.run_logs.dynamodb
+        assert repos.pipelines.dynamodb.meta.client is client
+
+        other = PipelineConfigRepository(config)
+        assert other.dynamodb is not repos.pipelines.dynamodb
+        assert other.dynamodb.meta.client is client
+        assert DynamoDBConfig().get_shared_client() is not client
+
+    def test_shared_client_keyed_by_connection_settings(self):
+        """Test equal settings share a client and a copy with another region does not."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+        client = config.get_shared_client()
+
+        assert DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret").get_shared_client() is client
+
+        moved = config.model_copy(update={'region_name': 'eu-west-1'})
+        assert moved.get_shared_client().meta.region_name == 'eu-west-1'
+        assert config.get_shared_client() is client
+
+    def test_shared_client_key_hides_credentials(self):
+        """Test the cache key does not hold the secret key in the clear."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+
+        assert "secret" not in config._connection_key()
+
+    def test_config_picklable_after_use(self):
+        """Test a config that already built its client can still be shipped to executors."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+        client = PipelineConfigRepository(config).dynamodb.meta.client
+
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored == config
+        assert restored.get_shared_client() is client
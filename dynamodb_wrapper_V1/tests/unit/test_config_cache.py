@@ -0,0 +1,124 @@
+from unittest.mock import Mock, patch
+
+from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
+from dynamodb_wrapper_V1.dynamodb_wrapper.models import (
+    PipelineConfig,
+    PipelineRunLog,
+    RunStatus,
+)
+from dynamodb_wrapper_V1.dynamodb_wrapper.repositories import (
+    PipelineConfigRepository,
+    PipelineRunLogsRepository,
+)
+from dynamodb_wrapper_V1.dynamodb_wrapper.utils import get_pipeline_config_for_spark
+from dynamodb_wrapper_V1.dynamodb_wrapper.utils.config_cache import (
+    TTLCache,
+    config_cache_key,
+    invalidate_pipeline_cache,
+    pipeline_config_cache,
+    table_configs_cache,
+)
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+
+    def test_get_set_pop(self):
+        """Test basic read-aside operations."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        assert cache.get('missing') is None
+
+        cache.set('key', 'value')
+        assert cache.get('key') == 'value'
+        assert cache.pop('key') == 'value'
+        assert cache.get('key') is None
+
+    def test_expired_entries_are_dropped(self):
+        """Test entries are not returned after their TTL."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        with patch('dynamodb_wrapper_V1.dynamodb_wrapper.utils.config_cache.time.monotonic', return_value=100.0):
+            cache.set('key', 'value')
+        with patch('dynamodb_wrapper_V1.dynamodb_wrapper.utils.config_cache.time.monotonic', return_value=109.0):
+            assert cache.get('key') == 'value'
+        with patch('dynamodb_wrapper_V1.dynamodb_wrapper.utils.config_cache.time.monotonic', return_value=110.0):
+            assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_evicted_when_full(self):
+        """Test the oldest entry is evicted once maxsize is reached."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+
+        assert cache.get('a') is None
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
+
+    def test_update_pipeline_status_invalidates_cache(self):
+        """Test pipeline status writes drop cached config for that pipeline."""
+        config = DynamoDBConfig.for_local_development()
+        repository = PipelineConfigRepository(config)
+        repository._table = Mock()
+        cache_key = config_cache_key(config, repository.table_name, 'test-pipeline')
+        pipeline_config_cache.set(cache_key, 'cached')
+
+        with patch.object(repository, 'get_or_raise', return_value=Mock(spec=PipelineConfig)):
+            repository.update_pipeline_status('test-pipeline', False)
+
+        assert pipeline_config_cache.get(cache_key) is None
+
+    def test_writes_only_drop_entries_for_their_table(self):
+        """Test a write drops cached reads of its own table and endpoint only."""
+        config = DynamoDBConfig.for_local_development()
+        remote_config = config.model_copy(update={'endpoint_url': None})
+        pipeline_repo = PipelineConfigRepository(config)
+        pipeline_repo._table = Mock(**{'delete_item.return_value': {'Attributes': {}}})
+        logs_repo = PipelineRunLogsRepository(config)
+        logs_repo._table = Mock()
+        local_key = config_cache_key(config, pipeline_repo.table_name, 'test-pipeline')
+        remote_key = config_cache_key(remote_config, pipeline_repo.table_name, 'test-pipeline')
+        pipeline_config_cache.set(local_key, 'local')
+        pipeline_config_cache.set(remote_key, 'remote')
+
+        logs_repo.create(PipelineRunLog(
+            run_id='run-1', pipeline_id='test-pipeline', status=RunStatus.RUNNING, trigger_type='manual'
+        ))
+        assert pipeline_config_cache.get(local_key) == 'local'
+
+        pipeline_repo.delete('test-pipeline')
+        assert pipeline_config_cache.get(local_key) is None
+        assert pipeline_config_cache.get(remote_key) == 'remote'
+
+    def test_invalidate_pipeline_cache_drops_every_table(self):
+        """Test invalidating a pipeline drops it for every table and endpoint."""
+        config = DynamoDBConfig.for_local_development()
+        pipeline_config_cache.set(config_cache_key(config, 'dev_pipeline_config', 'test-pipeline'), 'dev')
+        table_configs_cache.set(config_cache_key(config, 'prod_table_config', 'test-pipeline'), ['prod'])
+        other_key = config_cache_key(config, 'dev_pipeline_config', 'other-pipeline')
+        pipeline_config_cache.set(other_key, 'other')
+
+        invalidate_pipeline_cache('test-pipeline')
+
+        assert pipeline_config_cache.get(config_cache_key(config, 'dev_pipeline_config', 'test-pipeline')) is None
+        assert table_configs_cache.get(config_cache_key(config, 'prod_table_config', 'test-pipeline')) is None
+        assert pipeline_config_cache.get(other_key) == 'other'
+
+    def test_spark_lookup_returns_copies(self):
+        """Test cached pipeline config is read once and handed out as copies."""
+        config = DynamoDBConfig.for_local_development()
+        pipeline = PipelineConfig(
+            pipeline_id="copy-pipeline",
+            pipeline_name="Copy Pipeline",
+            source_type="s3",
+            destination_type="redshift"
+        )
+
+        with patch.object(PipelineConfigRepository, 'get_or_raise', return_value=pipeline) as get_or_raise:
+            first = get_pipeline_config_for_spark('copy-pipeline', config)
+            first.pipeline_name = "Changed"
+            second = get_pipeline_config_for_spark('copy-pipeline', config)
+
+        get_or_raise.assert_called_once_with('copy-pipeline')
+        assert second.pipeline_name == "Copy Pipeline"
+        assert first is not pipeline and second is not pipeline
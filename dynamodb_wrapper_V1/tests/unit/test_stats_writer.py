@@ -0,0 +1,95 @@
+import threading
+from unittest.mock import Mock, call, patch
+
+from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
+from dynamodb_wrapper_V1.dynamodb_wrapper.models import PipelineRunLog
+from dynamodb_wrapper_V1.dynamodb_wrapper.utils import pyspark_integration
+from dynamodb_wrapper_V1.dynamodb_wrapper.utils.stats_writer import StatsWriter
+
+
+class TestStatsWriter:
+    """Test cases for StatsWriter."""
+
+    def test_flush_coalesces_updates(self):
+        """Test queued updates collapse to one write per table and run."""
+        table_repo = Mock()
+        logs_repo = Mock()
+        run_log = Mock(spec=PipelineRunLog)
+        run_log.output_tables = None
+        run_log.total_records_processed = 5
+        logs_repo.get.return_value = run_log
+
+        writer = StatsWriter(table_repo, logs_repo, flush_interval_s=60)
+        writer.submit('table-a', 10, run_id='run-1')
+        writer.submit('table-b', 20, run_id='run-1')
+        writer.submit('table-a', 30, run_id='run-1')
+        writer.flush_and_join(timeout=5)
+
+        assert table_repo.update_table_statistics.call_count == 2
+        record_counts = {
+            call.kwargs['table_id']: call.kwargs['record_count']
+            for call in table_repo.update_table_statistics.call_args_list
+        }
+        assert record_counts == {'table-a': 30, 'table-b': 20}
+
+        logs_repo.get.assert_called_once_with('run-1')
+        logs_repo.update.assert_called_once_with(run_log)
+        assert run_log.output_tables == ['table-a', 'table-b']
+        assert run_log.total_records_processed == 65
+
+    def test_flushes_when_batch_is_full(self):
+        """Test a flush happens once flush_every updates are pending."""
+        table_repo = Mock()
+        flushed = threading.Event()
+        table_repo.update_table_statistics.side_effect = lambda **kwargs: flushed.set()
+
+        writer = StatsWriter(table_repo, Mock(), flush_every=2, flush_interval_s=60)
+        writer.submit('table-a', 1)
+        writer.submit('table-b', 2)
+
+        assert flushed.wait(timeout=5)
+        writer.flush_and_join(timeout=5)
+        assert table_repo.update_table_statistics.call_count == 2
+
+    def test_write_failures_are_logged_not_raised(self):
+        """Test a failing table write does not stop the writer."""
+        table_repo = Mock()
+        table_repo.update_table_statistics.side_effect = [Exception("boom"), None]
+
+        writer = StatsWriter(table_repo, Mock(), flush_interval_s=60)
+        writer.submit('table-a', 1)
+        writer.submit('table-b', 2)
+        writer.flush_and_join(timeout=5)
+
+        assert table_repo.update_table_statistics.call_count == 2
+
+    def test_nested_run_contexts_keep_their_own_writer(self):
+        """Test an inner pipeline_run_context does not replace the outer one's writer."""
+        writers = []
+
+        def new_writer(table_repo, logs_repo):
+            writers.append(Mock(table_repo=table_repo, logs_repo=logs_repo))
+            return writers[-1]
+
+        with patch.object(pyspark_integration, 'PYSPARK_AVAILABLE', True), \
+                patch.object(pyspark_integration, 'StatsWriter', side_effect=new_writer), \
+                patch.object(pyspark_integration, 'PipelineConfigRepository'), \
+                patch.object(pyspark_integration, 'TableConfigRepository', side_effect=lambda config: Mock()), \
+                patch.object(pyspark_integration, 'PipelineRunLogsRepository', side_effect=lambda config: Mock()):
+            integration = pyspark_integration.SparkDynamoDBIntegration(DynamoDBConfig.for_local_development())
+            with integration.pipeline_run_context('pipeline') as outer_run:
+                integration.update_table_stats_after_write('table-a', None, run_id=outer_run, record_count=1)
+                with integration.pipeline_run_context('pipeline') as inner_run:
+                    integration.update_table_stats_after_write('table-b', None, run_id=inner_run, record_count=2)
+                integration.update_table_stats_after_write('table-c', None, run_id=outer_run, record_count=3)
+
+        outer, inner = writers
+        assert outer.submit.call_args_list == [
+            call('table-a', 1, run_id=outer_run),
+            call('table-c', 3, run_id=outer_run)
+        ]
+        assert inner.submit.call_args_list == [call('table-b', 2, run_id=inner_run)]
+        outer.flush_and_join.assert_called_once_with()
+        inner.flush_and_join.assert_called_once_with()
+        assert outer.table_repo is not integration.table_repo
+        assert outer.logs_repo is not integration.logs_repo
@@ -8,8 +8,11 @@ from dynamodb_wrapper_V1.dynamodb_wrapper.config import DynamoDBConfig
 from dynamodb_wrapper_V1.dynamodb_wrapper.utils.timezone import (
     TimezoneManager,
     ensure_timezone_aware,
+    ensure_utc_for_storage,
     get_timezone_manager,
     now_in_tz,
+    parse_iso_datetime,
+    resolve_timezone,
     set_global_timezone,
     to_user_timezone,
     to_utc,
@@ -82,6 +85,28 @@ class TestTimezoneManager:
         utc_dt = tm.to_utc(dt)
         assert str(utc_dt.tzinfo) == "UTC"
 
+    def test_to_utc_already_utc_returns_same_object(self):
+        """Test to_utc short-circuits datetimes already in timezone.utc."""
+        tm = TimezoneManager()
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert tm.to_utc(dt) is dt
+
+    def test_to_utc_zero_offset_relabels(self):
+        """Test to_utc relabels zero-offset zones with timezone.utc."""
+        tm = TimezoneManager()
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=resolve_timezone("Europe/London"))
+
+        utc_dt = tm.to_utc(dt)
+        assert utc_dt.tzinfo is timezone.utc
+        assert utc_dt == dt
+
+    def test_get_timezone_cached(self):
+        """Test ZoneInfo instances are reused across managers."""
+        tm = TimezoneManager("America/New_York")
+
+        assert tm.get_timezone() is TimezoneManager().get_timezone("America/New_York")
+
     def test_ensure_timezone_naive(self):
         """Test ensuring timezone on naive datetime."""
         tm = TimezoneManager("America/New_York")
@@ -90,6 +115,37 @@ class TestTimezoneManager:
         aware_dt = tm.ensure_timezone(naive_dt)
         assert aware_dt.tzinfo is not None
 
+    def test_default_zone_resolved_once(self):
+        """Test the default zone is resolved at init and reused."""
+        tm = TimezoneManager("America/New_York")
+        naive_dt = datetime(2024, 1, 15, 12, 0, 0)
+
+        assert tm.ensure_timezone(naive_dt).tzinfo is tm.get_timezone()
+        assert tm.to_timezone(naive_dt).tzinfo is tm.get_timezone()
+
+    def test_default_timezone_reassignment_updates_zone(self):
+        """Test changing default_timezone re-resolves the cached zone."""
+        tm = TimezoneManager("UTC")
+        tm.default_timezone = "Asia/Tokyo"
+
+        assert str(tm.get_timezone()) == "Asia/Tokyo"
+        assert tm.ensure_timezone(datetime(2024, 1, 15, 12, 0, 0)).utcoffset().total_seconds() == 9 * 3600
+
+    def test_slots(self):
+        """Test TimezoneManager instances have no per-instance __dict__."""
+        tm = TimezoneManager()
+
+        assert not hasattr(tm, "__dict__")
+        with pytest.raises(AttributeError):
+            tm.unexpected = True
+
+    def test_to_timezone_same_zone_returns_same_object(self):
+        """Test to_timezone skips astimezone when already in the target zone."""
+        tm = TimezoneManager("America/New_York")
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=tm.get_timezone())
+
+        assert tm.to_timezone(dt) is dt
+
     def test_ensure_timezone_aware(self):
         """Test ensuring timezone on already aware datetime."""
         tm = TimezoneManager()
@@ -106,6 +162,13 @@ class TestTimezoneManager:
         iso_str = tm.format_iso(dt)
         assert "2024-01-15T12:00:00+00:00" in iso_str
 
+    def test_format_iso_naive_uses_default_zone(self):
+        """Test formatting a naive datetime attaches the default timezone."""
+        tm = TimezoneManager("Asia/Tokyo")
+
+        assert tm.format_iso(datetime(2024, 1, 15, 12, 0, 0)) == "2024-01-15T12:00:00+09:00"
+        assert tm.format_iso(None) is None
+
     def test_parse_iso(self):
         """Test parsing ISO datetime string."""
         tm = TimezoneManager()
@@ -125,6 +188,14 @@ class TestTimezoneManager:
         dt = tm.parse_iso(iso_str)
         assert dt.tzinfo is not None
 
+    def test_parse_iso_datetime(self):
+        """Test module-level ISO parsing with and without a Z suffix."""
+        assert parse_iso_datetime("2024-01-15T12:00:00Z") == datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+        assert parse_iso_datetime("2024-01-15T12:00:00+00:00").utcoffset().total_seconds() == 0
+        assert parse_iso_datetime("2024-01-15T12:00:00").tzinfo is None
+        with pytest.raises(ValueError):
+            parse_iso_datetime("not-a-dateZ")
+
     def test_get_user_timezone_datetime(self):
         """Test getting datetime in user's timezone."""
         tm = TimezoneManager()
@@ -176,12 +247,58 @@ class TestGlobalTimezoneManager:
         utc_dt = to_utc(dt)
         assert str(utc_dt.tzinfo) == "UTC"
 
+    def test_convenience_aware_bypasses_manager(self):
+        """Test aware datetimes are converted without the global manager."""
+        dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=resolve_timezone("America/New_York"))
+        with patch(
+            "dynamodb_wrapper_V1.dynamodb_wrapper.utils.timezone.get_timezone_manager"
+        ) as mock_manager:
+            assert to_utc(dt).tzinfo is timezone.utc
+            assert to_utc(dt).hour == 17
+            assert to_user_timezone(dt, "Asia/Tokyo").hour == 2
+            assert ensure_timezone_aware(dt) is dt
+            mock_manager.assert_not_called()
+
+    def test_convenience_naive_uses_global_default(self):
+        """Test naive datetimes still honour the global default timezone."""
+        set_global_timezone("America/New_York")
+        try:
+            utc_dt = to_utc(datetime(2024, 1, 15, 12, 0, 0))
+            assert utc_dt.hour == 17
+        finally:
+            set_global_timezone("UTC")
+
     def test_ensure_timezone_aware_convenience(self):
         """Test convenience function for ensuring timezone awareness."""
         naive_dt = datetime(2024, 1, 15, 12, 0, 0)
         aware_dt = ensure_timezone_aware(naive_dt)
         assert aware_dt.tzinfo is not None
 
+    def test_ensure_timezone_aware_with_tzinfo(self):
+        """Test convenience function with a pre-resolved tzinfo."""
+        naive_dt = datetime(2024, 1, 15, 12, 0, 0)
+        tz = resolve_timezone("America/New_York")
+        aware_dt = ensure_timezone_aware(naive_dt, tz)
+        assert aware_dt.tzinfo is tz
+        assert aware_dt.hour == 12
+
+    def test_ensure_utc_for_storage(self):
+        """Test storage normalisation of naive, aware and UTC datetimes."""
+        utc_dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        assert ensure_utc_for_storage(utc_dt) is utc_dt
+        assert ensure_utc_for_storage(None) is None
+
+        naive_dt = datetime(2024, 1, 15, 12, 0, 0)
+        assert ensure_utc_for_storage(naive_dt) == utc_dt
+        stored = ensure_utc_for_storage(naive_dt, resolve_timezone("America/New_York"))
+        assert stored.tzinfo is timezone.utc
+        assert stored.hour == 17
+        assert ensure_utc_for_storage(naive_dt, "America/New_York") == stored
+
+    def test_resolve_timezone_utc_singleton(self):
+        """Test UTC resolves to the timezone.utc singleton."""
+        assert resolve_timezone("UTC") is timezone.utc
+
 
 class TestDynamoDBConfigTimezone:
     """Test cases for DynamoDB config timezone support."""
@@ -1,5 +1,7 @@
+import hashlib
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -10,6 +12,12 @@ load_dotenv()
 # Import at top level to avoid circular imports - only imported when method is called
 # This is acceptable since get_timezone_manager is only called after config initialization
 
+# Resources whose clients are shared, keyed by DynamoDBConfig._connection_key().
+# Kept off the config so configs stay picklable and copies with other
+# connection settings get their own client.
+_shared_resources: Dict[Tuple[Any, ...], Any] = {}
+_shared_client_lock = threading.Lock()
+
 
 class DynamoDBConfig(BaseModel):
     """Configuration for DynamoDB connection and operations."""
@@ -216,6 +224,74 @@ class DynamoDBConfig(BaseModel):
         config.user_timezone = user_timezone
         return config
 
+    def get_shared_client(self) -> Any:
+        """Get the low-level DynamoDB client shared by gateways using these settings.
+
+        Built once per set of connection settings, so every CQRS API created
+        from equivalent configs reuses one boto3 Session, service model and
+        connection pool. Clients are thread-safe.
+
+        Returns:
+            boto3 DynamoDB client (cached)
+        """
+        return self._get_root_resource().meta.client
+
+    def create_resource(self) -> Any:
+        """Create a DynamoDB resource on top of the shared client.
+
+        boto3 resources are not thread-safe, so each thread that talks to
+        DynamoDB should use its own. They are cheap to create because the
+        client underneath is shared.
+
+        Returns:
+            New boto3 DynamoDB service resource
+        """
+        root = self._get_root_resource()
+        return type(root)(client=root.meta.client)
+
+    def _connection_key(self) -> Tuple[Any, ...]:
+        """Key identifying the client settings; credentials are hashed, not kept."""
+        credentials = f"{self.aws_access_key_id}:{self.aws_secret_access_key}".encode()
+        return (
+            self.endpoint_url,
+            self.region_name,
+            hashlib.sha256(credentials).hexdigest(),
+            self.max_pool_connections,
+            self.retries,
+            self.timeout_seconds,
+        )
+
+    def _get_root_resource(self) -> Any:
+        """Build the resource whose client is shared, once per connection key."""
+        key = self._connection_key()
+        with _shared_client_lock:
+            resource = _shared_resources.get(key)
+            if resource is None:
+                import boto3
+                from botocore.config import Config
+
+                session = boto3.Session(
+                    aws_access_key_id=self.aws_access_key_id,
+                    aws_secret_access_key=self.aws_secret_access_key,
+                    region_name=self.region_name
+                )
+
+                resource_kwargs = {
+                    'region_name': self.region_name,
+                    'config': Config(
+                        retries={'max_attempts': self.retries},
+                        max_pool_connections=self.max_pool_connections,
+                        read_timeout=self.timeout_seconds,
+                        connect_timeout=self.timeout_seconds
+                    )
+                }
+                if self.endpoint_url:
+                    resource_kwargs['endpoint_url'] = self.endpoint_url
+
+                resource = session.resource('dynamodb', **resource_kwargs)
+                _shared_resources[key] = resource
+        return resource
+
 # get_timezone_manager method removed - no longer needed with simplified timezone utilities
 
     model_config = ConfigDict(
@@ -23,10 +23,11 @@ inheriting heavyweight base classes or being locked into generic CRUD patterns.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from ..config import DynamoDBConfig
@@ -40,6 +41,11 @@ from ..exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB BatchWriteItem accepts at most 25 write requests per call
+BATCH_WRITE_LIMIT = 25
+
+# DynamoDB BatchGetItem accepts at most 100 keys per call
+BATCH_GET_LIMIT = 100
 
 def map_dynamodb_error(
     error: ClientError, 
@@ -204,42 +210,26 @@ class TableGateway:
         """
         self.config = config
         self.table_name = table_name
-        self._dynamodb = None
-        self._table = None
+        # boto3 resources are not thread-safe, so each thread gets its own
+        # resource and Table handle on the client shared through the config
+        self._local = threading.local()
 
     @property
     def dynamodb(self):
-        """Lazy initialization of DynamoDB resource."""
-        if self._dynamodb is None:
-            try:
-                session = boto3.Session(
-                    aws_access_key_id=self.config.aws_access_key_id,
-                    aws_secret_access_key=self.config.aws_secret_access_key,
-                    region_name=self.config.region_name
-                )
-
-                # Configure connection parameters
-                dynamodb_config = {
-                    'region_name': self.config.region_name
-                }
-
-                if self.config.endpoint_url:
-                    dynamodb_config['endpoint_url'] = self.config.endpoint_url
-
-                # Add retry and timeout configuration
-                boto_config = Config(
-                    retries={'max_attempts': self.config.retries},
-                    max_pool_connections=self.config.max_pool_connections,
-                    read_timeout=self.config.timeout_seconds,
-                    connect_timeout=self.config.timeout_seconds
-                )
-                dynamodb_config['config'] = boto_config
-
-                self._dynamodb = session.resource('dynamodb', **dynamodb_config)
-            except Exception as e:
-                logger.error(f"Failed to create DynamoDB resource: {e}")
-                raise ConnectionError(f"Failed to connect to DynamoDB: {e}", e) from e
-        return self._dynamodb
+        """Lazy initialization of the calling thread's DynamoDB resource."""
+        resource = getattr(self._local, 'dynamodb', None)
+        if resource is None:
+            resource = self._create_resource()
+            self._local.dynamodb = resource
+        return resource
+
+    def _create_resource(self):
+        """Create a boto3 DynamoDB resource on the config's shared client."""
+        try:
+            return self.config.create_resource()
+        except Exception as e:
+            logger.error(f"Failed to create DynamoDB resource: {e}")
+            raise ConnectionError(f"Failed to connect to DynamoDB: {e}", e) from e
 
     @property
     def table(self):
@@ -249,13 +239,15 @@ class TableGateway:
         This is the primary interface for DynamoDB operations.
         Read/write APIs use this directly for maximum flexibility.
         """
-        if self._table is None:
+        table = getattr(self._local, 'table', None)
+        if table is None:
             try:
-                self._table = self.dynamodb.Table(self.table_name)
+                table = self.dynamodb.Table(self.table_name)
             except Exception as e:
                 logger.error(f"Failed to access table '{self.table_name}': {e}")
                 raise ConnectionError(f"Failed to access table '{self.table_name}': {e}", e) from e
-        return self._table
+            self._local.table = table
+        return table
 
     def query(self, **kwargs) -> Dict[str, Any]:
         """
@@ -439,6 +431,154 @@ class TableGateway:
         """
         return self.table.batch_writer()
 
+    def batch_put_items(self, items: List[Dict[str, Any]], max_retries: int = 3) -> int:
+        """
+        Put items using BatchWriteItem, retrying UnprocessedItems.
+        
+        Items are sent in chunks of 25 (the BatchWriteItem limit), so N items cost
+        ceil(N/25) round trips instead of N. Requests returned in UnprocessedItems
+        are re-submitted with exponential backoff.
+        
+        Args:
+            items: DynamoDB items to put (no conditions - allows overwrite)
+            max_retries: Maximum retry attempts for unprocessed items per chunk
+            
+        Returns:
+            Number of items written
+            
+        Raises:
+            RetryableError: Items still unprocessed after max_retries
+            
+        Example:
+            gateway.batch_put_items([table.to_dynamodb_item() for table in tables])
+        """
+        for start in range(0, len(items), BATCH_WRITE_LIMIT):
+            requests = [
+                {'PutRequest': {'Item': item}}
+                for item in items[start:start + BATCH_WRITE_LIMIT]
+            ]
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    response = self.dynamodb.batch_write_item(
+                        RequestItems={self.table_name: requests}
+                    )
+                except ClientError as e:
+                    raise map_dynamodb_error(e, "BatchWriteItem", self.table_name) from e
+                
+                requests = response.get('UnprocessedItems', {}).get(self.table_name, [])
+                if not requests:
+                    break
+                
+                if attempt == max_retries:
+                    raise RetryableError(
+                        f"BatchWriteItem on {self.table_name}: {len(requests)} items "
+                        f"unprocessed after {max_retries} retries"
+                    )
+                
+                # Exponential backoff with jitter
+                delay = (2 ** attempt) + (time.time() % 1)
+                logger.warning(
+                    f"Retrying {len(requests)} unprocessed items on {self.table_name} after {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{max_retries + 1})"
+                )
+                time.sleep(delay)
+        
+        logger.info(f"Batch put {len(items)} items in {self.table_name}")
+        return len(items)
+
+    def batch_get_items(
+        self,
+        keys: List[Dict[str, Any]],
+        projection_expression: Optional[str] = None,
+        expression_attribute_names: Optional[Dict[str, str]] = None,
+        max_retries: int = 3,
+        max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Get items by primary key using BatchGetItem.
+        
+        Keys are de-duplicated (BatchGetItem rejects duplicate keys) and sent in
+        chunks of 100. When more than one chunk is needed, chunks are dispatched
+        concurrently on a thread pool sharing one low-level client. UnprocessedKeys are re-requested with
+        exponential backoff.
+        
+        Args:
+            keys: Primary keys of the items to fetch
+            projection_expression: Optional ProjectionExpression
+            expression_attribute_names: Names for the projection expression
+            max_retries: Maximum retry attempts for unprocessed keys per chunk
+            max_workers: Maximum concurrent BatchGetItem calls
+            
+        Returns:
+            Found items, in no particular order (missing keys are omitted)
+            
+        Raises:
+            RetryableError: Keys still unprocessed after max_retries
+            
+        Example:
+            items = gateway.batch_get_items(
+                [{'table_id': 'a'}, {'table_id': 'b'}],
+                projection_expression='#f0, #f1',
+                expression_attribute_names={'#f0': 'table_id', '#f1': 'table_name'}
+            )
+        """
+        unique_keys = list({tuple(sorted(key.items())): key for key in keys}.values())
+        if not unique_keys:
+            return []
+        
+        chunks = [
+            unique_keys[start:start + BATCH_GET_LIMIT]
+            for start in range(0, len(unique_keys), BATCH_GET_LIMIT)
+        ]
+        
+        # The resource is not thread-safe but its client is, so the pool workers
+        # share the client (which still carries the resource's type conversion)
+        client = self.dynamodb.meta.client
+        
+        def get_chunk(chunk_keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            request: Dict[str, Any] = {'Keys': chunk_keys}
+            if projection_expression:
+                request['ProjectionExpression'] = projection_expression
+            if expression_attribute_names:
+                request['ExpressionAttributeNames'] = expression_attribute_names
+            
+            found: List[Dict[str, Any]] = []
+            for attempt in range(max_retries + 1):
+                try:
+                    response = client.batch_get_item(
+                        RequestItems={self.table_name: request}
+                    )
+                except ClientError as e:
+                    raise map_dynamodb_error(e, "BatchGetItem", self.table_name) from e
+                
+                found.extend(response.get('Responses', {}).get(self.table_name, []))
+                unprocessed = response.get('UnprocessedKeys', {}).get(self.table_name)
+                if not unprocessed:
+                    break
+                
+                if attempt == max_retries:
+                    raise RetryableError(
+                        f"BatchGetItem on {self.table_name}: {len(unprocessed['Keys'])} keys "
+                        f"unprocessed after {max_retries} retries"
+                    )
+                
+                request = unprocessed
+                # Exponential backoff with jitter
+                delay = (2 ** attempt) + (time.time() % 1)
+                logger.warning(
+                    f"Retrying {len(request['Keys'])} unprocessed keys on {self.table_name} after {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{max_retries + 1})"
+                )
+                time.sleep(delay)
+            return found
+        
+        if len(chunks) == 1:
+            return get_chunk(chunks[0])
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            return [item for chunk_items in executor.map(get_chunk, chunks) for item in chunk_items]
+
     def transact_write_items(self, transact_items: List[Dict[str, Any]]) -> None:
         """
         Execute transactional write operations.
@@ -66,9 +66,10 @@ class PipelineConfigWriteApi:
         """
         try:
             # Convert validated DTO to full model with auto-generated fields
-            pipeline_dict = pipeline_data.model_dump()
-            pipeline_dict['created_at'] = datetime.now(timezone.utc)
-            pipeline_dict['updated_at'] = datetime.now(timezone.utc)
+            pipeline_dict = dict(pipeline_data.as_item)
+            now = datetime.now(timezone.utc)
+            pipeline_dict['created_at'] = now
+            pipeline_dict['updated_at'] = now
             pipeline = PipelineConfig(**pipeline_dict)
         except Exception as e:
             raise ValidationError(f"Invalid pipeline data: {e}") from e
@@ -239,7 +240,7 @@ class PipelineConfigWriteApi:
         """
         try:
             # Convert validated DTO to full model, preserving/setting timestamps
-            pipeline_dict = pipeline_data.model_dump()
+            pipeline_dict = dict(pipeline_data.as_item)
             now = datetime.now(timezone.utc)
             
             # Check if item already exists to preserve created_at
@@ -309,7 +310,7 @@ class PipelineConfigWriteApi:
         for pipeline_dto in pipelines_data:
             try:
                 # Convert DTO to full model with timestamps
-                pipeline_dict = pipeline_dto.model_dump()
+                pipeline_dict = dict(pipeline_dto.as_item)
                 if 'created_at' not in pipeline_dict:
                     pipeline_dict['created_at'] = now
                 pipeline_dict['updated_at'] = now
@@ -44,6 +44,14 @@ class PipelineConfigReadApi:
             'pipeline_id', 'pipeline_name', 'source_type', 'destination_type',
             'is_active', 'environment', 'created_at', 'updated_at'
         ]
+        
+        # Projection matching PipelineConfigView for single-item reads
+        self.view_projection = [
+            'pipeline_id', 'pipeline_name', 'description', 'source_type', 
+            'destination_type', 'is_active', 'schedule_expression', 
+            'environment', 'version', 'tags', 'created_at', 'updated_at', 
+            'created_by', 'updated_by'
+        ]
 
     def get_by_id(
         self, 
@@ -72,13 +80,7 @@ class PipelineConfigReadApi:
             proj_expr, expr_names = build_projection_expression(projection)
         else:
             # Use optimized projection for PipelineConfigView
-            view_projection = [
-                'pipeline_id', 'pipeline_name', 'description', 'source_type', 
-                'destination_type', 'is_active', 'schedule_expression', 
-                'environment', 'version', 'tags', 'created_at', 'updated_at', 
-                'created_by', 'updated_by'
-            ]
-            proj_expr, expr_names = build_projection_expression(view_projection)
+            proj_expr, expr_names = build_projection_expression(self.view_projection)
             
         if proj_expr:
             get_kwargs['ProjectionExpression'] = proj_expr
@@ -98,6 +100,31 @@ class PipelineConfigReadApi:
             from ...exceptions import ConnectionError
             raise ConnectionError(f"Failed to get pipeline {pipeline_id}: {e}", e) from e
 
+    def batch_get_by_ids(
+        self,
+        pipeline_ids: List[str],
+        projection: Optional[List[str]] = None
+    ) -> List[PipelineConfigView]:
+        """
+        Get multiple pipeline configurations by ID in as few round trips as possible.
+        
+        DynamoDB Operation: BatchGetItem (100 keys per call, duplicates removed)
+        
+        Args:
+            pipeline_ids: Pipeline identifiers
+            projection: Fields to return (uses view projection if None)
+            
+        Returns:
+            List of PipelineConfigView for the pipelines found, in no particular order
+        """
+        proj_expr, expr_names = build_projection_expression(projection or self.view_projection)
+        items = self.gateway.batch_get_items(
+            [{'pipeline_id': pipeline_id} for pipeline_id in pipeline_ids],
+            projection_expression=proj_expr,
+            expression_attribute_names=expr_names
+        )
+        return [PipelineConfigView.from_dynamodb_item(item) for item in items]
+
     def query_active_pipelines(
         self,
         projection: Optional[List[str]] = None,
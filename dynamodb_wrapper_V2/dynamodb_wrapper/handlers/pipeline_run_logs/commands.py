@@ -66,7 +66,7 @@ class PipelineRunLogsWriteApi:
                 dt = run_dict[field]
                 if isinstance(dt, datetime):
                     # Ensure timezone-aware and convert to UTC (always UTC for internal operations)
-                    dt = ensure_timezone_aware(dt, "UTC")
+                    dt = ensure_timezone_aware(dt)
                     run_dict[field] = to_utc(dt)
         
         # Handle datetime fields in stages
@@ -76,7 +76,7 @@ class PipelineRunLogsWriteApi:
                     if field in stage and stage[field] is not None:
                         dt = stage[field]
                         if isinstance(dt, datetime):
-                            dt = ensure_timezone_aware(dt, "UTC")
+                            dt = ensure_timezone_aware(dt)
                             stage[field] = to_utc(dt)
         
         return PipelineRunLog(**run_dict)
@@ -114,7 +114,7 @@ class PipelineRunLogsWriteApi:
         """
         try:
             # Convert validated DTO to full model with auto-generated fields
-            run_dict = run_data.model_dump()
+            run_dict = dict(run_data.as_item)
             
             # Set default status if not provided
             if not run_dict.get('status'):
@@ -220,10 +220,11 @@ class PipelineRunLogsWriteApi:
         key = build_model_key(PipelineRunLog, run_id=run_id, pipeline_id=pipeline_id)
         
         # Build update expression
+        now = datetime.now(timezone.utc)
         update_parts = ['#status = :status', '#updated_at = :updated_at']
         expression_values = {
             ':status': status.value,
-            ':updated_at': datetime.now(timezone.utc).isoformat()
+            ':updated_at': now.isoformat()
         }
         expression_names = {
             '#status': 'status',
@@ -240,7 +241,7 @@ class PipelineRunLogsWriteApi:
         terminal_states = [RunStatus.SUCCESS, RunStatus.FAILED, RunStatus.CANCELLED]
         if status in terminal_states:
             if not end_time:
-                end_time = datetime.now(timezone.utc)
+                end_time = now
             
             update_parts.append('#end_time = :end_time')
             expression_values[':end_time'] = end_time.isoformat()
@@ -335,8 +336,9 @@ class PipelineRunLogsWriteApi:
             condition_expression = Attr('run_id').exists()
         
         # Add timestamp to stage info if not present
+        now = datetime.now(timezone.utc).isoformat()
         if 'timestamp' not in stage_info:
-            stage_info['timestamp'] = datetime.now(timezone.utc).isoformat()
+            stage_info['timestamp'] = now
         
         # TableGateway maps ConditionalCheckFailedException to ConflictError automatically
         # Other ClientErrors are mapped to appropriate domain exceptions
@@ -347,7 +349,7 @@ class PipelineRunLogsWriteApi:
         expression_values = {
             ':empty_list': [],
             ':new_stage': [stage_info],
-            ':updated_at': datetime.now(timezone.utc).isoformat()
+            ':updated_at': now
         }
         
         response = self.gateway.update_item(
@@ -489,7 +491,7 @@ class PipelineRunLogsWriteApi:
         """
         try:
             # Convert validated DTO to full model, preserving/setting timestamps
-            run_dict = run_data.model_dump()
+            run_dict = dict(run_data.as_item)
             now = datetime.now(timezone.utc)
             
             # Set created_at if not provided (for new items)
@@ -544,7 +546,7 @@ class PipelineRunLogsWriteApi:
         for run_dto in runs_data:
             try:
                 # Convert DTO to full model with timestamps
-                run_dict = run_dto.model_dump()
+                run_dict = dict(run_dto.as_item)
                 if 'created_at' not in run_dict:
                     run_dict['created_at'] = now
                 run_dict['updated_at'] = now
@@ -558,14 +560,13 @@ class PipelineRunLogsWriteApi:
             except Exception as e:
                 raise ValidationError(f"Invalid run data for {run_dto.run_id}: {e}") from e
         
-        # Batch write using context manager
-        with self.gateway.batch_writer() as batch:
-            for run_log in validated_runs:
-                # Ensure all datetime fields are in UTC before storage
-                run_log = self._ensure_utc_timestamps(run_log)
-                item = run_log.to_dynamodb_item()
-                batch.put_item(Item=item)
-                
+        # BatchWriteItem in chunks of 25 with UnprocessedItems backoff;
+        # all datetime fields are normalized to UTC before storage
+        self.gateway.batch_put_items([
+            self._ensure_utc_timestamps(run_log).to_dynamodb_item()
+            for run_log in validated_runs
+        ])
+        
         logger.info(f"Bulk upserted {len(validated_runs)} run logs")
         return validated_runs
 
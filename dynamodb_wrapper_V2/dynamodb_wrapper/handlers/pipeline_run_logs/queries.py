@@ -21,7 +21,7 @@ from ...models import PipelineRunLog, RunStatus, PipelineRunLogView, PipelineRun
 from ...utils import (
     build_projection_expression, 
     to_user_timezone,
-    build_model_key, build_gsi_key_condition, build_key_condition
+    build_model_key, build_model_key_positional, build_gsi_key_condition, build_key_condition
 )
 from ...core import create_table_gateway
 
@@ -50,6 +50,15 @@ class PipelineRunLogsReadApi:
             'start_time', 'end_time', 'duration_seconds', 
             'created_by', 'created_at', 'updated_at'
         ]
+        
+        # Projection matching PipelineRunLogView for single-item reads
+        self.view_projection = [
+            'run_id', 'pipeline_id', 'status', 'trigger_type',
+            'start_time', 'end_time', 'duration_seconds',
+            'total_records_processed', 'total_records_failed',
+            'error_message', 'retry_count', 'environment', 'pipeline_version',
+            'data_quality_passed', 'created_by', 'tags', 'created_at', 'updated_at'
+        ]
     
     def _convert_to_user_timezone(self, model_instance):
         """Convert UTC datetimes in model to user's configured timezone.
@@ -126,14 +135,7 @@ class PipelineRunLogsReadApi:
             proj_expr, expr_names = build_projection_expression(projection)
         else:
             # Use optimized projection for PipelineRunLogView
-            view_projection = [
-                'run_id', 'pipeline_id', 'status', 'trigger_type',
-                'start_time', 'end_time', 'duration_seconds',
-                'total_records_processed', 'total_records_failed',
-                'error_message', 'retry_count', 'environment', 'pipeline_version',
-                'data_quality_passed', 'created_by', 'tags', 'created_at', 'updated_at'
-            ]
-            proj_expr, expr_names = build_projection_expression(view_projection)
+            proj_expr, expr_names = build_projection_expression(self.view_projection)
             
         if proj_expr:
             get_kwargs['ProjectionExpression'] = proj_expr
@@ -146,6 +148,40 @@ class PipelineRunLogsReadApi:
             
         return self._convert_to_user_timezone(PipelineRunLogView.from_dynamodb_item(response['Item']))
 
+    def batch_get_by_ids(
+        self,
+        run_keys: List[Tuple[str, str]],
+        projection: Optional[List[str]] = None
+    ) -> List[PipelineRunLogView]:
+        """
+        Get multiple pipeline run logs by key in as few round trips as possible.
+        
+        DynamoDB Operation: BatchGetItem (100 keys per call, duplicates removed)
+        
+        Args:
+            run_keys: (run_id, pipeline_id) composite key pairs
+            projection: Fields to return (uses view projection if None)
+            
+        Returns:
+            List of PipelineRunLogView for the runs found, in no particular order
+            
+        Examples:
+            >>> runs = api.batch_get_by_ids([("run-1", "pipeline-456"), ("run-2", "pipeline-456")])
+        """
+        proj_expr, expr_names = build_projection_expression(projection or self.view_projection)
+        items = self.gateway.batch_get_items(
+            [
+                build_model_key_positional(PipelineRunLog, run_id, pipeline_id)
+                for run_id, pipeline_id in run_keys
+            ],
+            projection_expression=proj_expr,
+            expression_attribute_names=expr_names
+        )
+        return [
+            self._convert_to_user_timezone(PipelineRunLogView.from_dynamodb_item(item))
+            for item in items
+        ]
+
     def query_by_pipeline(
         self,
         pipeline_id: str,
@@ -64,9 +64,10 @@ class TableConfigWriteApi:
         """
         try:
             # Convert validated DTO to full model with auto-generated fields
-            table_dict = table_data.model_dump()
-            table_dict['created_at'] = datetime.now(timezone.utc)
-            table_dict['updated_at'] = datetime.now(timezone.utc)
+            table_dict = dict(table_data.as_item)
+            now = datetime.now(timezone.utc)
+            table_dict['created_at'] = now
+            table_dict['updated_at'] = now
             table = TableConfig(**table_dict)
         except Exception as e:
             raise ValidationError(f"Invalid table data: {e}") from e
@@ -264,7 +265,7 @@ class TableConfigWriteApi:
         """
         try:
             # Convert validated DTO to full model, preserving/setting timestamps
-            table_dict = table_data.model_dump()
+            table_dict = dict(table_data.as_item)
             now = datetime.now(timezone.utc)
             
             # Set created_at if not provided (for new items)
@@ -313,7 +314,7 @@ class TableConfigWriteApi:
         for table_dto in tables_data:
             try:
                 # Convert DTO to full model with timestamps
-                table_dict = table_dto.model_dump()
+                table_dict = dict(table_dto.as_item)
                 if 'created_at' not in table_dict:
                     table_dict['created_at'] = now
                 table_dict['updated_at'] = now
@@ -323,12 +324,9 @@ class TableConfigWriteApi:
             except Exception as e:
                 raise ValidationError(f"Invalid table data for {table_dto.table_id}: {e}") from e
         
-        # Batch write using context manager
-        with self.gateway.batch_writer() as batch:
-            for table in validated_tables:
-                item = table.to_dynamodb_item()
-                batch.put_item(Item=item)
-                
+        # BatchWriteItem in chunks of 25 with UnprocessedItems backoff
+        self.gateway.batch_put_items([table.to_dynamodb_item() for table in validated_tables])
+        
         logger.info(f"Bulk upserted {len(validated_tables)} table configs")
         return validated_tables
 
@@ -44,6 +44,14 @@ class TableConfigReadApi:
             'table_id', 'pipeline_id', 'table_name', 'table_type', 
             'data_format', 'location', 'is_active', 'created_at', 'updated_at'
         ]
+        
+        # Projection matching TableConfigView for single-item reads
+        self.view_projection = [
+            'table_id', 'pipeline_id', 'table_name', 'table_type', 'data_format',
+            'location', 'environment', 'is_active', 'description', 'tags',
+            'last_updated_data', 'record_count', 'size_bytes',
+            'created_at', 'updated_at', 'created_by', 'updated_by'
+        ]
 
     def get_by_id(
         self,
@@ -72,13 +80,7 @@ class TableConfigReadApi:
             proj_expr, expr_names = build_projection_expression(projection)
         else:
             # Use optimized projection for TableConfigView
-            view_projection = [
-                'table_id', 'pipeline_id', 'table_name', 'table_type', 'data_format',
-                'location', 'environment', 'is_active', 'description', 'tags',
-                'last_updated_data', 'record_count', 'size_bytes',
-                'created_at', 'updated_at', 'created_by', 'updated_by'
-            ]
-            proj_expr, expr_names = build_projection_expression(view_projection)
+            proj_expr, expr_names = build_projection_expression(self.view_projection)
             
         if proj_expr:
             get_kwargs['ProjectionExpression'] = proj_expr
@@ -91,6 +93,31 @@ class TableConfigReadApi:
             
         return TableConfigView.from_dynamodb_item(response['Item'])
 
+    def batch_get_by_ids(
+        self,
+        table_ids: List[str],
+        projection: Optional[List[str]] = None
+    ) -> List[TableConfigView]:
+        """
+        Get multiple table configurations by ID in as few round trips as possible.
+        
+        DynamoDB Operation: BatchGetItem (100 keys per call, duplicates removed)
+        
+        Args:
+            table_ids: Table identifiers
+            projection: Fields to return (uses view projection if None)
+            
+        Returns:
+            List of TableConfigView for the tables found, in no particular order
+        """
+        proj_expr, expr_names = build_projection_expression(projection or self.view_projection)
+        items = self.gateway.batch_get_items(
+            [{'table_id': table_id} for table_id in table_ids],
+            projection_expression=proj_expr,
+            expression_attribute_names=expr_names
+        )
+        return [TableConfigView.from_dynamodb_item(item) for item in items]
+
     def query_by_pipeline(
         self,
         pipeline_id: str,
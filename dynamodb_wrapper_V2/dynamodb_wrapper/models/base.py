@@ -92,14 +92,55 @@ class PipelineConfig(DateTimeMixin, BaseModel):
 - Common field definitions and utilities
 """
 
+import json
 import logging
+import zlib
 from datetime import datetime
+from decimal import Decimal
 from typing import Any, Dict
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 logger = logging.getLogger(__name__)
 
+# Compressed attributes below this JSON size are stored as plain maps, where
+# the zlib header would cost more than it saves
+COMPRESSION_THRESHOLD_BYTES = 256
+
+# JSON object key tagging a Decimal encoded as its exact string form
+_DECIMAL_TAG = '__decimal__'
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode DynamoDB Number values read back as Decimal without losing precision."""
+    if isinstance(obj, Decimal):
+        return {_DECIMAL_TAG: str(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    """Decode Decimals tagged by _json_default."""
+    if len(obj) == 1 and _DECIMAL_TAG in obj:
+        return Decimal(obj[_DECIMAL_TAG])
+    return obj
+
+
+def compress_attribute(value: Any) -> Any:
+    """Return value as zlib-compressed JSON bytes if it is large enough to benefit."""
+    encoded = json.dumps(value, separators=(',', ':'), default=_json_default).encode()
+    if len(encoded) <= COMPRESSION_THRESHOLD_BYTES:
+        return value
+    return zlib.compress(encoded, 6)
+
+
+def decompress_attribute(value: Any) -> Any:
+    """Reverse compress_attribute; values stored uncompressed pass through."""
+    # boto3 returns Binary attributes wrapped in boto3.dynamodb.types.Binary
+    raw = getattr(value, 'value', value)
+    if isinstance(raw, (bytes, bytearray)):
+        return json.loads(zlib.decompress(raw), object_hook=_json_object_hook)
+    return value
+
 
 class DateTimeMixin(BaseModel):
     """
@@ -116,6 +157,10 @@ class DateTimeMixin(BaseModel):
     - Error handling with descriptive messages
     """
     
+    # Core schemas are built on first use rather than at import time; the
+    # setting is inherited by every domain model and view using this mixin.
+    model_config = ConfigDict(defer_build=True)
+    
     @field_validator('*', mode='before')
     @classmethod
     def validate_datetime_fields(cls, v, info):
@@ -189,8 +234,16 @@ class DynamoDBMixin(BaseModel):
     - Decimal preservation for DynamoDB Number types
     - Recursive nested structure handling
     - Consistent datetime conversion (delegates to DateTimeMixin)
+    - Optional zlib compression of large map attributes listed in Meta.compressed_fields
     """
 
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def _compressed_fields(cls):
+        meta = getattr(cls, 'Meta', None)
+        return getattr(meta, 'compressed_fields', ())
+
     def to_dynamodb_item(self) -> Dict[str, Any]:
         """
         Convert model to DynamoDB-compatible item.
@@ -235,7 +288,13 @@ class DynamoDBMixin(BaseModel):
                 # All other types pass through unchanged
                 return obj
         
-        return convert_for_dynamodb(dumped_item)
+        item = convert_for_dynamodb(dumped_item)
+        
+        for field in self._compressed_fields():
+            if field in item:
+                item[field] = compress_attribute(item[field])
+        
+        return item
 
     @classmethod
     def from_dynamodb_item(cls, item: Dict[str, Any]):
@@ -281,6 +340,12 @@ class DynamoDBMixin(BaseModel):
                     # All other types (including Decimal) pass through unchanged
                     return obj
             
+            compressed = [field for field in cls._compressed_fields() if field in item]
+            if compressed:
+                item = dict(item)
+                for field in compressed:
+                    item[field] = decompress_attribute(item[field])
+            
             # Convert DynamoDB types to Python types
             converted_item = convert_dynamodb_types(item)
             
@@ -20,7 +20,7 @@ Each domain includes:
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -52,6 +52,9 @@ class TableMeta:
     partition_key: str
     sort_key: Optional[str] = None
     gsis: List[GSIDefinition] = []
+    # Map attributes stored zlib-compressed as Binary once their JSON exceeds
+    # COMPRESSION_THRESHOLD_BYTES (see DynamoDBMixin.to_dynamodb_item)
+    compressed_fields: Tuple[str, ...] = ()
     
     @classmethod
     def get_key_fields(cls) -> List[str]:
@@ -308,6 +311,9 @@ class DataQualityResult(BaseModel):
     Captures the outcome of data quality validations including
     expected vs actual values and detailed error information.
     """
+
+    model_config = ConfigDict(defer_build=True)
+
     check_name: str = Field(..., description="Name of the quality check")
     passed: bool = Field(..., description="Whether the check passed")
     expected_value: Optional[Any] = Field(None, description="Expected value")
@@ -395,6 +401,7 @@ class PipelineRunLog(DynamoDBMixin, DateTimeMixin, BaseModel):
         table_name = "pipeline_run_logs"
         partition_key = "run_id"
         sort_key = "pipeline_id"  # Based on composite key usage patterns found
+        compressed_fields = ("config_snapshot",)
         gsis = [
             GSIDefinition(
                 name="PipelineRunsIndex",
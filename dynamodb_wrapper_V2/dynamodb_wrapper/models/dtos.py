@@ -15,16 +15,50 @@ Key benefits:
 - Separate concerns from read models
 """
 
+import re
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Pattern, TypeVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 
 from .domain_models import RunStatus, LogLevel, DataQualityResult, TableType, DataFormat
 
+_UpsertT = TypeVar('_UpsertT', bound='_UpsertModel')
 
-class PipelineConfigUpsert(BaseModel):
+
+class _UpsertModel(BaseModel):
+    """Base for upsert DTOs that caches their serialized field dict.
+
+    Command handlers may convert the same DTO several times (retries, batch
+    writes, logging), so the ``model_dump`` result is computed once per
+    instance. Assigning a field or calling ``model_copy`` drops the cached
+    dict; in-place changes to nested dicts or lists are not detected. Callers
+    that modify the returned dict must copy it first.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @cached_property
+    def as_item(self) -> Dict[str, Any]:
+        """Validated fields as a plain dict, omitting unset (None) values."""
+        return self.model_dump(mode="python", exclude_none=True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self.__dict__.pop('as_item', None)
+
+    def model_copy(
+        self: _UpsertT, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> _UpsertT:
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop('as_item', None)
+        return copied
+
+
+class PipelineConfigUpsert(_UpsertModel):
     """
     Write-optimized DTO for pipeline configuration create/update operations.
     
@@ -40,6 +74,8 @@ class PipelineConfigUpsert(BaseModel):
     - Version validation
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     pipeline_id: str = Field(..., min_length=1, max_length=128, pattern=r'^[a-zA-Z0-9_-]+$',
                               description="Unique identifier for the pipeline (alphanumeric, underscore, hyphen only)")
     pipeline_name: str = Field(..., min_length=1, max_length=256, description="Human-readable name of the pipeline")
@@ -116,7 +152,7 @@ class PipelineConfigUpsert(BaseModel):
         return self
 
 
-class TableConfigUpsert(BaseModel):
+class TableConfigUpsert(_UpsertModel):
     """
     Write-optimized DTO for table configuration create/update operations.
     
@@ -132,6 +168,8 @@ class TableConfigUpsert(BaseModel):
     - Lifecycle management validation
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     table_id: str = Field(..., min_length=1, max_length=128, pattern=r'^[a-zA-Z0-9_-]+$',
                            description="Unique identifier for the table")
     pipeline_id: str = Field(..., min_length=1, max_length=128, pattern=r'^[a-zA-Z0-9_-]+$',
@@ -179,6 +217,14 @@ class TableConfigUpsert(BaseModel):
     created_by: Optional[str] = Field(None, max_length=128, description="User who created the configuration")
     updated_by: Optional[str] = Field(None, max_length=128, description="User who last updated the configuration")
     
+    # Compiled '*_format' validation rules, keyed like validation_rules
+    _validation_patterns: Dict[str, Pattern[str]] = PrivateAttr(default_factory=dict)
+    
+    @property
+    def validation_patterns(self) -> Dict[str, Pattern[str]]:
+        """Compiled regex for each string validation rule whose key ends with '_format'."""
+        return self._validation_patterns
+    
     @field_validator('environment')
     @classmethod
     def validate_environment(cls, v: str) -> str:
@@ -218,9 +264,22 @@ class TableConfigUpsert(BaseModel):
             if self.archive_after_days >= self.retention_days:
                 raise ValueError("Archive period must be less than retention period")
         return self
+    
+    @model_validator(mode='after')
+    def compile_format_rules(self) -> 'TableConfigUpsert':
+        """Compile '*_format' regex rules once so row-level checks reuse them."""
+        patterns = {}
+        for rule_name, rule in self.validation_rules.items():
+            if rule_name.endswith('_format') and isinstance(rule, str):
+                try:
+                    patterns[rule_name] = re.compile(rule)
+                except re.error as e:
+                    raise ValueError(f"Invalid regex for validation rule '{rule_name}': {e}") from e
+        self._validation_patterns = patterns
+        return self
 
 
-class PipelineRunLogUpsert(BaseModel):
+class PipelineRunLogUpsert(_UpsertModel):
     """
     Write-optimized DTO for pipeline run log create/update operations.
     
@@ -236,6 +295,8 @@ class PipelineRunLogUpsert(BaseModel):
     - Comprehensive error handling
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     run_id: str = Field(..., min_length=1, max_length=128, pattern=r'^[a-zA-Z0-9_-]+$',
                         description="Unique identifier for this pipeline run")
     pipeline_id: str = Field(..., min_length=1, max_length=128, pattern=r'^[a-zA-Z0-9_-]+$',
@@ -352,6 +413,8 @@ class PipelineRunLogStatusUpdate(BaseModel):
     Optimized for frequent write operations.
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     status: RunStatus = Field(..., description="New status")
     error_message: Optional[str] = Field(None, max_length=2000, description="Error message if failed")
     end_time: Optional[datetime] = Field(None, description="End time if completed")
@@ -16,12 +16,13 @@ Architecture Compliance:
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Type
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +33,14 @@ logger = logging.getLogger(__name__)
 # Python 3.9+ built-in timezone support
 from zoneinfo import ZoneInfo
 
+_ZERO_OFFSET = timedelta(0)
+
+
+@lru_cache(maxsize=512)
+def _get_zone(tz_name: str) -> ZoneInfo:
+    """Return a cached ZoneInfo for a timezone name."""
+    return ZoneInfo(tz_name)
+
 
 def to_utc(dt: Optional[datetime]) -> Optional[datetime]:
     """Convert datetime to UTC.
@@ -56,24 +65,40 @@ def to_utc(dt: Optional[datetime]) -> Optional[datetime]:
     """
     if dt is None:
         return None
+    
+    tz = dt.tzinfo
+    if tz is timezone.utc:
+        # Already in storage form - the common case
+        return dt
         
-    if dt.tzinfo is None:
+    if tz is None:
         # Naive datetime - assume UTC per architectural contract
         return dt.replace(tzinfo=timezone.utc)
+    
+    if dt.utcoffset() == _ZERO_OFFSET:
+        # Zero-offset zone (e.g. ZoneInfo('UTC')) - relabel instead of converting
+        return dt.replace(tzinfo=timezone.utc)
         
     # Timezone-aware datetime - convert to UTC
     return dt.astimezone(timezone.utc)
 
 
-def ensure_timezone_aware(dt: Optional[datetime], assumed_tz: Optional[str] = "UTC") -> Optional[datetime]:
+def ensure_timezone_aware(
+    dt: Optional[datetime],
+    assumed_tz: Optional[Union[tzinfo, str]] = None
+) -> Optional[datetime]:
     """Ensure datetime has timezone information.
     
     If the datetime is naive, adds the specified timezone. If already timezone-aware,
     returns unchanged.
     
+    Callers on hot paths should pass a pre-resolved ``tzinfo`` so no per-call
+    timezone lookup is needed; IANA name strings are still accepted.
+    
     Args:
         dt: Datetime to make timezone-aware
-        assumed_tz: Timezone to assume for naive datetimes (default: "UTC")
+        assumed_tz: Timezone to assume for naive datetimes, as a tzinfo or IANA
+            name (default: None, meaning UTC)
         
     Returns:
         Timezone-aware datetime, or None if input is None
@@ -84,7 +109,7 @@ def ensure_timezone_aware(dt: Optional[datetime], assumed_tz: Optional[str] = "U
         >>> ensure_timezone_aware(dt)  # -> 2024-01-01 10:00:00+00:00
         
         >>> # Naive datetime - add specific timezone
-        >>> ensure_timezone_aware(dt, "America/New_York")  # -> 2024-01-01 10:00:00-05:00
+        >>> ensure_timezone_aware(dt, ZoneInfo("America/New_York"))  # -> 2024-01-01 10:00:00-05:00
     """
     if dt is None:
         return None
@@ -93,10 +118,11 @@ def ensure_timezone_aware(dt: Optional[datetime], assumed_tz: Optional[str] = "U
         return dt  # Already timezone-aware
         
     # Add timezone to naive datetime
-    if assumed_tz == "UTC":
+    if assumed_tz is None or assumed_tz == "UTC":
         return dt.replace(tzinfo=timezone.utc)
-    else:
-        return dt.replace(tzinfo=ZoneInfo(assumed_tz))
+    if isinstance(assumed_tz, str):
+        assumed_tz = _get_zone(assumed_tz)
+    return dt.replace(tzinfo=assumed_tz)
 
 
 def to_user_timezone(dt: Optional[datetime], user_tz: Optional[str] = None) -> Optional[datetime]:
@@ -117,8 +143,7 @@ def to_user_timezone(dt: Optional[datetime], user_tz: Optional[str] = None) -> O
         return dt
         
     # Convert to user timezone
-    user_zone = ZoneInfo(user_tz)
-    return dt.astimezone(user_zone)
+    return dt.astimezone(_get_zone(user_tz))
 
 
 # =============================================================================
@@ -196,6 +221,29 @@ def build_filter_expression(filters: Dict[str, Any]):
         return filter_expr
 
 
+@lru_cache(maxsize=None)
+def _key_attribute(name: str):
+    """Return a cached boto3 ``Key`` for an attribute name.
+    
+    Key objects only hold the attribute name, so one instance per name can be
+    reused by every query instead of being rebuilt per call.
+    """
+    from boto3.dynamodb.conditions import Key
+    return Key(name)
+
+
+# Sort key condition builders: (Key, value, value2) -> condition
+_SORT_CONDITION_BUILDERS = {
+    "eq": lambda key, value, value2: key.eq(value),
+    "begins_with": lambda key, value, value2: key.begins_with(value),
+    "between": lambda key, value, value2: key.between(value, value2),
+    "gt": lambda key, value, value2: key.gt(value),
+    "gte": lambda key, value, value2: key.gte(value),
+    "lt": lambda key, value, value2: key.lt(value),
+    "lte": lambda key, value, value2: key.lte(value),
+}
+
+
 def build_key_condition(
     partition_key: str,
     partition_value: Any,
@@ -235,37 +283,23 @@ def build_key_condition(
     Raises:
         ValueError: For invalid sort_condition or missing sort_value2 for 'between'
     """
-    from boto3.dynamodb.conditions import Key
-    
     # Build partition key condition (always required)
-    condition = Key(partition_key).eq(partition_value)
+    condition = _key_attribute(partition_key).eq(partition_value)
     
     # Add sort key condition if provided
     if sort_key and sort_value is not None:
-        sort_key_obj = Key(sort_key)
+        sort_key_obj = _key_attribute(sort_key)
         
         # Apply the appropriate condition based on sort_condition
-        if sort_condition == "eq":
-            condition = condition & sort_key_obj.eq(sort_value)
-        elif sort_condition == "begins_with":
-            condition = condition & sort_key_obj.begins_with(sort_value)
-        elif sort_condition == "between":
-            if sort_value2 is None:
-                raise ValueError("'between' condition requires sort_value2 parameter")
-            condition = condition & sort_key_obj.between(sort_value, sort_value2)
-        elif sort_condition == "gt":
-            condition = condition & sort_key_obj.gt(sort_value)
-        elif sort_condition == "gte":
-            condition = condition & sort_key_obj.gte(sort_value)
-        elif sort_condition == "lt":
-            condition = condition & sort_key_obj.lt(sort_value)
-        elif sort_condition == "lte":
-            condition = condition & sort_key_obj.lte(sort_value)
-        else:
+        builder = _SORT_CONDITION_BUILDERS.get(sort_condition)
+        if builder is None:
             raise ValueError(
                 f"Unsupported sort_condition: {sort_condition}. "
                 f"Supported values: eq, begins_with, between, gt, gte, lt, lte"
             )
+        if sort_condition == "between" and sort_value2 is None:
+            raise ValueError("'between' condition requires sort_value2 parameter")
+        condition = condition & builder(sort_key_obj, sort_value, sort_value2)
     
     return condition
 
@@ -274,24 +308,110 @@ def build_key_condition(
 # Domain Model Introspection (Meta Class Only)
 # =============================================================================
 
-def extract_model_metadata(model_class: Type[BaseModel]) -> Dict[str, Any]:
+def _compile_key_builders(model_name: str, partition_key: str, sort_key: Optional[str]):
+    """Generate key builder/extractor functions specialised for one key schema.
+    
+    The Meta class is fixed per model, so the partition/sort branching of
+    build_model_key and build_model_key_condition can be resolved once here
+    instead of on every call. Field names and messages are embedded via repr().
+    
+    Returns:
+        Tuple of (key_builder, key_extractor, positional_key_builder).
+        key_builder(key_values) returns the DynamoDB key dict;
+        key_extractor(key_values) returns (partition_value, sort_value) with
+        sort_value None when absent; positional_key_builder(partition_value,
+        sort_value=None) builds the key dict without a kwargs mapping.
+    """
+    pk = repr(partition_key)
+    missing_pk = repr(f"Missing partition key '{partition_key}' for {model_name}")
+    
+    if sort_key:
+        sk = repr(sort_key)
+        missing_sk = repr(f"Missing sort key '{sort_key}' for {model_name}")
+        src = (
+            f"def key_builder(key_values):\n"
+            f"    try:\n"
+            f"        return {{{pk}: key_values[{pk}], {sk}: key_values[{sk}]}}\n"
+            f"    except KeyError:\n"
+            f"        if {pk} not in key_values:\n"
+            f"            raise ValueError({missing_pk}) from None\n"
+            f"        raise ValueError({missing_sk}) from None\n"
+            f"def key_extractor(key_values):\n"
+            f"    try:\n"
+            f"        return key_values[{pk}], key_values.get({sk})\n"
+            f"    except KeyError:\n"
+            f"        raise ValueError({missing_pk}) from None\n"
+            f"def positional_key_builder(partition_value, sort_value=None):\n"
+            f"    if sort_value is None:\n"
+            f"        raise ValueError({missing_sk})\n"
+            f"    return {{{pk}: partition_value, {sk}: sort_value}}\n"
+        )
+    else:
+        src = (
+            f"def key_builder(key_values):\n"
+            f"    try:\n"
+            f"        return {{{pk}: key_values[{pk}]}}\n"
+            f"    except KeyError:\n"
+            f"        raise ValueError({missing_pk}) from None\n"
+            f"def key_extractor(key_values):\n"
+            f"    try:\n"
+            f"        return key_values[{pk}], None\n"
+            f"    except KeyError:\n"
+            f"        raise ValueError({missing_pk}) from None\n"
+            f"def positional_key_builder(partition_value, sort_value=None):\n"
+            f"    return {{{pk}: partition_value}}\n"
+        )
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile(src, f"<keybuilder:{model_name}>", "exec"), namespace)
+    return namespace['key_builder'], namespace['key_extractor'], namespace['positional_key_builder']
+
+
+@dataclass(frozen=True)
+class ModelMetadata:
+    """Key schema and GSI metadata resolved from a model's Meta class."""
+    
+    __slots__ = (
+        'partition_key', 'sort_key', 'key_fields', 'available_fields',
+        'gsis', 'gsi_names', 'gsi_by_name', 'key_builder', 'key_extractor',
+        'positional_key_builder'
+    )
+    
+    partition_key: str
+    sort_key: Optional[str]
+    key_fields: Tuple[str, ...]
+    available_fields: Tuple[str, ...]
+    gsis: List[Any]
+    gsi_names: Tuple[str, ...]
+    gsi_by_name: Dict[str, Any]
+    key_builder: Callable[[Dict[str, Any]], Dict[str, Any]]
+    key_extractor: Callable[[Dict[str, Any]], Tuple[Any, Any]]
+    positional_key_builder: Callable[..., Dict[str, Any]]
+
+
+@lru_cache(maxsize=None)
+def extract_model_metadata(model_class: Type[BaseModel]) -> ModelMetadata:
     """Extract metadata from a Pydantic model's Meta class.
     
     This function requires domain models to have a proper Meta class definition.
     No fallback strategies - Meta class is the single source of truth.
     
+    Results are memoized per model class, so key/GSI builders on the query and
+    write paths do not re-read the Meta class on every call. The returned
+    ModelMetadata is frozen and shared between callers.
+    
     Args:
         model_class: Pydantic BaseModel class with Meta class
         
     Returns:
-        Dictionary with model metadata
+        ModelMetadata for the model class
         
     Raises:
         ValueError: If model doesn't have required Meta class attributes
         
     Example:
         >>> metadata = extract_model_metadata(SomeModelClass)
-        >>> metadata['partition_key']
+        >>> metadata.partition_key
         'entity_id'
     """
     if not hasattr(model_class, 'Meta'):
@@ -307,13 +427,20 @@ def extract_model_metadata(model_class: Type[BaseModel]) -> Dict[str, Any]:
     if not partition_key:
         raise ValueError(f"Model {model_class.__name__}.Meta must define partition_key")
     
-    return {
-        'partition_key': partition_key,
-        'sort_key': sort_key,
-        'key_fields': [k for k in [partition_key, sort_key] if k],
-        'available_fields': list(model_class.model_fields.keys()),
-        'gsis': gsis
-    }
+    key_builder, key_extractor, positional_key_builder = _compile_key_builders(model_class.__name__, partition_key, sort_key)
+    
+    return ModelMetadata(
+        partition_key=partition_key,
+        sort_key=sort_key,
+        key_fields=tuple(k for k in (partition_key, sort_key) if k),
+        available_fields=tuple(model_class.model_fields.keys()),
+        gsis=gsis,
+        gsi_names=tuple(gsi.name for gsi in gsis),
+        gsi_by_name={gsi.name: gsi for gsi in gsis},
+        key_builder=key_builder,
+        key_extractor=key_extractor,
+        positional_key_builder=positional_key_builder
+    )
 
 
 # =============================================================================
@@ -343,28 +470,36 @@ def build_model_key(model_class: Type[BaseModel], **key_values: Any) -> Dict[str
     Raises:
         ValueError: If model lacks Meta class, or required key fields are missing
     """
-    metadata = extract_model_metadata(model_class)
-    key = {}
-    
-    # Add partition key
-    partition_key = metadata['partition_key']
-    if not partition_key:
-        raise ValueError(f"Could not determine partition key for {model_class.__name__}")
-        
-    if partition_key in key_values:
-        key[partition_key] = key_values[partition_key]
-    else:
-        raise ValueError(f"Missing partition key '{partition_key}' for {model_class.__name__}")
+    return extract_model_metadata(model_class).key_builder(key_values)
+
+
+def build_model_key_positional(
+    model_class: Type[BaseModel],
+    partition_value: Any,
+    sort_value: Optional[Any] = None
+) -> Dict[str, Any]:
+    """Build a DynamoDB key from positional partition/sort values.
     
-    # Add sort key if defined
-    sort_key = metadata['sort_key']
-    if sort_key:
-        if sort_key in key_values:
-            key[sort_key] = key_values[sort_key]
-        else:
-            raise ValueError(f"Missing sort key '{sort_key}' for {model_class.__name__}")
+    Equivalent to build_model_key without building a kwargs mapping, for
+    per-item loops such as batch reads. Prefer build_model_key in
+    user-facing code where named fields read better.
     
-    return key
+    Args:
+        model_class: Pydantic BaseModel class with Meta class
+        partition_value: Value for the model's partition key
+        sort_value: Value for the model's sort key (required for composite keys)
+        
+    Returns:
+        DynamoDB key dictionary
+        
+    Examples:
+        >>> build_model_key_positional(CompositeModel, "primary-456", "sort-123")
+        {'primary_id': 'primary-456', 'sort_id': 'sort-123'}
+        
+    Raises:
+        ValueError: If model lacks Meta class, or sort_value is missing for a composite key
+    """
+    return extract_model_metadata(model_class).positional_key_builder(partition_value, sort_value)
 
 
 def build_model_key_condition(
@@ -394,26 +529,13 @@ def build_model_key_condition(
         ValueError: If model lacks Meta class, required key fields missing, or invalid sort_condition
     """
     metadata = extract_model_metadata(model_class)
-    
-    # Extract partition key
-    partition_key = metadata['partition_key']
-    if not partition_key:
-        raise ValueError(f"Could not determine partition key for {model_class.__name__}")
-        
-    if partition_key not in key_values:
-        raise ValueError(f"Missing partition key '{partition_key}' for {model_class.__name__}")
-    
-    partition_value = key_values[partition_key]
-    
-    # Extract sort key if present
-    sort_key = metadata['sort_key']
-    sort_value = key_values.get(sort_key) if sort_key else None
+    partition_value, sort_value = metadata.key_extractor(key_values)
     
     # Use the unified build_key_condition function
     return build_key_condition(
-        partition_key=partition_key,
+        partition_key=metadata.partition_key,
         partition_value=partition_value,
-        sort_key=sort_key,
+        sort_key=metadata.sort_key,
         sort_condition=sort_condition,
         sort_value=sort_value,
         sort_value2=sort_value2
@@ -445,22 +567,20 @@ def build_gsi_key_condition(
     metadata = extract_model_metadata(model_class)  # This validates Meta class exists
     
     # Find the GSI definition in the Meta class
-    gsi_def = None
-    for gsi in metadata['gsis']:
-        if gsi.name == gsi_name:
-            gsi_def = gsi
-            break
+    gsi_def = metadata.gsi_by_name.get(gsi_name)
     
-    if not gsi_def:
-        available_gsis = [gsi.name for gsi in metadata['gsis']]
-        raise ValueError(f"GSI '{gsi_name}' not found in {model_class.__name__}.Meta. Available GSIs: {available_gsis}")
+    if gsi_def is None:
+        raise ValueError(
+            f"GSI '{gsi_name}' not found in {model_class.__name__}.Meta. "
+            f"Available GSIs: {list(metadata.gsi_names)}"
+        )
     
     # Check for GSI partition key
-    if not key_values or gsi_def.partition_key not in key_values:
-        raise ValueError(f"Missing GSI partition key '{gsi_def.partition_key}' for GSI '{gsi_name}'")
-    
     gsi_partition_key = gsi_def.partition_key
-    gsi_partition_value = key_values[gsi_partition_key]
+    try:
+        gsi_partition_value = key_values[gsi_partition_key]
+    except KeyError:
+        raise ValueError(f"Missing GSI partition key '{gsi_partition_key}' for GSI '{gsi_name}'") from None
     
     # Check for GSI sort key
     gsi_sort_key = gsi_def.sort_key
@@ -480,46 +600,44 @@ def build_gsi_key_condition(
 # Convenience Functions for Common Operations
 # =============================================================================
 
-def get_model_key_fields(model_class: Type[BaseModel]) -> List[str]:
+def get_model_key_fields(model_class: Type[BaseModel]) -> Tuple[str, ...]:
     """Get DynamoDB item key field names from domain model Meta class.
     
-    Returns the list of fields that form the DynamoDB item key:
-    - For simple keys: [partition_key]
-    - For composite keys: [partition_key, sort_key]
+    Returns the fields that form the DynamoDB item key:
+    - For simple keys: (partition_key,)
+    - For composite keys: (partition_key, sort_key)
     
     Args:
         model_class: Pydantic BaseModel class with Meta class
         
     Returns:
-        List of DynamoDB item key field names (partition_key + sort_key if present)
+        Cached tuple of DynamoDB item key field names (partition_key + sort_key if present)
         
     Examples:
         >>> get_model_key_fields(PipelineConfig)  # Simple key
-        ['pipeline_id']
+        ('pipeline_id',)
         >>> get_model_key_fields(PipelineRunLog)  # Composite key  
-        ['run_id', 'pipeline_id']
+        ('run_id', 'pipeline_id')
         
     Raises:
         ValueError: If model lacks required Meta class
     """
-    metadata = extract_model_metadata(model_class)
-    return metadata['key_fields']
+    return extract_model_metadata(model_class).key_fields
 
 
-def get_model_gsi_names(model_class: Type[BaseModel]) -> List[str]:
+def get_model_gsi_names(model_class: Type[BaseModel]) -> Tuple[str, ...]:
     """Get GSI names from model Meta class.
     
     Args:
         model_class: Pydantic BaseModel class with Meta class
         
     Returns:
-        List of GSI names from model Meta class
+        Cached tuple of GSI names from model Meta class
         
     Raises:
         ValueError: If model doesn't have required Meta class
     """
-    metadata = extract_model_metadata(model_class)  # This handles Meta class validation
-    return [gsi.name for gsi in metadata['gsis']]
+    return extract_model_metadata(model_class).gsi_names  # This handles Meta class validation
 
 
 # =============================================================================
@@ -538,8 +656,10 @@ __all__ = [
     "build_key_condition",
     
     # Generic Model-Aware Operations
+    "ModelMetadata",
     "extract_model_metadata",
     "build_model_key",
+    "build_model_key_positional",
     "build_model_key_condition",
     "build_gsi_key_condition",
     "get_model_key_fields",
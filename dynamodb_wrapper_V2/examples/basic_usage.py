@@ -99,7 +99,6 @@ def main():
         },
         created_by="data_engineer"
     )
-    source_table = table_write_api.create_table(source_dto)
 
     # Destination table configuration
     dest_dto = TableConfigUpsert(
@@ -115,7 +114,10 @@ def main():
         },
         created_by="data_engineer"
     )
-    dest_table = table_write_api.create_table(dest_dto)
+
+    # Queue both tables and flush them in a single BatchWriteItem round trip
+    # (upsert semantics - batch writes cannot carry condition expressions)
+    source_table, dest_table = table_write_api.upsert_many([source_dto, dest_dto])
 
     print(f"Created source table: {source_table.table_id}")
     print(f"Created destination table: {dest_table.table_id}")
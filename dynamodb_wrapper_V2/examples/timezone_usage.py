@@ -14,12 +14,11 @@ from dynamodb_wrapper.utils import (
 )
 
 
-def demonstrate_basic_timezone_operations():
+def demonstrate_basic_timezone_operations(now_utc: datetime):
     """Demonstrate basic timezone operations with simplified functions."""
     print("=== Basic Timezone Operations ===")
     
-    # 1. Get current UTC time using Python's built-in
-    now_utc = datetime.now(timezone.utc)
+    # 1. Current UTC time, captured once by the caller
     print(f"Current UTC time: {now_utc}")
     
     # 2. Convert UTC to different user timezones
@@ -54,12 +53,11 @@ def demonstrate_architectural_contract():
     print("This enforces the architectural boundary that naive datetimes = UTC")
 
 
-def demonstrate_round_trip_conversion():
+def demonstrate_round_trip_conversion(utc_dt: datetime):
     """Demonstrate round-trip timezone conversion."""
     print("\n=== Round-Trip Timezone Conversion ===")
     
     # Start with UTC
-    utc_dt = datetime.now(timezone.utc)
     print(f"1. UTC datetime: {utc_dt}")
     
     # Convert to user timezone
@@ -81,9 +79,11 @@ def main():
     print("=" * 55)
     
     try:
-        demonstrate_basic_timezone_operations()
+        # Capture the current time once and share it across the demos
+        now_utc = datetime.now(timezone.utc)
+        demonstrate_basic_timezone_operations(now_utc)
         demonstrate_architectural_contract()
-        demonstrate_round_trip_conversion()
+        demonstrate_round_trip_conversion(now_utc)
         
         print("\n✅ All timezone examples completed successfully!")
         print("\nKey takeaways:")
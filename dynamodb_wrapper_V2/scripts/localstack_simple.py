@@ -6,17 +6,21 @@ This is a simpler version that just manages LocalStack container lifecycle
 without requiring additional dependencies.
 """
 
+import os
+import re
 import sys
 import time
+import shutil
 import subprocess
-import json
+import http.client
+from functools import lru_cache
 from pathlib import Path
 
 
-def run_command(cmd, capture_output=True):
+def run_command(cmd, capture_output=True, env=None):
     """Run a command and return the result."""
     try:
-        result = subprocess.run(cmd, capture_output=capture_output, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=capture_output, text=True, check=True, env=env)
         return result
     except subprocess.CalledProcessError as e:
         print(f"Command failed: {' '.join(cmd)}")
@@ -27,16 +31,41 @@ def run_command(cmd, capture_output=True):
         return None
 
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_COMPOSE_FILE = str(_PROJECT_ROOT / "docker-compose.localstack.yml")
+
+# Resolve executables once rather than walking $PATH on every call
+_DOCKER = shutil.which("docker") or "docker"
+
+
+@lru_cache(maxsize=1)
+def compose_command():
+    """Prefer the Go-native ``docker compose`` plugin over the legacy ``docker-compose``."""
+    try:
+        subprocess.run([_DOCKER, "compose", "version"], capture_output=True, check=True)
+        return [_DOCKER, "compose"]
+    except (OSError, subprocess.CalledProcessError):
+        return [shutil.which("docker-compose") or "docker-compose"]
+
+
+# Health probes reuse one keep-alive connection instead of spawning curl
+_HEALTH_CONN = http.client.HTTPConnection("localhost", 4566, timeout=2)
+
+# Matches a ready DynamoDB service without decoding the whole health body
+_DYNAMODB_READY = re.compile(rb'"dynamodb"\s*:\s*"(?:available|running)"')
+
+
 def check_localstack():
     """Check if LocalStack is running."""
     try:
-        result = run_command(["curl", "-s", "http://localhost:4566/_localstack/health"])
-        if result and result.stdout:
-            health = json.loads(result.stdout)
-            dynamodb_status = health.get("services", {}).get("dynamodb", "")
-            return dynamodb_status in ["available", "running"]
+        _HEALTH_CONN.request("GET", "/_localstack/health")
+        response = _HEALTH_CONN.getresponse()
+        body = response.read()
+        if response.status == 200:
+            return _DYNAMODB_READY.search(body) is not None
     except:
-        pass
+        # Drop the broken socket; the next request reconnects
+        _HEALTH_CONN.close()
     return False
 
 
@@ -44,13 +73,11 @@ def start_localstack():
     """Start LocalStack container."""
     print("🚀 Starting LocalStack...")
     
-    project_root = Path(__file__).parent.parent
-    compose_file = project_root / "docker-compose.localstack.yml"
-    
-    # Start container
-    result = run_command([
-        "docker-compose", "-f", str(compose_file), "up", "-d"
-    ], capture_output=False)
+    # Start container; compose v2 blocks on the healthcheck with --wait
+    up_cmd = [*compose_command(), "-f", _COMPOSE_FILE, "up", "-d"]
+    if compose_command()[-1] == "compose":
+        up_cmd.extend(["--wait", "--wait-timeout", "60"])
+    result = run_command(up_cmd, capture_output=False, env={**os.environ, "COMPOSE_PARALLEL_LIMIT": "10"})
     
     if result is None:
         print("❌ Failed to start LocalStack")
@@ -58,13 +85,20 @@ def start_localstack():
     
     # Wait for health
     print("⏳ Waiting for LocalStack to be ready...")
-    for i in range(30):
+    deadline = time.monotonic() + 60
+    delay = 0.1
+    attempt = 0
+    while True:
+        attempt += 1
         if check_localstack():
             print("✅ LocalStack is ready!")
             return True
-        time.sleep(2)
-        if i % 5 == 0:
-            print(f"   Still waiting... ({i+1}/30)")
+        if time.monotonic() + delay > deadline:
+            break
+        time.sleep(delay)
+        delay = min(delay * 1.5, 2.0)
+        if attempt % 10 == 0:
+            print(f"   Still waiting... (attempt {attempt})")
     
     print("❌ LocalStack failed to start")
     return False
@@ -74,11 +108,8 @@ def stop_localstack():
     """Stop LocalStack container."""
     print("🛑 Stopping LocalStack...")
     
-    project_root = Path(__file__).parent.parent
-    compose_file = project_root / "docker-compose.localstack.yml"
-    
     result = run_command([
-        "docker-compose", "-f", str(compose_file), "down"
+        *compose_command(), "-f", _COMPOSE_FILE, "down"
     ], capture_output=False)
     
     if result:
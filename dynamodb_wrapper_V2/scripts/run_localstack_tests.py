@@ -9,6 +9,7 @@ Usage:
     python scripts/run_localstack_tests.py [command] [options]
 
 Commands:
+    pull        - Pull the LocalStack image if it is not cached (CI prewarm)
     start       - Start LocalStack container
     stop        - Stop LocalStack container  
     restart     - Restart LocalStack container
@@ -20,36 +21,82 @@ Commands:
     clean       - Stop container and remove volumes
 """
 
+import os
+import re
 import sys
 import time
+import shutil
 import subprocess
-import requests
-import argparse
+import threading
 from pathlib import Path
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, List
+
+
+# Resolve executables once rather than walking $PATH on every call
+_DOCKER = shutil.which("docker") or "docker"
+
+# Match image and container_name in docker-compose.localstack.yml
+LOCALSTACK_IMAGE = "localstack/localstack:latest"
+LOCALSTACK_CONTAINER = "dynamodb_wrapper_localstack"
+
+# Pulls the DynamoDB status out of the health body without decoding every service
+_DYNAMODB_STATUS = re.compile(rb'"dynamodb"\s*:\s*"([^"]*)"')
+
+
+@lru_cache(maxsize=1)
+def compose_command() -> List[str]:
+    """Prefer the Go-native ``docker compose`` plugin over the legacy ``docker-compose``."""
+    try:
+        subprocess.run([_DOCKER, "compose", "version"], capture_output=True, check=True)
+        return [_DOCKER, "compose"]
+    except (OSError, subprocess.CalledProcessError):
+        return [shutil.which("docker-compose") or "docker-compose"]
 
 
 class LocalStackTestRunner:
     """Manages LocalStack container and test execution."""
     
     def __init__(self):
-        self.project_root = Path(__file__).parent.parent
+        self.project_root = Path(__file__).resolve().parent.parent
         self.compose_file = self.project_root / "docker-compose.localstack.yml"
+        self.compose_file_str = str(self.compose_file)
         self.localstack_url = "http://localhost:4566"
+        # Created on the first health probe; commands that only drive docker never import requests
+        self._session = None
+        # Set when a background start should give up before bringing the container up
+        self._abort_start = threading.Event()
+        
+    def run_command(
+        self,
+        cmd: List[str],
+        capture_output: bool = True,
+        check: bool = True,
+        env: Optional[Dict[str, str]] = None,
+        discard: bool = False
+    ) -> subprocess.CompletedProcess:
+        """Run a shell command with error handling.
         
-    def run_command(self, cmd: List[str], capture_output: bool = True, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a shell command with error handling."""
+        With ``discard=True`` stdout goes to /dev/null and stderr is only
+        kept for reporting failures, for commands whose output is never read.
+        """
         try:
             print(f"Running: {' '.join(cmd)}")
+            if discard:
+                streams = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+            else:
+                streams = {"capture_output": capture_output}
             result = subprocess.run(
                 cmd, 
-                capture_output=capture_output, 
                 text=True, 
                 check=check,
-                cwd=self.project_root
+                cwd=self.project_root,
+                env=env,
+                **streams
             )
             
-            if not capture_output:
+            if discard or not capture_output:
                 return result
                 
             if result.stdout:
@@ -71,35 +118,54 @@ class LocalStackTestRunner:
     
     def check_localstack_health(self) -> bool:
         """Check if LocalStack is running and healthy."""
+        import requests
+        
+        if self._session is None:
+            from requests.adapters import HTTPAdapter
+            
+            # Reuse one keep-alive connection for every health probe
+            self._session = requests.Session()
+            self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        
         try:
-            response = requests.get(f"{self.localstack_url}/_localstack/health", timeout=5)
+            response = self._session.get(f"{self.localstack_url}/_localstack/health", timeout=5)
             if response.status_code == 200:
-                health_data = response.json()
                 # Check if DynamoDB service is available
-                services = health_data.get("services", {})
-                dynamodb_status = services.get("dynamodb")
+                match = _DYNAMODB_STATUS.search(response.content)
+                if match:
+                    dynamodb_status = match.group(1).decode()
+                else:
+                    dynamodb_status = response.json().get("services", {}).get("dynamodb")
                 print(f"LocalStack health check - DynamoDB status: {dynamodb_status}")
                 return dynamodb_status in ["available", "running"]
             return False
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"LocalStack health check failed: {e}")
             return False
     
-    def wait_for_localstack(self, max_retries: int = 60, delay: float = 2.0) -> bool:
-        """Wait for LocalStack to be ready."""
+    def wait_for_localstack(self, timeout: float = 120.0, max_delay: float = 2.0) -> bool:
+        """Wait for LocalStack to be ready, polling with exponential backoff."""
         print("Waiting for LocalStack to be ready...")
         
-        for attempt in range(max_retries):
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        attempt = 0
+        while True:
+            attempt += 1
             if self.check_localstack_health():
                 print("✅ LocalStack is ready!")
                 return True
             
+            if time.monotonic() + delay > deadline:
+                break
+            
             if attempt < 5:
-                print(f"⏳ Attempt {attempt + 1}/{max_retries}: LocalStack starting...")
+                print(f"⏳ Attempt {attempt}: LocalStack starting...")
             elif attempt % 5 == 0:
-                print(f"⏳ Attempt {attempt + 1}/{max_retries}: Still waiting for LocalStack...")
+                print(f"⏳ Attempt {attempt}: Still waiting for LocalStack...")
             
             time.sleep(delay)
+            delay = min(delay * 1.5, max_delay)
         
         print("❌ LocalStack failed to start within the expected time")
         return False
@@ -107,24 +173,34 @@ class LocalStackTestRunner:
     def get_container_status(self) -> Optional[str]:
         """Get LocalStack container status."""
         try:
+            # One docker call: filter on the container_name set in the compose file
             result = self.run_command([
-                "docker-compose", "-f", str(self.compose_file), "ps", "-q"
-            ])
-            
-            if not result.stdout.strip():
-                return "stopped"
-            
-            container_id = result.stdout.strip()
-            result = self.run_command([
-                "docker", "inspect", container_id, 
-                "--format", "{{.State.Status}}"
+                _DOCKER, "ps",
+                "--filter", f"name=^{LOCALSTACK_CONTAINER}$",
+                "--format", "{{.State}}"
             ])
             
-            return result.stdout.strip()
+            return result.stdout.strip() or "stopped"
             
         except (subprocess.CalledProcessError, Exception):
             return "unknown"
     
+    def ensure_image(self) -> bool:
+        """Pull the LocalStack image unless it is already cached locally."""
+        inspect = self.run_command([
+            _DOCKER, "image", "inspect", LOCALSTACK_IMAGE
+        ], check=False, discard=True)
+        if inspect.returncode == 0:
+            return True
+        
+        print(f"📦 Pulling {LOCALSTACK_IMAGE}...")
+        try:
+            self.run_command([_DOCKER, "pull", LOCALSTACK_IMAGE], capture_output=False)
+            return True
+        except subprocess.CalledProcessError:
+            print(f"❌ Failed to pull {LOCALSTACK_IMAGE}")
+            return False
+    
     def start_localstack(self) -> bool:
         """Start LocalStack container."""
         print("🚀 Starting LocalStack container...")
@@ -134,11 +210,28 @@ class LocalStackTestRunner:
             print("✅ LocalStack is already running")
             return self.check_localstack_health()
         
+        if not self.ensure_image():
+            return False
+        
+        if self._abort_start.is_set():
+            print("⏹️  LocalStack start cancelled")
+            return False
+        
+        # The image is present, so compose v2 can skip the registry check, and
+        # --wait blocks on the compose healthcheck instead of us polling
+        up_cmd = [*compose_command(), "-f", self.compose_file_str, "up", "-d"]
+        if compose_command()[-1] == "compose":
+            up_cmd.extend(["--pull", "never", "--wait", "--wait-timeout", "120"])
+        
         try:
-            self.run_command([
-                "docker-compose", "-f", str(self.compose_file), "up", "-d"
-            ])
+            # Inherit the terminal so compose progress (and --wait) streams live
+            self.run_command(
+                up_cmd,
+                capture_output=False,
+                env={**os.environ, "COMPOSE_PARALLEL_LIMIT": "10", "DOCKER_BUILDKIT": "1"}
+            )
             
+            # After --wait this succeeds on its first probe; with compose v1 it polls
             return self.wait_for_localstack()
             
         except subprocess.CalledProcessError:
@@ -151,8 +244,8 @@ class LocalStackTestRunner:
         
         try:
             self.run_command([
-                "docker-compose", "-f", str(self.compose_file), "down"
-            ])
+                *compose_command(), "-f", self.compose_file_str, "down"
+            ], discard=True)
             print("✅ LocalStack container stopped")
             return True
             
@@ -180,15 +273,26 @@ class LocalStackTestRunner:
             print(f"   URL: {self.localstack_url}")
             print(f"   Health Check: {self.localstack_url}/_localstack/health")
     
-    def show_logs(self, tail: int = 50) -> None:
-        """Show LocalStack container logs."""
+    def show_logs(self, tail: int = 50, exec_process: bool = False) -> None:
+        """Show LocalStack container logs.
+        
+        With ``exec_process=True`` the compose CLI replaces this process
+        (for the ``logs`` command, where nothing runs afterwards).
+        """
         print(f"📝 LocalStack logs (last {tail} lines):")
         
+        cmd = [
+            *compose_command(), "-f", self.compose_file_str, 
+            "logs", "--tail", str(tail), "localstack"
+        ]
+        
+        if exec_process:
+            sys.stdout.flush()
+            os.chdir(self.project_root)
+            os.execvp(cmd[0], cmd)
+        
         try:
-            self.run_command([
-                "docker-compose", "-f", str(self.compose_file), 
-                "logs", "--tail", str(tail), "localstack"
-            ], capture_output=False)
+            self.run_command(cmd, capture_output=False)
         except subprocess.CalledProcessError:
             print("❌ Failed to retrieve logs")
     
@@ -198,14 +302,14 @@ class LocalStackTestRunner:
         
         try:
             self.run_command([
-                "docker-compose", "-f", str(self.compose_file), 
+                *compose_command(), "-f", self.compose_file_str, 
                 "down", "-v", "--remove-orphans"
-            ])
+            ], discard=True)
             
             # Also remove any dangling volumes
             self.run_command([
-                "docker", "volume", "prune", "-f"
-            ], check=False)
+                _DOCKER, "volume", "prune", "-f"
+            ], check=False, discard=True)
             
             print("✅ LocalStack cleanup completed")
             return True
@@ -244,7 +348,7 @@ class LocalStackTestRunner:
             if not self.start_localstack():
                 return False
         
-        cmd = ["uv", "run", "pytest", "tests/integration/"]
+        cmd = ["uv", "run", "pytest", "tests/integration/", "--integration"]
         
         if verbose:
             cmd.append("-v")
@@ -264,16 +368,64 @@ class LocalStackTestRunner:
         """Run both unit and integration tests."""
         print("🧪 Running all tests...")
         
-        # Run unit tests first (faster feedback)
+        # Unit tests don't need LocalStack, so bring it up in the background meanwhile
+        self._abort_start.clear()
+        pool = ThreadPoolExecutor(max_workers=1)
+        started = pool.submit(self.start_localstack)
+        
         if not self.run_unit_tests(verbose, pattern):
+            # The start is already running, so Future.cancel() cannot stop it:
+            # flag it to skip `compose up` and tear down a container mid-start,
+            # which makes `up --wait` return instead of blocking for 120s
+            self._abort_start.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            if not started.done():
+                self.stop_localstack()
+            return False
+        
+        pool.shutdown(wait=False)
+        if not started.result():
             return False
         
         # Then run integration tests
         return self.run_integration_tests(verbose, pattern)
 
 
-def main():
-    """Main entry point."""
+COMMANDS = ["pull", "start", "stop", "restart", "test", "test-unit", "test-all", "status", "logs", "clean"]
+
+
+def parse_args(argv: List[str]) -> Dict[str, object]:
+    """Parse the command line without argparse for the common cases.
+    
+    Help requests and anything unrecognised are handed to argparse, which
+    prints usage (and exits) exactly as before.
+    """
+    args = {"command": None, "verbose": False, "pattern": None, "tail": 50}
+    rest = iter(argv)
+    try:
+        for arg in rest:
+            if arg in ("-v", "--verbose"):
+                args["verbose"] = True
+            elif arg in ("-k", "--pattern"):
+                args["pattern"] = next(rest)
+            elif arg == "--tail":
+                args["tail"] = int(next(rest))
+            elif arg in COMMANDS and args["command"] is None:
+                args["command"] = arg
+            else:
+                raise ValueError(arg)
+    except (StopIteration, ValueError):
+        args["command"] = None
+    
+    if args["command"] is None:
+        return vars(_argparse_args(argv))
+    return args
+
+
+def _argparse_args(argv: List[str]):
+    """Full argparse parser, used for --help and malformed command lines."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="LocalStack Test Runner for DynamoDB Wrapper V2",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -282,7 +434,7 @@ def main():
     
     parser.add_argument(
         "command",
-        choices=["start", "stop", "restart", "test", "test-unit", "test-all", "status", "logs", "clean"],
+        choices=COMMANDS,
         help="Command to execute"
     )
     
@@ -304,38 +456,32 @@ def main():
         help="Number of log lines to show (default: 50)"
     )
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    """Main entry point."""
+    args = parse_args(sys.argv[1:])
+    command = args["command"]
+    verbose, pattern = args["verbose"], args["pattern"]
     
     runner = LocalStackTestRunner()
-    success = True
+    dispatch = {
+        "pull": runner.ensure_image,
+        "start": runner.start_localstack,
+        "stop": runner.stop_localstack,
+        "restart": runner.restart_localstack,
+        "test": lambda: runner.run_integration_tests(verbose, pattern),
+        "test-unit": lambda: runner.run_unit_tests(verbose, pattern),
+        "test-all": lambda: runner.run_all_tests(verbose, pattern),
+        "status": runner.show_status,
+        "logs": lambda: runner.show_logs(args["tail"], exec_process=True),
+        "clean": runner.clean_localstack,
+    }
     
     try:
-        if args.command == "start":
-            success = runner.start_localstack()
-            
-        elif args.command == "stop":
-            success = runner.stop_localstack()
-            
-        elif args.command == "restart":
-            success = runner.restart_localstack()
-            
-        elif args.command == "test":
-            success = runner.run_integration_tests(args.verbose, args.pattern)
-            
-        elif args.command == "test-unit":
-            success = runner.run_unit_tests(args.verbose, args.pattern)
-            
-        elif args.command == "test-all":
-            success = runner.run_all_tests(args.verbose, args.pattern)
-            
-        elif args.command == "status":
-            runner.show_status()
-            
-        elif args.command == "logs":
-            runner.show_logs(args.tail)
-            
-        elif args.command == "clean":
-            success = runner.clean_localstack()
+        # status and logs only display output and always succeed
+        success = dispatch[command]() is not False
     
     except KeyboardInterrupt:
         print("\n🛑 Operation cancelled by user")
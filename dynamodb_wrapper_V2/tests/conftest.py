@@ -4,34 +4,74 @@ Test configuration and fixtures for DynamoDB Wrapper V2 CQRS architecture.
 Provides common fixtures for testing the V2 CQRS APIs with mocked DynamoDB resources.
 """
 
+import os
 import sys
 import time
 import subprocess
-import requests
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator
+from types import MappingProxyType
 
 # Add parent directory to path so we can import dynamodb_wrapper
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import boto3
 import pytest
-from moto import mock_aws
 
-from dynamodb_wrapper import (
-    DynamoDBConfig,
-    PipelineConfigReadApi,
-    PipelineConfigWriteApi,
-    TableConfigReadApi,
-    TableConfigWriteApi,
-    PipelineRunLogsReadApi,
-    PipelineRunLogsWriteApi,
-)
+from tests.helpers.seeding import truncate_table
+
+# dynamodb_wrapper (and with it boto3) is imported inside the fixtures that
+# use it, so runs that never request a DynamoDB fixture don't pay for it.
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_clients():
+    """Drop DynamoDB clients shared through the config so tests don't reuse each other's."""
+    yield
+    config_module = sys.modules.get("dynamodb_wrapper.config.config")
+    if config_module is not None:
+        config_module._shared_resources.clear()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration", action="store_true", default=False,
+        help="run LocalStack integration tests (starts LocalStack via docker-compose if needed)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: LocalStack integration tests (need --integration)")
+
+
+def _integration_requested(config) -> bool:
+    """Return True when this run includes the LocalStack integration tests."""
+    return config.getoption("--integration") or config.getoption("markexpr") == "integration"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that use LocalStack fixtures unless integration tests were asked for.
+
+    Skipped tests never set up their fixtures, so Docker is not touched.
+    """
+    if _integration_requested(config):
+        return
+
+    skip_integration = pytest.mark.skip(reason="LocalStack integration test; run with --integration")
+    for item in items:
+        if any(name.startswith("localstack_") for name in getattr(item, "fixturenames", ())):
+            item.add_marker(skip_integration)
+
+
+# pytest-xdist worker id; tables are prefixed with it so parallel workers never share one
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
 
 
 @pytest.fixture
 def dynamodb_config():
     """DynamoDB configuration for testing."""
+    from dynamodb_wrapper import DynamoDBConfig
+
     return DynamoDBConfig(
         aws_access_key_id="test_key",
         aws_secret_access_key="test_secret",
@@ -42,50 +82,455 @@ def dynamodb_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_dynamodb_config():
     """DynamoDB configuration for mocked testing."""
+    from dynamodb_wrapper import DynamoDBConfig
+
     return DynamoDBConfig(
         aws_access_key_id="test_key",
         aws_secret_access_key="test_secret",
         region_name="us-east-1",
         endpoint_url=None,  # Use default AWS endpoint for moto
-        environment="test",
-        table_prefix="test_"
+        environment="dev",
+        table_prefix=f"test_{XDIST_WORKER}"
     )
 
 
-@pytest.fixture
-def mock_dynamodb_resource():
-    """Mock DynamoDB resource."""
+@pytest.fixture(scope="session")
+def _boto_session():
+    """One boto3 session for every test resource, so service models load once."""
+    # Imported here so collection does not pay for boto3/moto unless a test needs
+    # them. moto must be imported before the session is built: it installs its
+    # botocore hooks at import and sessions only pick up hooks present then.
+    import boto3
+    import moto  # noqa: F401
+
+    return boto3.Session(
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1"
+    )
+
+
+# create_table arguments (minus TableName) for the moto tables, built once
+_PIPELINE_CONFIG_TABLE_SCHEMA = {
+    'KeySchema': [
+        {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'}
+    ],
+    'AttributeDefinitions': [
+        {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
+        {'AttributeName': 'is_active', 'AttributeType': 'S'},
+        {'AttributeName': 'environment', 'AttributeType': 'S'},
+        {'AttributeName': 'updated_at', 'AttributeType': 'S'},
+        {'AttributeName': 'created_at', 'AttributeType': 'S'}
+    ],
+    'GlobalSecondaryIndexes': [
+        {
+            'IndexName': 'ActivePipelinesIndex',
+            'KeySchema': [
+                {'AttributeName': 'is_active', 'KeyType': 'HASH'},
+                {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        },
+        {
+            'IndexName': 'EnvironmentIndex',
+            'KeySchema': [
+                {'AttributeName': 'environment', 'KeyType': 'HASH'},
+                {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }
+    ],
+    'BillingMode': 'PAY_PER_REQUEST'
+}
+
+_TABLE_CONFIG_TABLE_SCHEMA = {
+    'KeySchema': [
+        {'AttributeName': 'table_id', 'KeyType': 'HASH'}
+    ],
+    'AttributeDefinitions': [
+        {'AttributeName': 'table_id', 'AttributeType': 'S'},
+        {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
+        {'AttributeName': 'table_type', 'AttributeType': 'S'},
+        {'AttributeName': 'created_at', 'AttributeType': 'S'}
+    ],
+    'GlobalSecondaryIndexes': [
+        {
+            'IndexName': 'PipelineIndex',
+            'KeySchema': [
+                {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        },
+        {
+            'IndexName': 'TypeIndex',
+            'KeySchema': [
+                {'AttributeName': 'table_type', 'KeyType': 'HASH'},
+                {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }
+    ],
+    'BillingMode': 'PAY_PER_REQUEST'
+}
+
+_PIPELINE_RUN_LOGS_TABLE_SCHEMA = {
+    'KeySchema': [
+        {'AttributeName': 'run_id', 'KeyType': 'HASH'}
+    ],
+    'AttributeDefinitions': [
+        {'AttributeName': 'run_id', 'AttributeType': 'S'},
+        {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
+        {'AttributeName': 'status', 'AttributeType': 'S'},
+        {'AttributeName': 'created_at', 'AttributeType': 'S'}
+    ],
+    'GlobalSecondaryIndexes': [
+        {
+            'IndexName': 'PipelineIndex',
+            'KeySchema': [
+                {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        },
+        {
+            'IndexName': 'StatusIndex',
+            'KeySchema': [
+                {'AttributeName': 'status', 'KeyType': 'HASH'},
+                {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+            ],
+            'Projection': {'ProjectionType': 'ALL'}
+        }
+    ],
+    'BillingMode': 'PAY_PER_REQUEST'
+}
+
+
+@pytest.fixture(scope="module")
+def mock_dynamodb_resource(_boto_session):
+    """Mock DynamoDB resource shared by every test in a module.
+
+    The moto mock stays active until the module finishes, so tables are
+    created once per module and emptied between tests instead.
+    """
+    from moto import mock_aws
+
     with mock_aws():
-        yield boto3.resource('dynamodb', region_name='us-east-1')
+        yield _boto_session.resource('dynamodb')
+
+
+@pytest.fixture(scope="module")
+def _module_pipeline_config_table(mock_dynamodb_resource, mock_dynamodb_config):
+    """Create pipeline_config table once per module."""
+    return mock_dynamodb_resource.create_table(
+        TableName=mock_dynamodb_config.get_table_name('pipeline_config'),
+        **_PIPELINE_CONFIG_TABLE_SCHEMA
+    )
+
+
+@pytest.fixture(scope="module")
+def _module_table_config_table(mock_dynamodb_resource, mock_dynamodb_config):
+    """Create table_config table once per module."""
+    return mock_dynamodb_resource.create_table(
+        TableName=mock_dynamodb_config.get_table_name('table_config'),
+        **_TABLE_CONFIG_TABLE_SCHEMA
+    )
+
+
+@pytest.fixture(scope="module")
+def _module_pipeline_run_logs_table(mock_dynamodb_resource, mock_dynamodb_config):
+    """Create pipeline_run_logs table once per module."""
+    return mock_dynamodb_resource.create_table(
+        TableName=mock_dynamodb_config.get_table_name('pipeline_run_logs'),
+        **_PIPELINE_RUN_LOGS_TABLE_SCHEMA
+    )
+
+
+@pytest.fixture
+def pipeline_config_table(_module_pipeline_config_table):
+    """Empty pipeline_config table for testing."""
+    return truncate_table(_module_pipeline_config_table)
+
+
+@pytest.fixture
+def table_config_table(_module_table_config_table):
+    """Empty table_config table for testing."""
+    return truncate_table(_module_table_config_table)
+
+
+@pytest.fixture
+def pipeline_run_logs_table(_module_pipeline_run_logs_table):
+    """Empty pipeline_run_logs table for testing."""
+    return truncate_table(_module_pipeline_run_logs_table)
+
+
+@pytest.fixture
+def all_tables(pipeline_config_table, table_config_table, pipeline_run_logs_table):
+    """Create all DynamoDB tables needed for comprehensive testing."""
+    return {
+        'pipeline_config': pipeline_config_table,
+        'table_config': table_config_table,
+        'pipeline_run_logs': pipeline_run_logs_table
+    }
+
+
+# CQRS API Fixtures
+
+@pytest.fixture(scope="module")
+def _api_cache():
+    """API instances shared by the tests of one module (the moto mock's lifetime)."""
+    return {}
+
+
+def _cached_api(cache, api_class, config):
+    """Return the cached API for this class and connection settings, creating it once."""
+    key = (api_class, config.endpoint_url, config.region_name, config.table_prefix)
+    if key not in cache:
+        cache[key] = api_class(config)
+    return cache[key]
+
+
+@pytest.fixture
+def api_factory(mock_dynamodb_config, all_tables, _api_cache):
+    """Factory returning the module's cached API instance for an API class, with mocked DynamoDB.
+
+    Usage: ``api_factory(PipelineConfigReadApi)``.
+    """
+    return lambda api_class: _cached_api(_api_cache, api_class, mock_dynamodb_config)
+
+
+# Sample Data Fixtures
+
+# Built once and read-only; tests that need to modify one take dict(sample_...)
+_SAMPLE_PIPELINE = MappingProxyType({
+    "pipeline_id": "test-pipeline-1",
+    "pipeline_name": "Test Data Pipeline",
+    "description": "A test pipeline for unit testing",
+    "source_type": "s3",
+    "destination_type": "warehouse",
+    "is_active": True,
+    "environment": "test",
+    "created_by": "test-user"
+})
+
+_SAMPLE_TABLE = MappingProxyType({
+    "table_id": "test-table-1",
+    "pipeline_id": "test-pipeline-1",
+    "table_name": "test_table",
+    "table_type": "source",
+    "data_format": "parquet",
+    "location": "s3://test-bucket/data/",
+    "is_active": True,
+    "environment": "test",
+    "created_by": "test-user"
+})
+
+_SAMPLE_RUN_LOG = MappingProxyType({
+    "run_id": "test-run-1",
+    "pipeline_id": "test-pipeline-1",
+    "status": "running",
+    "trigger_type": "manual",
+    "environment": "test",
+    "created_by": "test-user"
+})
+
+
+@pytest.fixture(scope="session")
+def sample_pipeline_data():
+    """Sample pipeline configuration data for testing (read-only)."""
+    return _SAMPLE_PIPELINE
+
+
+@pytest.fixture(scope="session")
+def sample_table_data():
+    """Sample table configuration data for testing (read-only)."""
+    return _SAMPLE_TABLE
+
+
+@pytest.fixture(scope="session")
+def sample_run_log_data():
+    """Sample pipeline run log data for testing (read-only)."""
+    return _SAMPLE_RUN_LOG
 
 
 @pytest.fixture
-def pipeline_config_table(mock_dynamodb_resource):
-    """Create pipeline_config table for testing."""
-    table = mock_dynamodb_resource.create_table(
-        TableName='test_pipeline_config',
-        KeySchema=[
+def pipeline_id_factory():
+    """Factory for unique pipeline IDs, for tests that must not share one."""
+    return lambda: f"test-pipeline-{uuid.uuid4()}"
+
+
+# ===== LocalStack Integration Test Fixtures =====
+
+LOCALSTACK_HEALTH_URL = "http://localhost:4566/_localstack/health"
+
+# DynamoDB emulator behind the localstack_* fixtures, chosen with DDB_BACKEND:
+# localstack (default), ddb-local (DynamoDB Local, in memory) or dynalite.
+# Maps to (docker-compose service, endpoint URL).
+_DDB_BACKENDS = {
+    "localstack": ("localstack", "http://localhost:4566"),
+    "ddb-local": ("dynamodb-local", "http://localhost:8000"),
+    "dynalite": ("dynalite", "http://localhost:4567"),
+}
+DDB_BACKEND = os.environ.get("DDB_BACKEND", "localstack")
+if DDB_BACKEND not in _DDB_BACKENDS:
+    raise ValueError(f"DDB_BACKEND must be one of {sorted(_DDB_BACKENDS)}, got {DDB_BACKEND!r}")
+_DDB_SERVICE, DDB_ENDPOINT_URL = _DDB_BACKENDS[DDB_BACKEND]
+
+_COMPOSE_FILE = Path(__file__).parent.parent / "docker-compose.localstack.yml"
+
+# Set on the process that started the emulator, so only that process stops it
+_STARTED_BACKEND = pytest.StashKey[bool]()
+# Why the emulator could not be started, reported by the localstack_* fixtures
+_BACKEND_START_ERROR = pytest.StashKey[str]()
+
+
+def pytest_sessionstart(session):
+    """Start the DynamoDB emulator (LocalStack by default) for integration runs.
+
+    Runs on the pytest-xdist controller, or the only process without xdist,
+    before any worker starts; workers never start or stop the emulator. An
+    emulator that is already running is reused and left running.
+    """
+    config = session.config
+    if hasattr(config, "workerinput") or not _integration_requested(config):
+        return
+
+    import requests
+
+    with requests.Session() as http:
+        if _backend_ready(http):
+            print(f"{DDB_BACKEND} is already running")
+            return
+
+    print(f"Starting {DDB_BACKEND} container...")
+    try:
+        subprocess.run([
+            "docker-compose",
+            "-f", str(_COMPOSE_FILE),
+            "up", "-d", _DDB_SERVICE
+        ], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        # Fail the integration tests, not the whole session
+        config.stash[_BACKEND_START_ERROR] = f"Failed to start {DDB_BACKEND} container: {e}"
+        return
+    config.stash[_STARTED_BACKEND] = True
+
+
+def pytest_sessionfinish(session):
+    """Stop the DynamoDB emulator if pytest_sessionstart started it."""
+    if not session.config.stash.get(_STARTED_BACKEND, False):
+        return
+
+    print(f"Stopping {DDB_BACKEND} container...")
+    try:
+        subprocess.run([
+            "docker-compose",
+            "-f", str(_COMPOSE_FILE),
+            "down"
+        ], check=True, capture_output=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Warning: Failed to stop {DDB_BACKEND} container: {e}")
+
+
+@pytest.fixture(scope="session")
+def localstack_container(request) -> None:
+    """Wait until the DynamoDB emulator started by pytest_sessionstart accepts requests."""
+    import requests
+
+    start_error = request.config.stash.get(_BACKEND_START_ERROR, None)
+    if start_error:
+        raise RuntimeError(start_error)
+
+    # One keep-alive session serves every health probe
+    with requests.Session() as session:
+        _wait_for_localstack(session)
+
+
+def _backend_ready(session) -> bool:
+    """Return True once the configured DynamoDB emulator accepts requests."""
+    import requests
+
+    try:
+        if DDB_BACKEND == "localstack":
+            response = session.get(LOCALSTACK_HEALTH_URL, timeout=2)
+            return (
+                response.status_code == 200
+                and response.json().get("services", {}).get("dynamodb") in ("available", "running")
+            )
+        # DynamoDB Local and dynalite have no health endpoint; any HTTP reply means up
+        session.get(DDB_ENDPOINT_URL, timeout=2)
+        return True
+    except (requests.RequestException, ValueError):
+        return False
+
+
+def _wait_for_localstack(session, timeout: float = 60.0, max_delay: float = 5.0) -> None:
+    """Wait for the DynamoDB emulator to be available, polling with exponential backoff."""
+    print(f"Waiting for {DDB_BACKEND} to be ready...")
+    
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    attempt = 0
+    while True:
+        attempt += 1
+        if _backend_ready(session):
+            print(f"{DDB_BACKEND} DynamoDB is ready!")
+            return
+        
+        if time.monotonic() + delay > deadline:
+            break
+        print(f"Attempt {attempt}: {DDB_BACKEND} not ready yet...")
+        time.sleep(delay)
+        delay = min(delay * 1.5, max_delay)
+    
+    raise RuntimeError(f"{DDB_BACKEND} failed to start within the expected time")
+
+
+@pytest.fixture(scope="session")
+def localstack_config(localstack_container):
+    """DynamoDB configuration for integration testing against the DDB_BACKEND emulator."""
+    from dynamodb_wrapper import DynamoDBConfig
+
+    return DynamoDBConfig(
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+        endpoint_url=DDB_ENDPOINT_URL,
+        environment="dev",
+        table_prefix=f"integration_{XDIST_WORKER}"
+    )
+
+
+@pytest.fixture(scope="session")
+def localstack_dynamodb_resource(localstack_container, _boto_session):
+    """DynamoDB resource for integration testing against the DDB_BACKEND emulator."""
+    return _boto_session.resource('dynamodb', endpoint_url=DDB_ENDPOINT_URL)
+
+
+# create_table arguments (minus TableName) for the LocalStack tables, keyed by base table name
+_LOCALSTACK_TABLE_SCHEMAS = {
+    'pipeline_config': {
+        'KeySchema': [
             {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'}
         ],
-        AttributeDefinitions=[
+        'AttributeDefinitions': [
             {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
             {'AttributeName': 'is_active', 'AttributeType': 'S'},
             {'AttributeName': 'environment', 'AttributeType': 'S'},
             {'AttributeName': 'updated_at', 'AttributeType': 'S'},
             {'AttributeName': 'created_at', 'AttributeType': 'S'}
         ],
-        GlobalSecondaryIndexes=[
+        'GlobalSecondaryIndexes': [
             {
                 'IndexName': 'ActivePipelinesIndex',
                 'KeySchema': [
                     {'AttributeName': 'is_active', 'KeyType': 'HASH'},
                     {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
                 ],
-                'Projection': {'ProjectionType': 'ALL'},
-                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+                'Projection': {'ProjectionType': 'ALL'}
             },
             {
                 'IndexName': 'EnvironmentIndex',
@@ -93,39 +538,29 @@ def pipeline_config_table(mock_dynamodb_resource):
                     {'AttributeName': 'environment', 'KeyType': 'HASH'},
                     {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
                 ],
-                'Projection': {'ProjectionType': 'ALL'},
-                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+                'Projection': {'ProjectionType': 'ALL'}
             }
         ],
-        BillingMode='PROVISIONED',
-        ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-    )
-    return table
-
-
-@pytest.fixture
-def table_config_table(mock_dynamodb_resource):
-    """Create table_config table for testing."""
-    table = mock_dynamodb_resource.create_table(
-        TableName='test_table_config',
-        KeySchema=[
+        'BillingMode': 'PAY_PER_REQUEST'
+    },
+    'table_config': {
+        'KeySchema': [
             {'AttributeName': 'table_id', 'KeyType': 'HASH'}
         ],
-        AttributeDefinitions=[
+        'AttributeDefinitions': [
             {'AttributeName': 'table_id', 'AttributeType': 'S'},
             {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
             {'AttributeName': 'table_type', 'AttributeType': 'S'},
             {'AttributeName': 'created_at', 'AttributeType': 'S'}
         ],
-        GlobalSecondaryIndexes=[
+        'GlobalSecondaryIndexes': [
             {
-                'IndexName': 'PipelineIndex',
+                'IndexName': 'PipelineTablesIndex',
                 'KeySchema': [
                     {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
                     {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
                 ],
-                'Projection': {'ProjectionType': 'ALL'},
-                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+                'Projection': {'ProjectionType': 'ALL'}
             },
             {
                 'IndexName': 'TypeIndex',
@@ -133,39 +568,30 @@ def table_config_table(mock_dynamodb_resource):
                     {'AttributeName': 'table_type', 'KeyType': 'HASH'},
                     {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
                 ],
-                'Projection': {'ProjectionType': 'ALL'},
-                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+                'Projection': {'ProjectionType': 'ALL'}
             }
         ],
-        BillingMode='PROVISIONED',
-        ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-    )
-    return table
-
-
-@pytest.fixture
-def pipeline_run_logs_table(mock_dynamodb_resource):
-    """Create pipeline_run_logs table for testing."""
-    table = mock_dynamodb_resource.create_table(
-        TableName='test_pipeline_run_logs',
-        KeySchema=[
-            {'AttributeName': 'run_id', 'KeyType': 'HASH'}
+        'BillingMode': 'PAY_PER_REQUEST'
+    },
+    'pipeline_run_logs': {
+        'KeySchema': [
+            {'AttributeName': 'run_id', 'KeyType': 'HASH'},
+            {'AttributeName': 'pipeline_id', 'KeyType': 'RANGE'}
         ],
-        AttributeDefinitions=[
+        'AttributeDefinitions': [
             {'AttributeName': 'run_id', 'AttributeType': 'S'},
             {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
             {'AttributeName': 'status', 'AttributeType': 'S'},
             {'AttributeName': 'created_at', 'AttributeType': 'S'}
         ],
-        GlobalSecondaryIndexes=[
+        'GlobalSecondaryIndexes': [
             {
-                'IndexName': 'PipelineIndex',
+                'IndexName': 'PipelineRunsIndex',
                 'KeySchema': [
                     {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
                     {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
                 ],
-                'Projection': {'ProjectionType': 'ALL'},
-                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+                'Projection': {'ProjectionType': 'ALL'}
             },
             {
                 'IndexName': 'StatusIndex',
@@ -173,362 +599,66 @@ def pipeline_run_logs_table(mock_dynamodb_resource):
                     {'AttributeName': 'status', 'KeyType': 'HASH'},
                     {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
                 ],
-                'Projection': {'ProjectionType': 'ALL'},
-                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+                'Projection': {'ProjectionType': 'ALL'}
             }
         ],
-        BillingMode='PROVISIONED',
-        ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-    )
-    return table
-
-
-@pytest.fixture
-def all_tables(pipeline_config_table, table_config_table, pipeline_run_logs_table):
-    """Create all DynamoDB tables needed for comprehensive testing."""
-    return {
-        'pipeline_config': pipeline_config_table,
-        'table_config': table_config_table,
-        'pipeline_run_logs': pipeline_run_logs_table
+        'BillingMode': 'PAY_PER_REQUEST'
     }
+}
 
 
-# CQRS API Fixtures
-
-@pytest.fixture
-def pipeline_config_read_api(mock_dynamodb_config, pipeline_config_table):
-    """Pipeline configuration read API with mocked DynamoDB."""
-    return PipelineConfigReadApi(mock_dynamodb_config)
-
-
-@pytest.fixture
-def pipeline_config_write_api(mock_dynamodb_config, pipeline_config_table):
-    """Pipeline configuration write API with mocked DynamoDB."""
-    return PipelineConfigWriteApi(mock_dynamodb_config)
-
-
-@pytest.fixture
-def table_config_read_api(mock_dynamodb_config, table_config_table):
-    """Table configuration read API with mocked DynamoDB."""
-    return TableConfigReadApi(mock_dynamodb_config)
-
-
-@pytest.fixture
-def table_config_write_api(mock_dynamodb_config, table_config_table):
-    """Table configuration write API with mocked DynamoDB."""
-    return TableConfigWriteApi(mock_dynamodb_config)
-
-
-@pytest.fixture
-def pipeline_run_logs_read_api(mock_dynamodb_config, pipeline_run_logs_table):
-    """Pipeline run logs read API with mocked DynamoDB."""
-    return PipelineRunLogsReadApi(mock_dynamodb_config)
-
-
-@pytest.fixture
-def pipeline_run_logs_write_api(mock_dynamodb_config, pipeline_run_logs_table):
-    """Pipeline run logs write API with mocked DynamoDB."""
-    return PipelineRunLogsWriteApi(mock_dynamodb_config)
+@pytest.fixture(scope="session")
+def _localstack_table_names(localstack_dynamodb_resource, localstack_config):
+    """Create any missing LocalStack tables once per session and return their names."""
+    # boto3 clients are thread-safe (resources are not), so workers share the client
+    client = localstack_dynamodb_resource.meta.client
+    waiter = client.get_waiter('table_exists')
+
+    # One ListTables call instead of a DescribeTable per table
+    existing = set()
+    for page in client.get_paginator('list_tables').paginate():
+        existing.update(page['TableNames'])
+
+    def ensure_table(base_name):
+        name = localstack_config.get_table_name(base_name)
+        if name in existing:
+            print(f"Table {name} already exists")
+            return name
 
+        # Create table with GSIs
+        response = client.create_table(TableName=name, **_LOCALSTACK_TABLE_SCHEMAS[base_name])
 
-# Sample Data Fixtures
+        # LocalStack usually reports ACTIVE straight away; otherwise poll every
+        # 0.2s (up to 60s) rather than the waiter's 20s default delay
+        if response['TableDescription']['TableStatus'] != 'ACTIVE':
+            waiter.wait(TableName=name, WaiterConfig={'Delay': 0.2, 'MaxAttempts': 300})
+        print(f"Created table: {name}")
+        return name
 
-@pytest.fixture
-def sample_pipeline_data():
-    """Sample pipeline configuration data for testing."""
-    return {
-        "pipeline_id": "test-pipeline-1",
-        "pipeline_name": "Test Data Pipeline",
-        "description": "A test pipeline for unit testing",
-        "source_type": "s3",
-        "destination_type": "warehouse",
-        "is_active": True,
-        "environment": "test",
-        "created_by": "test-user"
-    }
+    # Create and wait for all tables concurrently
+    with ThreadPoolExecutor(max_workers=len(_LOCALSTACK_TABLE_SCHEMAS)) as pool:
+        return list(pool.map(ensure_table, _LOCALSTACK_TABLE_SCHEMAS))
 
 
 @pytest.fixture
-def sample_table_data():
-    """Sample table configuration data for testing."""
-    return {
-        "table_id": "test-table-1", 
-        "pipeline_id": "test-pipeline-1",
-        "table_name": "test_table",
-        "table_type": "source",
-        "data_format": "parquet",
-        "location": "s3://test-bucket/data/",
-        "is_active": True,
-        "environment": "test",
-        "created_by": "test-user"
-    }
-
-
-@pytest.fixture  
-def sample_run_log_data():
-    """Sample pipeline run log data for testing."""
+def localstack_tables(localstack_dynamodb_resource, _localstack_table_names):
+    """Empty LocalStack tables for integration testing, keyed by table name."""
     return {
-        "run_id": "test-run-1",
-        "pipeline_id": "test-pipeline-1", 
-        "status": "running",
-        "trigger_type": "manual",
-        "environment": "test",
-        "created_by": "test-user"
+        name: truncate_table(localstack_dynamodb_resource.Table(name))
+        for name in _localstack_table_names
     }
 
 
-# ===== LocalStack Integration Test Fixtures =====
-
 @pytest.fixture(scope="session")
-def localstack_container() -> Generator[None, None, None]:
-    """Start LocalStack container for integration tests."""
-    try:
-        # Check if LocalStack is already running
-        response = requests.get("http://localhost:4566/_localstack/health", timeout=2)
-        if response.status_code == 200:
-            print("LocalStack is already running")
-            yield
-            return
-    except (requests.RequestException, requests.ConnectionError):
-        pass  # LocalStack not running, start it
-    
-    # Start LocalStack container
-    compose_file = Path(__file__).parent.parent / "docker-compose.localstack.yml"
-    
-    print("Starting LocalStack container...")
-    try:
-        subprocess.run([
-            "docker-compose", 
-            "-f", str(compose_file), 
-            "up", "-d"
-        ], check=True, capture_output=True)
-        
-        # Wait for LocalStack to be ready
-        _wait_for_localstack()
-        
-        yield
-        
-    finally:
-        # Clean up: stop LocalStack container
-        print("Stopping LocalStack container...")
-        try:
-            subprocess.run([
-                "docker-compose", 
-                "-f", str(compose_file), 
-                "down"
-            ], check=True, capture_output=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Failed to stop LocalStack container: {e}")
-
-
-def _wait_for_localstack(max_retries: int = 30, delay: float = 1.0) -> None:
-    """Wait for LocalStack to be ready."""
-    print("Waiting for LocalStack to be ready...")
-    
-    for attempt in range(max_retries):
-        try:
-            response = requests.get("http://localhost:4566/_localstack/health", timeout=2)
-            if response.status_code == 200:
-                health_data = response.json()
-                if health_data.get("services", {}).get("dynamodb") == "available":
-                    print("LocalStack DynamoDB is ready!")
-                    return
-        except (requests.RequestException, requests.ConnectionError):
-            pass
-        
-        print(f"Attempt {attempt + 1}/{max_retries}: LocalStack not ready yet...")
-        time.sleep(delay)
-    
-    raise RuntimeError("LocalStack failed to start within the expected time")
-
-
-@pytest.fixture
-def localstack_config(localstack_container):
-    """DynamoDB configuration for LocalStack integration testing."""
-    return DynamoDBConfig(
-        aws_access_key_id="test",
-        aws_secret_access_key="test",
-        region_name="us-east-1",
-        endpoint_url="http://localhost:4566",
-        environment="dev",
-        table_prefix="integration"
-    )
-
-
-@pytest.fixture
-def localstack_dynamodb_resource(localstack_container):
-    """LocalStack DynamoDB resource for integration testing."""
-    return boto3.resource(
-        'dynamodb',
-        region_name='us-east-1',
-        endpoint_url='http://localhost:4566',
-        aws_access_key_id='test',
-        aws_secret_access_key='test'
-    )
-
-
-@pytest.fixture
-def localstack_tables(localstack_dynamodb_resource):
-    """Create all DynamoDB tables in LocalStack for integration testing."""
-    tables_config = [
-        {
-            'name': 'integration_dev_pipeline_config',
-            'key_schema': [{'AttributeName': 'pipeline_id', 'KeyType': 'HASH'}],
-            'attributes': [
-                {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
-                {'AttributeName': 'is_active', 'AttributeType': 'S'},
-                {'AttributeName': 'environment', 'AttributeType': 'S'},
-                {'AttributeName': 'updated_at', 'AttributeType': 'S'},
-                {'AttributeName': 'created_at', 'AttributeType': 'S'}
-            ],
-            'gsi': [
-                {
-                    'IndexName': 'ActivePipelinesIndex',
-                    'KeySchema': [
-                        {'AttributeName': 'is_active', 'KeyType': 'HASH'},
-                        {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
-                    ],
-                    'Projection': {'ProjectionType': 'ALL'}
-                },
-                {
-                    'IndexName': 'EnvironmentIndex',
-                    'KeySchema': [
-                        {'AttributeName': 'environment', 'KeyType': 'HASH'},
-                        {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                    ],
-                    'Projection': {'ProjectionType': 'ALL'}
-                }
-            ]
-        },
-        {
-            'name': 'integration_dev_table_config',
-            'key_schema': [{'AttributeName': 'table_id', 'KeyType': 'HASH'}],
-            'attributes': [
-                {'AttributeName': 'table_id', 'AttributeType': 'S'},
-                {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
-                {'AttributeName': 'table_type', 'AttributeType': 'S'},
-                {'AttributeName': 'created_at', 'AttributeType': 'S'}
-            ],
-            'gsi': [
-                {
-                    'IndexName': 'PipelineTablesIndex',
-                    'KeySchema': [
-                        {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
-                        {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                    ],
-                    'Projection': {'ProjectionType': 'ALL'}
-                },
-                {
-                    'IndexName': 'TypeIndex',
-                    'KeySchema': [
-                        {'AttributeName': 'table_type', 'KeyType': 'HASH'},
-                        {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                    ],
-                    'Projection': {'ProjectionType': 'ALL'}
-                }
-            ]
-        },
-        {
-            'name': 'integration_dev_pipeline_run_logs',
-            'key_schema': [
-                {'AttributeName': 'run_id', 'KeyType': 'HASH'},
-                {'AttributeName': 'pipeline_id', 'KeyType': 'RANGE'}
-            ],
-            'attributes': [
-                {'AttributeName': 'run_id', 'AttributeType': 'S'},
-                {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
-                {'AttributeName': 'status', 'AttributeType': 'S'},
-                {'AttributeName': 'created_at', 'AttributeType': 'S'}
-            ],
-            'gsi': [
-                {
-                    'IndexName': 'PipelineRunsIndex',
-                    'KeySchema': [
-                        {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
-                        {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                    ],
-                    'Projection': {'ProjectionType': 'ALL'}
-                },
-                {
-                    'IndexName': 'StatusIndex',
-                    'KeySchema': [
-                        {'AttributeName': 'status', 'KeyType': 'HASH'},
-                        {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                    ],
-                    'Projection': {'ProjectionType': 'ALL'}
-                }
-            ]
-        }
-    ]
-    
-    created_tables = {}
-    
-    for table_config in tables_config:
-        # Check if table already exists
-        try:
-            table = localstack_dynamodb_resource.Table(table_config['name'])
-            table.load()
-            print(f"Table {table_config['name']} already exists")
-            created_tables[table_config['name']] = table
-            continue
-        except localstack_dynamodb_resource.meta.client.exceptions.ResourceNotFoundException:
-            pass  # Table doesn't exist, create it
-        
-        # Create table with GSIs
-        table = localstack_dynamodb_resource.create_table(
-            TableName=table_config['name'],
-            KeySchema=table_config['key_schema'],
-            AttributeDefinitions=table_config['attributes'],
-            GlobalSecondaryIndexes=[
-                {
-                    **gsi,
-                    'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-                }
-                for gsi in table_config.get('gsi', [])
-            ],
-            BillingMode='PROVISIONED',
-            ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-        )
-        
-        # Wait for table to be active
-        table.wait_until_exists()
-        print(f"Created table: {table_config['name']}")
-        created_tables[table_config['name']] = table
-    
-    return created_tables
-
-
-@pytest.fixture
-def localstack_pipeline_config_read_api(localstack_config, localstack_tables):
-    """Pipeline configuration read API with LocalStack DynamoDB."""
-    return PipelineConfigReadApi(localstack_config)
-
-
-@pytest.fixture
-def localstack_pipeline_config_write_api(localstack_config, localstack_tables):
-    """Pipeline configuration write API with LocalStack DynamoDB."""
-    return PipelineConfigWriteApi(localstack_config)
+def _localstack_api_cache():
+    """API instances shared by every LocalStack test in the session."""
+    return {}
 
 
 @pytest.fixture
-def localstack_table_config_read_api(localstack_config, localstack_tables):
-    """Table configuration read API with LocalStack DynamoDB."""
-    return TableConfigReadApi(localstack_config)
+def localstack_api_factory(localstack_config, localstack_tables, _localstack_api_cache):
+    """Factory returning the cached API instance for an API class, with LocalStack DynamoDB.
 
-
-@pytest.fixture
-def localstack_table_config_write_api(localstack_config, localstack_tables):
-    """Table configuration write API with LocalStack DynamoDB."""
-    return TableConfigWriteApi(localstack_config)
-
-
-@pytest.fixture
-def localstack_pipeline_run_logs_read_api(localstack_config, localstack_tables):
-    """Pipeline run logs read API with LocalStack DynamoDB."""
-    return PipelineRunLogsReadApi(localstack_config)
-
-
-@pytest.fixture
-def localstack_pipeline_run_logs_write_api(localstack_config, localstack_tables):
-    """Pipeline run logs write API with LocalStack DynamoDB."""
-    return PipelineRunLogsWriteApi(localstack_config)
\ No newline at end of file
+    Usage: ``localstack_api_factory(PipelineConfigWriteApi)``.
+    """
+    return lambda api_class: _cached_api(_localstack_api_cache, api_class, localstack_config)
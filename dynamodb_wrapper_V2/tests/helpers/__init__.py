@@ -14,6 +14,7 @@ from .timezone_assertions import (
     get_timezone_name,
     create_timezone_test_context
 )
+from .seeding import seed_table, truncate_table
 
 __all__ = [
     'assert_timezone_equals',
@@ -22,5 +23,7 @@ __all__ = [
     'assert_timezone_aware',
     'assert_stored_as_utc_string',
     'get_timezone_name',
-    'create_timezone_test_context'
+    'create_timezone_test_context',
+    'seed_table',
+    'truncate_table'
 ]
\ No newline at end of file
@@ -5,12 +5,25 @@ Provides robust timezone comparison utilities for integration tests.
 These helpers ensure proper timezone validation beyond simple `.tzinfo is not None` checks.
 """
 
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Union
 import zoneinfo
 from zoneinfo import ZoneInfo
 
 
+# ISO 8601 timestamp with a UTC suffix, e.g. 2024-06-15T12:00:00.123456+00:00
+_UTC_ISO_RE = re.compile(
+    r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])'
+    r'[T ](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d{1,6})?)?'
+    r'(?:Z|\+00:00)\Z'
+)
+
+# Instant at which offsets are compared; a fixed summer date keeps DST from varying results
+_OFFSET_PROBE = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
 def assert_timezone_equals(actual_dt: datetime, expected_timezone: Union[str, timezone, ZoneInfo], 
                           tolerance_seconds: float = 0.1) -> None:
     """
@@ -19,7 +32,7 @@ def assert_timezone_equals(actual_dt: datetime, expected_timezone: Union[str, ti
     Args:
         actual_dt: The datetime to check
         expected_timezone: Expected timezone (string name, timezone object, or ZoneInfo)
-        tolerance_seconds: Tolerance for time comparison when converting between timezone representations
+        tolerance_seconds: Unused; kept for backwards compatibility (offsets are compared exactly)
         
     Raises:
         AssertionError: If timezone doesn't match expected
@@ -34,6 +47,10 @@ def assert_timezone_equals(actual_dt: datetime, expected_timezone: Union[str, ti
     expected_tz = _normalize_timezone(expected_timezone)
     actual_tz = actual_dt.tzinfo
     
+    # Same object (cached ZoneInfo, timezone.utc) or equal fixed offset: nothing to convert
+    if actual_tz is expected_tz or actual_tz == expected_tz:
+        return
+    
     # For UTC, handle multiple representations
     if _is_utc_timezone(expected_tz):
         if not _is_utc_timezone(actual_tz):
@@ -50,28 +67,14 @@ def assert_timezone_equals(actual_dt: datetime, expected_timezone: Union[str, ti
             )
         return
     
-    # Fallback: compare by converting a test datetime to both timezones
-    test_utc_dt = datetime(2024, 6, 15, 12, 0, 0, tzinfo=timezone.utc)  # Use fixed date to avoid DST issues
-    
-    try:
-        expected_dt = test_utc_dt.astimezone(expected_tz)
-        actual_converted = test_utc_dt.astimezone(actual_tz)
-        
-        offset_diff = abs((expected_dt.utcoffset() - actual_converted.utcoffset()).total_seconds())
-        if offset_diff > tolerance_seconds:
-            raise AssertionError(
-                f"Timezone offset mismatch. Expected {expected_tz} (offset: {expected_dt.utcoffset()}), "
-                f"got {actual_tz} (offset: {actual_converted.utcoffset()}) for datetime {actual_dt}"
-            )
-    except Exception as e:
-        # If conversion fails, fall back to string comparison
-        expected_str = str(expected_tz)
-        actual_str = str(actual_tz)
-        if expected_str not in actual_str and actual_str not in expected_str:
-            raise AssertionError(
-                f"Could not verify timezone equivalence. Expected something like '{expected_str}', "
-                f"got '{actual_str}' for datetime {actual_dt}. Conversion error: {e}"
-            )
+    # Fallback (e.g. fixed offset vs named zone): compare offsets at a fixed instant
+    expected_offset = _OFFSET_PROBE.astimezone(expected_tz).utcoffset()
+    actual_offset = _OFFSET_PROBE.astimezone(actual_tz).utcoffset()
+    if expected_offset != actual_offset:
+        raise AssertionError(
+            f"Timezone offset mismatch. Expected {expected_tz} (offset: {expected_offset}), "
+            f"got {actual_tz} (offset: {actual_offset}) for datetime {actual_dt}"
+        )
 
 
 def assert_utc_timezone(actual_dt: datetime) -> None:
@@ -147,29 +150,15 @@ def assert_stored_as_utc_string(raw_datetime_string: str) -> None:
     if not isinstance(raw_datetime_string, str):
         raise AssertionError(f"Expected string, got {type(raw_datetime_string)}: {raw_datetime_string}")
     
-    # Check for UTC indicators
-    utc_indicators = ['+00:00', 'Z', 'UTC']
-    has_utc_indicator = any(indicator in raw_datetime_string for indicator in utc_indicators)
-    
-    if not has_utc_indicator:
+    # One pass checks both the ISO 8601 shape and the UTC offset
+    if not _UTC_ISO_RE.match(raw_datetime_string):
         raise AssertionError(
-            f"Datetime string lacks UTC indicator. Expected one of {utc_indicators}, "
+            f"Datetime string is not an ISO 8601 UTC timestamp (expected a 'Z' or '+00:00' suffix), "
             f"got: '{raw_datetime_string}'"
         )
-    
-    # Verify it's parseable as ISO datetime
-    try:
-        parsed_dt = datetime.fromisoformat(raw_datetime_string.replace('Z', '+00:00'))
-        if parsed_dt.tzinfo is None:
-            raise AssertionError(f"Parsed datetime is naive: {parsed_dt} from '{raw_datetime_string}'")
-        
-        # Verify it's actually UTC
-        assert_utc_timezone(parsed_dt)
-        
-    except ValueError as e:
-        raise AssertionError(f"Could not parse datetime string '{raw_datetime_string}' as ISO format: {e}")
 
 
+@lru_cache(maxsize=256)
 def get_timezone_name(tz: Union[str, timezone, ZoneInfo]) -> str:
     """
     Get a consistent timezone name for comparison purposes.
@@ -190,32 +179,46 @@ def get_timezone_name(tz: Union[str, timezone, ZoneInfo]) -> str:
         return str(tz)
 
 
+@lru_cache(maxsize=256)
+def _zoneinfo_cached(name: str) -> Union[timezone, ZoneInfo]:
+    """Resolve a timezone name once; repeated assertions reuse the same object."""
+    if name.upper() == 'UTC':
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        raise ValueError(f"Invalid timezone string: '{name}'")
+
+
 def _normalize_timezone(tz: Union[str, timezone, ZoneInfo]) -> Union[timezone, ZoneInfo]:
     """Normalize timezone input to a timezone object."""
     if isinstance(tz, str):
-        if tz.upper() == 'UTC':
-            return timezone.utc
-        else:
-            try:
-                return ZoneInfo(tz)
-            except Exception:
-                raise ValueError(f"Invalid timezone string: '{tz}'")
+        return _zoneinfo_cached(tz)
     elif isinstance(tz, (timezone, ZoneInfo)):
         return tz
     else:
         raise ValueError(f"Invalid timezone type: {type(tz)}")
 
 
+@lru_cache(maxsize=256)
 def _is_utc_timezone(tz) -> bool:
-    """Check if a timezone represents UTC."""
-    if tz == timezone.utc:
+    """Check if a timezone represents UTC (cached per tzinfo object)."""
+    if tz is timezone.utc:
         return True
     
-    if hasattr(tz, 'key') and tz.key == 'UTC':
+    if getattr(tz, 'key', None) == 'UTC':
         return True
         
     if str(tz).upper() in ['UTC', 'UTC+00:00', '+00:00']:
         return True
+    
+    # Fixed-offset tzinfos answer without a datetime; named zones return None
+    try:
+        offset = tz.utcoffset(None)
+    except Exception:
+        offset = None
+    if offset is not None:
+        return offset.total_seconds() == 0
         
     # Check offset for UTC (should be 0)
     try:
@@ -235,12 +238,21 @@ def create_timezone_test_context(user_timezone: str = "America/New_York"):
     Returns:
         Dictionary with timezone test utilities
     """
+    user_tz_obj = _zoneinfo_cached(user_timezone)
+    
+    def assert_user_tz(dt: datetime) -> None:
+        # Common case: the datetime already carries the same (cached) zone or zone name
+        tzinfo = getattr(dt, 'tzinfo', None)
+        if tzinfo is not None and (tzinfo is user_tz_obj or getattr(tzinfo, 'key', None) == user_timezone):
+            return
+        assert_timezone_equals(dt, user_tz_obj)
+    
     return {
         'user_timezone': user_timezone,
-        'user_tz_obj': ZoneInfo(user_timezone),
+        'user_tz_obj': user_tz_obj,
         'utc_tz_obj': timezone.utc,
         'assert_utc': assert_utc_timezone,
-        'assert_user_tz': lambda dt: assert_timezone_equals(dt, user_timezone),
+        'assert_user_tz': assert_user_tz,
         'assert_equivalent': assert_timezones_equivalent,
         'assert_aware': assert_timezone_aware
     }
\ No newline at end of file
@@ -14,6 +14,7 @@ Key testing scenarios:
 import pytest
 from datetime import datetime, timezone, timedelta
 from moto import mock_aws
+from moto.dynamodb.models import dynamodb_backends
 import boto3
 from typing import List, Optional
 
@@ -29,10 +30,97 @@ from dynamodb_wrapper import (
     TableConfigUpsert,
     PipelineRunLogUpsert
 )
+from tests.helpers import truncate_table
 # Removed timezone-specific imports after TimezoneManager simplification
 
 
-@pytest.fixture
+# Table definitions for the CQRS tests, built once
+_CQRS_TABLES = [
+    {
+        'name': 'cqrs_test_dev_pipeline_config',
+        'key_schema': [{'AttributeName': 'pipeline_id', 'KeyType': 'HASH'}],
+        'attributes': [
+            {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
+            {'AttributeName': 'is_active', 'AttributeType': 'S'},
+            {'AttributeName': 'environment', 'AttributeType': 'S'},
+            {'AttributeName': 'updated_at', 'AttributeType': 'S'},
+            {'AttributeName': 'created_at', 'AttributeType': 'S'}
+        ],
+        'gsi': [
+            {
+                'IndexName': 'ActivePipelinesIndex',
+                'KeySchema': [
+                    {'AttributeName': 'is_active', 'KeyType': 'HASH'},
+                    {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            },
+            {
+                'IndexName': 'EnvironmentIndex',
+                'KeySchema': [
+                    {'AttributeName': 'environment', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            }
+        ]
+    },
+    {
+        'name': 'cqrs_test_dev_table_config',
+        'key_schema': [{'AttributeName': 'table_id', 'KeyType': 'HASH'}],
+        'attributes': [
+            {'AttributeName': 'table_id', 'AttributeType': 'S'},
+            {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
+            {'AttributeName': 'created_at', 'AttributeType': 'S'}
+        ],
+        'gsi': [
+            {
+                'IndexName': 'PipelineIndex',
+                'KeySchema': [
+                    {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            }
+        ]
+    },
+    {
+        'name': 'cqrs_test_dev_pipeline_run_logs',
+        'key_schema': [{'AttributeName': 'run_id', 'KeyType': 'HASH'}],
+        'attributes': [
+            {'AttributeName': 'run_id', 'AttributeType': 'S'},
+            {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
+            {'AttributeName': 'status', 'AttributeType': 'S'},
+            {'AttributeName': 'created_at', 'AttributeType': 'S'}
+        ],
+        'gsi': [
+            {
+                'IndexName': 'PipelineIndex',
+                'KeySchema': [
+                    {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            },
+            {
+                'IndexName': 'StatusIndex',
+                'KeySchema': [
+                    {'AttributeName': 'status', 'KeyType': 'HASH'},
+                    {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+                'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+            }
+        ]
+    }
+]
+
+
+@pytest.fixture(scope="module")
 def cqrs_config():
     """Configuration for CQRS testing."""
     return DynamoDBConfig(
@@ -45,123 +133,61 @@ def cqrs_config():
     )
 
 
-@pytest.fixture
-def mock_dynamodb_full():
-    """Create mock DynamoDB with all tables for comprehensive testing."""
+@pytest.fixture(scope="module")
+def moto_dynamodb():
+    """Patch botocore once for the module; tables are created once and emptied per test."""
     with mock_aws():
-        dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-        
-        # Create all required tables
-        tables_config = [
-            {
-                'name': 'cqrs_test_dev_pipeline_config',
-                'key_schema': [{'AttributeName': 'pipeline_id', 'KeyType': 'HASH'}],
-                'attributes': [
-                    {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
-                    {'AttributeName': 'is_active', 'AttributeType': 'S'},
-                    {'AttributeName': 'environment', 'AttributeType': 'S'},
-                    {'AttributeName': 'updated_at', 'AttributeType': 'S'},
-                    {'AttributeName': 'created_at', 'AttributeType': 'S'}
-                ],
-                'gsi': [
-                    {
-                        'IndexName': 'ActivePipelinesIndex',
-                        'KeySchema': [
-                            {'AttributeName': 'is_active', 'KeyType': 'HASH'},
-                            {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
-                        ],
-                        'Projection': {'ProjectionType': 'ALL'},
-                        'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-                    },
-                    {
-                        'IndexName': 'EnvironmentIndex',
-                        'KeySchema': [
-                            {'AttributeName': 'environment', 'KeyType': 'HASH'},
-                            {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                        ],
-                        'Projection': {'ProjectionType': 'ALL'},
-                        'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-                    }
-                ]
-            },
-            {
-                'name': 'cqrs_test_dev_table_config',
-                'key_schema': [{'AttributeName': 'table_id', 'KeyType': 'HASH'}],
-                'attributes': [
-                    {'AttributeName': 'table_id', 'AttributeType': 'S'},
-                    {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
-                    {'AttributeName': 'created_at', 'AttributeType': 'S'}
-                ],
-                'gsi': [
-                    {
-                        'IndexName': 'PipelineIndex',
-                        'KeySchema': [
-                            {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
-                            {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                        ],
-                        'Projection': {'ProjectionType': 'ALL'},
-                        'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-                    }
-                ]
-            },
-            {
-                'name': 'cqrs_test_dev_pipeline_run_logs',
-                'key_schema': [{'AttributeName': 'run_id', 'KeyType': 'HASH'}],
-                'attributes': [
-                    {'AttributeName': 'run_id', 'AttributeType': 'S'},
-                    {'AttributeName': 'pipeline_id', 'AttributeType': 'S'},
-                    {'AttributeName': 'status', 'AttributeType': 'S'},
-                    {'AttributeName': 'created_at', 'AttributeType': 'S'}
-                ],
-                'gsi': [
-                    {
-                        'IndexName': 'PipelineIndex',
-                        'KeySchema': [
-                            {'AttributeName': 'pipeline_id', 'KeyType': 'HASH'},
-                            {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                        ],
-                        'Projection': {'ProjectionType': 'ALL'},
-                        'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-                    },
-                    {
-                        'IndexName': 'StatusIndex',
-                        'KeySchema': [
-                            {'AttributeName': 'status', 'KeyType': 'HASH'},
-                            {'AttributeName': 'created_at', 'KeyType': 'RANGE'}
-                        ],
-                        'Projection': {'ProjectionType': 'ALL'},
-                        'ProvisionedThroughput': {'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-                    }
-                ]
-            }
-        ]
-        
-        # Create each table
-        for table_config in tables_config:
-            table = dynamodb.create_table(
-                TableName=table_config['name'],
-                KeySchema=table_config['key_schema'],
-                AttributeDefinitions=table_config['attributes'],
-                GlobalSecondaryIndexes=table_config.get('gsi', []),
-                BillingMode='PROVISIONED',
-                ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
-            )
-        
-        yield dynamodb
+        yield boto3.resource('dynamodb', region_name='us-east-1')
+
+
+@pytest.fixture(scope="module")
+def _cqrs_tables(moto_dynamodb):
+    """Create all CQRS tables once per module."""
+    # Start from an empty backend; the mock may outlive an earlier module's tables
+    dynamodb_backends.reset()
+    return [
+        moto_dynamodb.create_table(
+            TableName=table_config['name'],
+            KeySchema=table_config['key_schema'],
+            AttributeDefinitions=table_config['attributes'],
+            GlobalSecondaryIndexes=table_config.get('gsi', []),
+            BillingMode='PROVISIONED',
+            ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+        )
+        for table_config in _CQRS_TABLES
+    ]
+
+
+@pytest.fixture
+def mock_dynamodb_full(moto_dynamodb, _cqrs_tables):
+    """Mock DynamoDB with all tables, emptied for each test."""
+    for table in _cqrs_tables:
+        truncate_table(table)
+    yield moto_dynamodb
+
+
+@pytest.fixture(scope="module")
+def _pipeline_apis(cqrs_config, moto_dynamodb):
+    """Pipeline write/read APIs built once per module, inside the moto mock."""
+    return PipelineConfigWriteApi(cqrs_config), PipelineConfigReadApi(cqrs_config)
+
+
+@pytest.fixture
+def pipeline_apis(_pipeline_apis, mock_dynamodb_full):
+    """Shared (write_api, read_api) pair for pipeline configuration, with empty tables."""
+    return _pipeline_apis
 
 
 class TestCQRSOperations:
     """Test CQRS pattern implementation with real operations."""
 
-    def test_read_api_query_optimization(self, cqrs_config, mock_dynamodb_full):
+    def test_read_api_query_optimization(self, pipeline_apis):
         """Test read API query optimization with projections and pagination."""
-        write_api = PipelineConfigWriteApi(cqrs_config)
-        read_api = PipelineConfigReadApi(cqrs_config)
+        write_api, read_api = pipeline_apis
         
         # Create multiple pipelines for testing queries
-        pipelines_data = []
-        for i in range(10):
-            pipeline_data = PipelineConfigUpsert(
+        pipelines_data = [
+            PipelineConfigUpsert(
                 pipeline_id=f"query-test-pipeline-{i:02d}",
                 pipeline_name=f"Query Test Pipeline {i}",
                 description=f"Pipeline {i} for testing query optimization",
@@ -171,7 +197,8 @@ class TestCQRSOperations:
                 is_active=i % 2 == 0,  # Alternate active/inactive
                 created_by=f"user-{i}"
             )
-            pipelines_data.append(pipeline_data)
+            for i in range(10)
+        ]
         
         # Batch create pipelines
         created_pipelines = write_api.upsert_many(pipelines_data)
@@ -211,10 +238,9 @@ class TestCQRSOperations:
         assert len(active_dev_pipelines) == 5  # Half are active
         assert all(p.is_active for p in active_dev_pipelines)
 
-    def test_write_api_conditional_operations(self, cqrs_config, mock_dynamodb_full):
+    def test_write_api_conditional_operations(self, pipeline_apis):
         """Test write API conditional operations and safety checks."""
-        write_api = PipelineConfigWriteApi(cqrs_config)
-        read_api = PipelineConfigReadApi(cqrs_config)
+        write_api, read_api = pipeline_apis
         
         # Test 1: Create with existence check (should succeed)
         pipeline_data = PipelineConfigUpsert(
@@ -263,15 +289,13 @@ class TestCQRSOperations:
     # Removed test_transaction_operations_timezone_consistency - no longer needed after TimezoneManager simplification
 
     # Removed test_cross_domain_operations_timezone_handling - no longer needed after TimezoneManager simplification
-    def test_read_write_performance_patterns(self, cqrs_config, mock_dynamodb_full):
+    def test_read_write_performance_patterns(self, pipeline_apis):
         """Test CQRS read/write performance optimization patterns."""
-        write_api = PipelineConfigWriteApi(cqrs_config)
-        read_api = PipelineConfigReadApi(cqrs_config)
+        write_api, read_api = pipeline_apis
         
         # Create many pipelines to test performance patterns
-        pipelines_data = []
-        for i in range(20):
-            pipeline_data = PipelineConfigUpsert(
+        pipelines_data = [
+            PipelineConfigUpsert(
                 pipeline_id=f"perf-pipeline-{i:03d}",
                 pipeline_name=f"Performance Pipeline {i}",
                 description=f"Pipeline {i} for performance testing",
@@ -281,7 +305,8 @@ class TestCQRSOperations:
                 is_active=i % 3 == 0,  # Every third is active
                 created_by=f"perf-user-{i % 3}"
             )
-            pipelines_data.append(pipeline_data)
+            for i in range(20)
+        ]
         
         # Batch write optimization
         created_pipelines = write_api.upsert_many(pipelines_data)
@@ -317,10 +342,9 @@ class TestCQRSOperations:
             assert pipeline.pipeline_name is not None
             assert pipeline.is_active is not None
 
-    def test_data_consistency_across_operations(self, cqrs_config, mock_dynamodb_full):
+    def test_data_consistency_across_operations(self, pipeline_apis):
         """Test data consistency across different operation types."""
-        write_api = PipelineConfigWriteApi(cqrs_config)
-        read_api = PipelineConfigReadApi(cqrs_config)
+        write_api, read_api = pipeline_apis
         # TimezoneManager removed - using Python's built-in datetime
         
         # Create initial pipeline
@@ -368,5 +392,32 @@ class TestCQRSOperations:
         assert upserted.created_at == original_created_at  # Preserved
         assert upserted.updated_at > updated.updated_at   # Newer than last update
 
+    def test_batch_write_and_batch_get_round_trip(self, cqrs_config, mock_dynamodb_full):
+        """Test BatchWriteItem-based upsert_many and BatchGetItem-based reads."""
+        write_api = TableConfigWriteApi(cqrs_config)
+        read_api = TableConfigReadApi(cqrs_config)
+        
+        tables_data = [
+            TableConfigUpsert(
+                table_id=f"batch-table-{i:02d}",
+                pipeline_id="batch-pipeline",
+                table_name=f"batch_table_{i}",
+                table_type="source",
+                data_format="parquet",
+                location=f"s3://bucket/batch/{i}/",
+                environment="dev"
+            )
+            for i in range(30)  # More than one 25-item BatchWriteItem chunk
+        ]
+        created = write_api.upsert_many(tables_data)
+        assert len(created) == 30
+        
+        # Duplicates and missing ids are tolerated
+        requested_ids = ["batch-table-00", "batch-table-29", "batch-table-00", "missing-table"]
+        tables = read_api.batch_get_by_ids(requested_ids)
+        
+        assert {table.table_id for table in tables} == {"batch-table-00", "batch-table-29"}
+        assert all(table.location.startswith("s3://bucket/batch/") for table in tables)
+
     # Removed test_timezone_conversion_edge_cases_e2e - no longer needed after TimezoneManager simplification
     # Removed test_bulk_operations_timezone_consistency - no longer needed after TimezoneManager simplification
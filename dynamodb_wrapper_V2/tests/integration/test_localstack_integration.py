@@ -18,6 +18,12 @@ from datetime import datetime, timezone, timedelta
 from typing import List
 
 from dynamodb_wrapper import (
+    PipelineConfigReadApi,
+    PipelineConfigWriteApi,
+    TableConfigReadApi,
+    TableConfigWriteApi,
+    PipelineRunLogsReadApi,
+    PipelineRunLogsWriteApi,
     PipelineConfigUpsert,
     TableConfigUpsert, 
     PipelineRunLogUpsert,
@@ -35,17 +41,18 @@ from tests.helpers.timezone_assertions import (
 )
 
 
+pytestmark = pytest.mark.integration
+
 class TestLocalStackCQRSOperations:
     """Test CQRS operations with LocalStack DynamoDB."""
 
     def test_pipeline_config_full_lifecycle(
         self, 
-        localstack_pipeline_config_write_api,
-        localstack_pipeline_config_read_api
+        localstack_api_factory
     ):
         """Test complete pipeline configuration lifecycle with real DynamoDB."""
-        write_api = localstack_pipeline_config_write_api
-        read_api = localstack_pipeline_config_read_api
+        write_api = localstack_api_factory(PipelineConfigWriteApi)
+        read_api = localstack_api_factory(PipelineConfigReadApi)
         
         # Create unique pipeline ID to avoid conflicts
         pipeline_id = f"localstack-pipeline-{uuid.uuid4().hex[:8]}"
@@ -110,12 +117,11 @@ class TestLocalStackCQRSOperations:
 
     def test_gsi_queries_with_real_dynamodb(
         self,
-        localstack_pipeline_config_write_api,
-        localstack_pipeline_config_read_api
+        localstack_api_factory
     ):
         """Test GSI queries with real DynamoDB indexes."""
-        write_api = localstack_pipeline_config_write_api
-        read_api = localstack_pipeline_config_read_api
+        write_api = localstack_api_factory(PipelineConfigWriteApi)
+        read_api = localstack_api_factory(PipelineConfigReadApi)
         
         # Create multiple pipelines for GSI testing
         base_id = f"gsi-test-{uuid.uuid4().hex[:6]}"
@@ -171,21 +177,16 @@ class TestLocalStackCQRSOperations:
 
     def test_cross_domain_operations_with_real_storage(
         self,
-        localstack_pipeline_config_write_api,
-        localstack_table_config_write_api,
-        localstack_pipeline_run_logs_write_api,
-        localstack_pipeline_config_read_api,
-        localstack_table_config_read_api,
-        localstack_pipeline_run_logs_read_api
+        localstack_api_factory
     ):
         """Test cross-domain operations with real DynamoDB storage."""
-        pipeline_write = localstack_pipeline_config_write_api
-        table_write = localstack_table_config_write_api
-        logs_write = localstack_pipeline_run_logs_write_api
+        pipeline_write = localstack_api_factory(PipelineConfigWriteApi)
+        table_write = localstack_api_factory(TableConfigWriteApi)
+        logs_write = localstack_api_factory(PipelineRunLogsWriteApi)
         
-        pipeline_read = localstack_pipeline_config_read_api
-        table_read = localstack_table_config_read_api
-        logs_read = localstack_pipeline_run_logs_read_api
+        pipeline_read = localstack_api_factory(PipelineConfigReadApi)
+        table_read = localstack_api_factory(TableConfigReadApi)
+        logs_read = localstack_api_factory(PipelineRunLogsReadApi)
         
         # Create unique IDs
         base_id = f"cross-domain-{uuid.uuid4().hex[:6]}"
@@ -274,12 +275,11 @@ class TestLocalStackCQRSOperations:
 
     def test_timezone_compliance_with_real_storage(
         self,
-        localstack_pipeline_run_logs_write_api,
-        localstack_pipeline_run_logs_read_api
+        localstack_api_factory
     ):
         """Test timezone compliance with real DynamoDB storage and retrieval."""
-        write_api = localstack_pipeline_run_logs_write_api
-        read_api = localstack_pipeline_run_logs_read_api
+        write_api = localstack_api_factory(PipelineRunLogsWriteApi)
+        read_api = localstack_api_factory(PipelineRunLogsReadApi)
         
         # Create timezone test context
         tz_context = create_timezone_test_context("America/New_York")
@@ -340,12 +340,11 @@ class TestLocalStackCQRSOperations:
 
     def test_error_handling_with_real_dynamodb(
         self,
-        localstack_pipeline_config_write_api,
-        localstack_pipeline_config_read_api
+        localstack_api_factory
     ):
         """Test error handling with real DynamoDB errors."""
-        write_api = localstack_pipeline_config_write_api
-        read_api = localstack_pipeline_config_read_api
+        write_api = localstack_api_factory(PipelineConfigWriteApi)
+        read_api = localstack_api_factory(PipelineConfigReadApi)
         
         pipeline_id = f"error-test-{uuid.uuid4().hex[:8]}"
         
@@ -394,12 +393,11 @@ class TestLocalStackCQRSOperations:
 
     def test_performance_characteristics_with_real_network(
         self,
-        localstack_pipeline_config_write_api,
-        localstack_pipeline_config_read_api
+        localstack_api_factory
     ):
         """Test performance characteristics with real network calls."""
-        write_api = localstack_pipeline_config_write_api
-        read_api = localstack_pipeline_config_read_api
+        write_api = localstack_api_factory(PipelineConfigWriteApi)
+        read_api = localstack_api_factory(PipelineConfigReadApi)
         
         base_id = f"perf-test-{uuid.uuid4().hex[:6]}"
         
@@ -467,12 +465,11 @@ class TestLocalStackDataConsistency:
 
     def test_concurrent_updates_simulation(
         self,
-        localstack_pipeline_config_write_api,
-        localstack_pipeline_config_read_api
+        localstack_api_factory
     ):
         """Simulate concurrent updates to test consistency."""
-        write_api = localstack_pipeline_config_write_api
-        read_api = localstack_pipeline_config_read_api
+        write_api = localstack_api_factory(PipelineConfigWriteApi)
+        read_api = localstack_api_factory(PipelineConfigReadApi)
         
         pipeline_id = f"concurrent-test-{uuid.uuid4().hex[:8]}"
         
@@ -530,12 +527,11 @@ class TestLocalStackDataConsistency:
 
     def test_transaction_style_operations(
         self,
-        localstack_pipeline_config_write_api,
-        localstack_pipeline_config_read_api
+        localstack_api_factory
     ):
         """Test transaction-style operations for consistency."""
-        write_api = localstack_pipeline_config_write_api
-        read_api = localstack_pipeline_config_read_api
+        write_api = localstack_api_factory(PipelineConfigWriteApi)
+        read_api = localstack_api_factory(PipelineConfigReadApi)
         
         base_id = f"txn-test-{uuid.uuid4().hex[:6]}"
         pipeline_ids = [f"{base_id}-{i:02d}" for i in range(3)]
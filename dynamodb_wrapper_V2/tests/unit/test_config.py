@@ -1,4 +1,5 @@
 import os
+import pickle
 from unittest.mock import patch
 
 import pytest
@@ -106,3 +107,23 @@ class TestDynamoDBConfig:
         """Test region validation."""
         with pytest.raises(ValueError, match="AWS region name is required"):
             DynamoDBConfig(region_name="")
+
+    def test_shared_client_keyed_by_connection_settings(self):
+        """Test equal settings share a client and other settings get their own."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+        client = config.get_shared_client()
+
+        assert DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret").get_shared_client() is client
+        assert config.create_resource().meta.client is client
+        assert config.model_copy(update={'timeout_seconds': 5.0}).get_shared_client() is not client
+        assert "secret" not in config._connection_key()
+
+    def test_config_picklable_after_use(self):
+        """Test a config that already built its client can still be pickled."""
+        config = DynamoDBConfig(aws_access_key_id="key", aws_secret_access_key="secret")
+        client = config.get_shared_client()
+
+        restored = pickle.loads(pickle.dumps(config))
+
+        assert restored == config
+        assert restored.get_shared_client() is client
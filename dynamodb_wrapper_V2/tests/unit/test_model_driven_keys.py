@@ -6,11 +6,14 @@ with the actual domain models and provide a better developer experience.
 """
 
 import pytest
+from pydantic import BaseModel
 from datetime import datetime, timezone
 
 from dynamodb_wrapper.models.domain_models import PipelineConfig, TableConfig, PipelineRunLog
 from dynamodb_wrapper.utils import (
+    extract_model_metadata,
     build_model_key,
+    build_model_key_positional,
     build_model_key_condition, 
     build_gsi_key_condition,
     get_model_key_fields,
@@ -23,19 +26,19 @@ class TestModelMetadata:
     
     def test_pipeline_config_metadata(self):
         """Test PipelineConfig metadata extraction."""
-        assert get_model_key_fields(PipelineConfig) == ['pipeline_id']
+        assert get_model_key_fields(PipelineConfig) == ('pipeline_id',)
         assert 'ActivePipelinesIndex' in get_model_gsi_names(PipelineConfig)
         assert 'EnvironmentIndex' in get_model_gsi_names(PipelineConfig)
     
     def test_table_config_metadata(self):
         """Test TableConfig metadata extraction."""
-        assert get_model_key_fields(TableConfig) == ['table_id']
+        assert get_model_key_fields(TableConfig) == ('table_id',)
         assert 'PipelineTablesIndex' in get_model_gsi_names(TableConfig)
         assert 'TableTypeIndex' in get_model_gsi_names(TableConfig)
     
     def test_pipeline_run_log_metadata(self):
         """Test PipelineRunLog metadata extraction."""
-        assert get_model_key_fields(PipelineRunLog) == ['run_id', 'pipeline_id']
+        assert get_model_key_fields(PipelineRunLog) == ('run_id', 'pipeline_id')
         assert 'PipelineRunsIndex' in get_model_gsi_names(PipelineRunLog)
         assert 'StatusRunsIndex' in get_model_gsi_names(PipelineRunLog)
 
@@ -61,6 +64,15 @@ class TestModelDrivenKeyBuilding:
         )
         assert gsi_condition is not None
     
+    def test_positional_key_building(self):
+        """Test positional key building matches the kwargs API."""
+        assert build_model_key_positional(PipelineConfig, "p1") == build_model_key(PipelineConfig, pipeline_id="p1")
+        assert build_model_key_positional(PipelineRunLog, "r1", "p1") == build_model_key(
+            PipelineRunLog, run_id="r1", pipeline_id="p1"
+        )
+        with pytest.raises(ValueError, match="Missing sort key 'pipeline_id'"):
+            build_model_key_positional(PipelineRunLog, "r1")
+    
     def test_table_config_key_building(self):
         """Test building keys for TableConfig model."""
         # Simple primary key
@@ -106,6 +118,68 @@ class TestModelDrivenKeyBuilding:
         assert gsi_condition is not None
 
 
+class TestMetadataCaching:
+    """Test memoization of Meta class metadata."""
+    
+    def test_metadata_is_cached_per_model_class(self):
+        """Test repeated lookups return the same metadata object."""
+        assert extract_model_metadata(PipelineConfig) is extract_model_metadata(PipelineConfig)
+        assert extract_model_metadata(PipelineConfig) is not extract_model_metadata(TableConfig)
+    
+    def test_gsi_by_name_index(self):
+        """Test GSI definitions are indexed by name in the metadata."""
+        gsi_by_name = extract_model_metadata(PipelineRunLog).gsi_by_name
+        assert set(gsi_by_name) == set(get_model_gsi_names(PipelineRunLog))
+        assert gsi_by_name['StatusRunsIndex'].partition_key == 'status'
+    
+    def test_key_fields_and_gsi_names_are_cached_tuples(self):
+        """Test key fields and GSI names are immutable tuples shared across calls."""
+        assert get_model_key_fields(PipelineConfig) is get_model_key_fields(PipelineConfig)
+        assert get_model_gsi_names(PipelineRunLog) is get_model_gsi_names(PipelineRunLog)
+        assert isinstance(get_model_key_fields(PipelineConfig), tuple)
+        assert isinstance(get_model_gsi_names(PipelineRunLog), tuple)
+    
+    def test_metadata_is_frozen(self):
+        """Test the shared metadata object cannot be mutated."""
+        metadata = extract_model_metadata(PipelineConfig)
+        assert metadata.partition_key == 'pipeline_id'
+        assert metadata.sort_key is None
+        with pytest.raises(AttributeError):
+            metadata.partition_key = 'other'
+    
+    def test_key_attributes_reused_across_conditions(self):
+        """Test boto3 Key objects are reused between key conditions."""
+        first = build_model_key_condition(PipelineConfig, pipeline_id="p1").get_expression()
+        second = build_model_key_condition(PipelineConfig, pipeline_id="p2").get_expression()
+        
+        assert first['values'][0] is second['values'][0]
+        assert first['values'][0].name == 'pipeline_id'
+        assert (first['values'][1], second['values'][1]) == ("p1", "p2")
+    
+    def test_generated_key_builders(self):
+        """Test per-model key builders are generated once and cached in metadata."""
+        metadata = extract_model_metadata(PipelineRunLog)
+        assert metadata.key_builder({'run_id': 'r1', 'pipeline_id': 'p1', 'extra': 'x'}) == {
+            'run_id': 'r1', 'pipeline_id': 'p1'
+        }
+        assert metadata.key_extractor({'run_id': 'r1'}) == ('r1', None)
+        assert extract_model_metadata(PipelineConfig).key_builder({'pipeline_id': 'p1'}) == {'pipeline_id': 'p1'}
+    
+    def test_generated_key_builder_quotes_field_names(self):
+        """Test field names are embedded safely in generated source."""
+        class QuotedModel(BaseModel):
+            weird_id: str
+            
+            class Meta:
+                partition_key = "it's"
+                sort_key = None
+                gsis = []
+        
+        assert build_model_key(QuotedModel, **{"it's": 'v'}) == {"it's": 'v'}
+        with pytest.raises(ValueError, match="Missing partition key"):
+            build_model_key(QuotedModel)
+
+
 class TestErrorHandling:
     """Test error handling in model-driven key building."""
     
@@ -119,6 +193,14 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="Missing sort key 'pipeline_id'"):
             build_model_key(PipelineRunLog, run_id="test-run")
     
+    def test_invalid_sort_condition(self):
+        """Test error for unsupported sort conditions and incomplete 'between'."""
+        with pytest.raises(ValueError, match="Unsupported sort_condition: bogus"):
+            build_model_key_condition(PipelineRunLog, sort_condition="bogus", run_id="r1", pipeline_id="p1")
+        
+        with pytest.raises(ValueError, match="requires sort_value2"):
+            build_model_key_condition(PipelineRunLog, sort_condition="between", run_id="r1", pipeline_id="p1")
+    
     def test_invalid_gsi_name(self):
         """Test error when GSI name doesn't exist."""
         with pytest.raises(ValueError, match="GSI 'InvalidIndex' not found"):
@@ -1,5 +1,8 @@
 from datetime import datetime, timezone
 
+import pytest
+from pydantic import ValidationError
+
 from dynamodb_wrapper.models.domain_models import (
     PipelineConfig, PipelineRunLog, TableConfig,
     LogLevel, RunStatus, DataFormat, TableType
@@ -159,6 +162,50 @@ class TestPipelineRunLog:
         assert isinstance(log.start_time, datetime)
         assert isinstance(log.created_at, datetime)
 
+    def test_config_snapshot_compressed_when_large(self):
+        """Test large config snapshots are stored as compressed Binary and round-trip."""
+        from decimal import Decimal
+        from boto3.dynamodb.types import Binary
+
+        snapshot = {"version": "1.2.0", "cpu_cores": 4, "memory_gb": 16,
+                    "spark": {f"spark.conf.key{i}": "value" for i in range(20)}}
+        log = PipelineRunLog(
+            run_id="test-run-123",
+            pipeline_id="test-pipeline",
+            status=RunStatus.PENDING,
+            trigger_type="manual",
+            config_snapshot=snapshot
+        )
+
+        item = log.to_dynamodb_item()
+        assert isinstance(item["config_snapshot"], bytes)
+        assert len(item["config_snapshot"]) < len(str(snapshot))
+
+        # boto3 wraps Binary attributes on read
+        item["config_snapshot"] = Binary(item["config_snapshot"])
+        assert PipelineRunLog.from_dynamodb_item(item).config_snapshot == snapshot
+
+        # Snapshots read back with Decimal numbers are re-compressed without losing precision
+        read_back = {**snapshot, "memory_gb": Decimal("16"), "ratio": Decimal("0.12345678901234567890123")}
+        stored = log.model_copy(update={"config_snapshot": read_back})
+        restored = PipelineRunLog.from_dynamodb_item(stored.to_dynamodb_item()).config_snapshot
+        assert restored == read_back
+        assert isinstance(restored["ratio"], Decimal)
+
+    def test_small_config_snapshot_stored_as_map(self):
+        """Test small snapshots skip compression."""
+        log = PipelineRunLog(
+            run_id="test-run-123",
+            pipeline_id="test-pipeline",
+            status=RunStatus.PENDING,
+            trigger_type="manual",
+            config_snapshot={"version": "1.0"}
+        )
+
+        item = log.to_dynamodb_item()
+        assert item["config_snapshot"] == {"version": "1.0"}
+        assert PipelineRunLog.from_dynamodb_item(item).config_snapshot == {"version": "1.0"}
+
     def test_pipeline_run_log_with_stages(self):
         """Test pipeline run log with stage information."""
         from dynamodb_wrapper.models.domain_models import StageInfo
@@ -226,3 +273,83 @@ class TestPipelineRunLog:
         assert LogLevel.WARNING == "warning"
         assert LogLevel.ERROR == "error"
         assert LogLevel.CRITICAL == "critical"
+
+
+class TestDeferredBuild:
+    """Test cases for deferred Pydantic schema building."""
+
+    def test_models_defer_schema_build(self):
+        """Test all domain models, views and DTOs defer building until first use."""
+        from dynamodb_wrapper import models
+
+        for name in models.__all__:
+            model_class = getattr(models, name)
+            if isinstance(model_class, type) and hasattr(model_class, 'model_config'):
+                assert model_class.model_config.get('defer_build') is True, name
+
+    def test_deferred_model_keeps_config(self):
+        """Test deferred build does not drop per-model config."""
+        assert PipelineConfig.model_config['validate_assignment'] is True
+        config = PipelineConfig(
+            pipeline_id="test-pipeline",
+            pipeline_name="Test Pipeline",
+            source_type="s3",
+            destination_type="redshift"
+        )
+        assert PipelineConfig.__pydantic_complete__ is True
+        assert config.pipeline_id == "test-pipeline"
+
+
+class TestTableConfigUpsertValidationPatterns:
+    """Test cases for compiled TableConfigUpsert validation rules."""
+
+    def _upsert(self, validation_rules):
+        from dynamodb_wrapper.models import TableConfigUpsert
+
+        return TableConfigUpsert(
+            table_id="test-table",
+            pipeline_id="test-pipeline",
+            table_name="test_table",
+            table_type=TableType.SOURCE,
+            data_format=DataFormat.PARQUET,
+            location="s3://bucket/path/",
+            validation_rules=validation_rules
+        )
+
+    def test_format_rules_compiled_once(self):
+        """Test '*_format' string rules are compiled and other rules are left alone."""
+        upsert = self._upsert({
+            "email_format": r"^[^@]+@[^@]+\.[a-z]{2,}$",
+            "customer_id_length": {"min": 5, "max": 50}
+        })
+
+        assert set(upsert.validation_patterns) == {"email_format"}
+        assert upsert.validation_patterns["email_format"].match("a@b.io")
+        assert "validation_patterns" not in upsert.model_dump()
+
+    def test_invalid_format_rule_rejected(self):
+        """Test an uncompilable '*_format' rule fails validation."""
+        with pytest.raises(ValidationError, match="Invalid regex for validation rule 'email_format'"):
+            self._upsert({"email_format": "[unclosed"})
+
+    def test_as_item_cached_and_omits_none(self):
+        """Test the serialized item is computed once and drops unset fields."""
+        upsert = self._upsert({})
+
+        item = upsert.as_item
+        assert item is upsert.as_item
+        assert item["table_id"] == "test-table"
+        assert "description" not in item
+        assert "as_item" not in upsert.model_dump()
+
+    def test_as_item_refreshed_after_changes(self):
+        """Test field assignment and model_copy do not return a stale item."""
+        upsert = self._upsert({})
+        assert "description" not in upsert.as_item
+
+        upsert.description = "Assigned"
+        assert upsert.as_item["description"] == "Assigned"
+
+        copied = upsert.model_copy(update={"description": "Copied"})
+        assert copied.as_item["description"] == "Copied"
+        assert upsert.as_item["description"] == "Assigned"
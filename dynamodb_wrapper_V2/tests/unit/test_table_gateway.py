@@ -5,13 +5,18 @@ These tests verify the thin DynamoDB wrapper that provides building blocks
 for CQRS read/write APIs without heavyweight abstractions.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import MagicMock, Mock, patch
+
+import boto3
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from botocore.exceptions import ClientError
 
 from dynamodb_wrapper.config import DynamoDBConfig
 from dynamodb_wrapper.core.table_gateway import TableGateway, create_table_gateway
-from dynamodb_wrapper.exceptions import ConnectionError, ConflictError
+from dynamodb_wrapper.exceptions import ConflictError, ConnectionError
+from tests.helpers import seed_table, truncate_table
 
 
 @pytest.fixture
@@ -55,35 +60,26 @@ class TestTableGateway:
         
         assert gateway.config == mock_config
         assert gateway.table_name == "test_table"
-        assert gateway._dynamodb is None
-        assert gateway._table is None
+        assert getattr(gateway._local, 'dynamodb', None) is None
+        assert getattr(gateway._local, 'table', None) is None
 
     def test_dynamodb_property_lazy_initialization(self, mock_config):
         """Test lazy initialization of DynamoDB resource."""
-        with patch('boto3.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_dynamodb = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.resource.return_value = mock_dynamodb
-            
+        mock_dynamodb = Mock()
+        with patch.object(DynamoDBConfig, 'create_resource', return_value=mock_dynamodb) as create_resource:
             gateway = TableGateway(mock_config, "test_table")
             
             # First access should create the resource
             result = gateway.dynamodb
             
             assert result == mock_dynamodb
-            assert gateway._dynamodb == mock_dynamodb
-            mock_session_class.assert_called_once()
-            mock_session.resource.assert_called_once()
+            assert gateway._local.dynamodb == mock_dynamodb
+            create_resource.assert_called_once()
 
     def test_dynamodb_property_reuses_instance(self, mock_config):
         """Test that DynamoDB resource is reused on subsequent accesses."""
-        with patch('boto3.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_dynamodb = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.resource.return_value = mock_dynamodb
-            
+        mock_dynamodb = Mock()
+        with patch.object(DynamoDBConfig, 'create_resource', return_value=mock_dynamodb) as create_resource:
             gateway = TableGateway(mock_config, "test_table")
             
             # Multiple accesses should reuse the same instance
@@ -91,7 +87,32 @@ class TestTableGateway:
             result2 = gateway.dynamodb
             
             assert result1 == result2 == mock_dynamodb
-            mock_session_class.assert_called_once()
+            create_resource.assert_called_once()
+
+    def test_dynamodb_resource_per_thread(self, mock_config):
+        """Test each thread gets its own DynamoDB resource on one shared client."""
+        gateway = TableGateway(mock_config, "test_table")
+        main_resource = gateway.dynamodb
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_resource = executor.submit(lambda: gateway.dynamodb).result()
+        
+        assert gateway.dynamodb is main_resource
+        assert worker_resource is not main_resource
+        assert worker_resource.meta.client is main_resource.meta.client
+
+    def test_gateways_share_client(self, mock_config):
+        """Test gateways built from equivalent configs share one session and client."""
+        with patch('boto3.Session', wraps=boto3.Session) as session_class:
+            pipelines = TableGateway(mock_config, "pipeline_config")
+            tables = TableGateway(mock_config.model_copy(), "table_config")
+            
+            assert pipelines.table.meta.client is tables.table.meta.client
+            assert pipelines.dynamodb is not tables.dynamodb
+            session_class.assert_called_once()
+
+        other_region = TableGateway(mock_config.model_copy(update={'region_name': 'eu-west-1'}), "pipeline_config")
+        assert other_region.dynamodb.meta.client.meta.region_name == 'eu-west-1'
 
     def test_dynamodb_connection_error(self, mock_config):
         """Test DynamoDB connection error handling."""
@@ -105,32 +126,24 @@ class TestTableGateway:
 
     def test_table_property_lazy_initialization(self, mock_config):
         """Test lazy initialization of table resource."""
-        with patch('boto3.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_dynamodb = Mock()
-            mock_table = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.resource.return_value = mock_dynamodb
-            mock_dynamodb.Table.return_value = mock_table
-            
+        mock_dynamodb = Mock()
+        mock_table = Mock()
+        mock_dynamodb.Table.return_value = mock_table
+        with patch.object(DynamoDBConfig, 'create_resource', return_value=mock_dynamodb):
             gateway = TableGateway(mock_config, "test_table")
             
             # First access should create the table resource
             result = gateway.table
             
             assert result == mock_table
-            assert gateway._table == mock_table
+            assert gateway._local.table == mock_table
             mock_dynamodb.Table.assert_called_once_with("test_table")
 
     def test_table_access_error(self, mock_config):
         """Test table access error handling."""
-        with patch('boto3.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_dynamodb = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.resource.return_value = mock_dynamodb
-            mock_dynamodb.Table.side_effect = Exception("Table access failed")
-            
+        mock_dynamodb = Mock()
+        mock_dynamodb.Table.side_effect = Exception("Table access failed")
+        with patch.object(DynamoDBConfig, 'create_resource', return_value=mock_dynamodb):
             gateway = TableGateway(mock_config, "test_table")
             
             with pytest.raises(ConnectionError, match="Failed to access table"):
@@ -352,6 +365,136 @@ class TestTableGateway:
             assert result == mock_batch_writer
             mock_table.batch_writer.assert_called_once()
 
+    def test_batch_put_items_chunks_by_25(self, mock_config):
+        """Test batch_put_items sends one BatchWriteItem per 25 items."""
+        mock_dynamodb = Mock()
+        mock_dynamodb.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb):
+            gateway = TableGateway(mock_config, "test_table")
+            items = [{'table_id': f'table-{i}'} for i in range(30)]
+            
+            result = gateway.batch_put_items(items)
+            
+            assert result == 30
+            assert mock_dynamodb.batch_write_item.call_count == 2
+            first_call = mock_dynamodb.batch_write_item.call_args_list[0]
+            assert len(first_call.kwargs['RequestItems']['test_table']) == 25
+
+    def test_batch_put_items_retries_unprocessed(self, mock_config):
+        """Test batch_put_items re-submits UnprocessedItems with backoff."""
+        unprocessed = [{'PutRequest': {'Item': {'table_id': 'table-1'}}}]
+        mock_dynamodb = Mock()
+        mock_dynamodb.batch_write_item.side_effect = [
+            {'UnprocessedItems': {'test_table': unprocessed}},
+            {'UnprocessedItems': {}}
+        ]
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb), \
+             patch('dynamodb_wrapper.core.table_gateway.time.sleep') as mock_sleep:
+            gateway = TableGateway(mock_config, "test_table")
+            
+            gateway.batch_put_items([{'table_id': 'table-0'}, {'table_id': 'table-1'}])
+            
+            assert mock_dynamodb.batch_write_item.call_count == 2
+            retry_call = mock_dynamodb.batch_write_item.call_args_list[1]
+            assert retry_call.kwargs['RequestItems'] == {'test_table': unprocessed}
+            mock_sleep.assert_called_once()
+
+    def test_batch_put_items_raises_after_max_retries(self, mock_config):
+        """Test batch_put_items raises RetryableError when items stay unprocessed."""
+        from dynamodb_wrapper.exceptions import RetryableError
+        
+        unprocessed = [{'PutRequest': {'Item': {'table_id': 'table-0'}}}]
+        mock_dynamodb = Mock()
+        mock_dynamodb.batch_write_item.return_value = {'UnprocessedItems': {'test_table': unprocessed}}
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb), \
+             patch('dynamodb_wrapper.core.table_gateway.time.sleep'):
+            gateway = TableGateway(mock_config, "test_table")
+            
+            with pytest.raises(RetryableError):
+                gateway.batch_put_items([{'table_id': 'table-0'}], max_retries=2)
+            
+            assert mock_dynamodb.batch_write_item.call_count == 3
+
+    def test_batch_get_items_deduplicates_keys(self, mock_config):
+        """Test batch_get_items removes duplicate keys before calling BatchGetItem."""
+        mock_dynamodb = Mock()
+        mock_client = mock_dynamodb.meta.client
+        mock_client.batch_get_item.return_value = {
+            'Responses': {'test_table': [{'table_id': 'a'}, {'table_id': 'b'}]},
+            'UnprocessedKeys': {}
+        }
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb):
+            gateway = TableGateway(mock_config, "test_table")
+            
+            result = gateway.batch_get_items(
+                [{'table_id': 'a'}, {'table_id': 'b'}, {'table_id': 'a'}],
+                projection_expression='#f0',
+                expression_attribute_names={'#f0': 'table_id'}
+            )
+            
+            assert result == [{'table_id': 'a'}, {'table_id': 'b'}]
+            mock_client.batch_get_item.assert_called_once_with(
+                RequestItems={'test_table': {
+                    'Keys': [{'table_id': 'a'}, {'table_id': 'b'}],
+                    'ProjectionExpression': '#f0',
+                    'ExpressionAttributeNames': {'#f0': 'table_id'}
+                }}
+            )
+
+    def test_batch_get_items_chunks_by_100(self, mock_config):
+        """Test batch_get_items splits keys into 100-key BatchGetItem calls."""
+        def batch_get_item(RequestItems):
+            keys = RequestItems['test_table']['Keys']
+            return {'Responses': {'test_table': list(keys)}, 'UnprocessedKeys': {}}
+        
+        mock_dynamodb = Mock()
+        mock_client = mock_dynamodb.meta.client
+        mock_client.batch_get_item.side_effect = batch_get_item
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb):
+            gateway = TableGateway(mock_config, "test_table")
+            keys = [{'table_id': f'table-{i}'} for i in range(250)]
+            
+            result = gateway.batch_get_items(keys)
+            
+            assert mock_client.batch_get_item.call_count == 3
+            assert sorted(item['table_id'] for item in result) == sorted(key['table_id'] for key in keys)
+
+    def test_batch_get_items_retries_unprocessed(self, mock_config):
+        """Test batch_get_items re-requests UnprocessedKeys with backoff."""
+        unprocessed = {'Keys': [{'table_id': 'b'}]}
+        mock_dynamodb = Mock()
+        mock_client = mock_dynamodb.meta.client
+        mock_client.batch_get_item.side_effect = [
+            {'Responses': {'test_table': [{'table_id': 'a'}]}, 'UnprocessedKeys': {'test_table': unprocessed}},
+            {'Responses': {'test_table': [{'table_id': 'b'}]}, 'UnprocessedKeys': {}}
+        ]
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb), \
+             patch('dynamodb_wrapper.core.table_gateway.time.sleep') as mock_sleep:
+            gateway = TableGateway(mock_config, "test_table")
+            
+            result = gateway.batch_get_items([{'table_id': 'a'}, {'table_id': 'b'}])
+            
+            assert result == [{'table_id': 'a'}, {'table_id': 'b'}]
+            retry_call = mock_client.batch_get_item.call_args_list[1]
+            assert retry_call.kwargs['RequestItems'] == {'test_table': unprocessed}
+            mock_sleep.assert_called_once()
+
+    def test_batch_get_items_empty(self, mock_config):
+        """Test batch_get_items with no keys makes no request."""
+        mock_dynamodb = Mock()
+        
+        with patch.object(TableGateway, 'dynamodb', mock_dynamodb):
+            gateway = TableGateway(mock_config, "test_table")
+            
+            assert gateway.batch_get_items([]) == []
+            mock_dynamodb.meta.client.batch_get_item.assert_not_called()
+
     def test_transact_write_items(self, mock_config):
         """Test transact_write_items operation."""
         mock_dynamodb = Mock()
@@ -508,7 +651,7 @@ class TestTableGatewayConfiguration:
         mock_config.timeout_seconds = 30
         
         with patch('boto3.Session') as mock_session_class:
-            with patch('dynamodb_wrapper.core.table_gateway.Config') as mock_config_class:
+            with patch('botocore.config.Config') as mock_config_class:
                 mock_session = Mock()
                 mock_boto_config = Mock()
                 mock_session_class.return_value = mock_session
@@ -527,4 +670,45 @@ class TestTableGatewayConfiguration:
                 
                 # Verify config is passed to resource creation
                 resource_kwargs = mock_session.resource.call_args[1]
-                assert resource_kwargs['config'] == mock_boto_config
\ No newline at end of file
+                assert resource_kwargs['config'] == mock_boto_config
+
+class TestTableGatewayWithMoto:
+    """Test TableGateway against the module-scoped moto tables."""
+
+    def test_put_item_round_trip(self, mock_config, pipeline_config_table):
+        """Test an item written through the gateway is stored in the table."""
+        gateway = TableGateway(mock_config, pipeline_config_table.name)
+        gateway.put_item({'pipeline_id': 'left-over', 'pipeline_name': 'Left Over'})
+
+        assert pipeline_config_table.get_item(Key={'pipeline_id': 'left-over'})['Item']['pipeline_name'] == 'Left Over'
+
+    def test_batch_get_items_round_trip(self, mock_config, pipeline_config_table):
+        """Test batch_get_items across several chunks returns deserialized items."""
+        seed_table(pipeline_config_table, ({'pipeline_id': f'batch-{i}', 'retries': i} for i in range(150)))
+        gateway = TableGateway(mock_config, pipeline_config_table.name)
+
+        items = gateway.batch_get_items([{'pipeline_id': f'batch-{i}'} for i in range(150)] + [{'pipeline_id': 'missing'}])
+
+        assert sorted(items, key=lambda item: item['retries']) == [
+            {'pipeline_id': f'batch-{i}', 'retries': Decimal(i)} for i in range(150)
+        ]
+
+    def test_truncate_table_removes_all_items(self, pipeline_config_table):
+        """Test truncate_table empties a seeded table so items do not leak between tests."""
+        seed_table(pipeline_config_table, [{'pipeline_id': f'stale-{i}'} for i in range(30)])
+        assert len(pipeline_config_table.scan()['Items']) == 30
+
+        assert truncate_table(pipeline_config_table) is pipeline_config_table
+        assert pipeline_config_table.scan()['Items'] == []
+
+    def test_seed_table_batches_writes(self, mock_config, pipeline_config_table):
+        """Test seeded items are written in batches and readable through the gateway."""
+        items = [{'pipeline_id': f'seeded-{i}', 'pipeline_name': f'Seeded {i}'} for i in range(30)]
+
+        with patch.object(pipeline_config_table.meta.client, 'batch_write_item',
+                          wraps=pipeline_config_table.meta.client.batch_write_item) as batch_write:
+            assert seed_table(pipeline_config_table, items, overwrite_by_pkeys=['pipeline_id']) == 30
+
+        assert batch_write.call_count == 2
+        gateway = TableGateway(mock_config, pipeline_config_table.name)
+        assert len(gateway.scan()['Items']) == 30
@@ -43,6 +43,18 @@ class TestSimplifiedTimezoneFunctions:
         assert result.tzinfo == timezone.utc
         assert result.hour == 10  # Same hour, just added UTC timezone
 
+    def test_to_utc_fast_paths(self):
+        """Test already-UTC and zero-offset datetimes skip astimezone()."""
+        from zoneinfo import ZoneInfo
+        dt = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+        assert to_utc(dt) is dt
+        
+        london_winter = datetime(2024, 1, 1, 10, 0, 0, tzinfo=ZoneInfo('Europe/London'))
+        result = to_utc(london_winter)
+        assert result.tzinfo is timezone.utc
+        assert result == london_winter
+        assert result.hour == 10
+
     def test_to_utc_with_none(self):
         """Test converting None datetime to UTC."""
         result = to_utc(None)
@@ -58,6 +70,15 @@ class TestSimplifiedTimezoneFunctions:
         assert result.tzinfo == timezone.utc
         assert result.hour == 10  # Same time, just made aware
 
+    def test_ensure_timezone_aware_with_utc_string(self):
+        """Test an explicit "UTC" name attaches the timezone.utc singleton."""
+        dt = datetime(2024, 1, 1, 10, 0, 0)  # Naive
+        
+        result = ensure_timezone_aware(dt, "UTC")
+        
+        assert result.tzinfo is timezone.utc
+        assert result.hour == 10
+
     def test_ensure_timezone_aware_with_custom_timezone(self):
         """Test ensuring naive datetime with custom assumed timezone."""
         dt = datetime(2024, 1, 1, 10, 0, 0)  # Naive
@@ -68,6 +89,17 @@ class TestSimplifiedTimezoneFunctions:
         assert result.tzinfo is not None
         assert result.hour == 10  # Same time, but in NY timezone
 
+    def test_ensure_timezone_aware_with_tzinfo(self):
+        """Test ensuring naive datetime with a pre-resolved tzinfo."""
+        from zoneinfo import ZoneInfo
+        ny_tz = ZoneInfo('America/New_York')
+        dt = datetime(2024, 1, 1, 10, 0, 0)  # Naive
+        
+        result = ensure_timezone_aware(dt, ny_tz)
+        
+        assert result.tzinfo is ny_tz
+        assert result.hour == 10
+
     def test_ensure_timezone_aware_with_aware_datetime(self):
         """Test ensuring timezone-aware datetime remains unchanged."""
         dt = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -115,6 +147,18 @@ class TestSimplifiedTimezoneFunctions:
         result = to_user_timezone(None, "America/New_York")
         assert result is None
 
+    def test_timezone_names_resolved_once(self):
+        """Test repeated conversions reuse the cached zone object."""
+        summer = datetime(2024, 7, 1, 15, 0, 0, tzinfo=timezone.utc)
+        winter = datetime(2024, 1, 1, 15, 0, 0, tzinfo=timezone.utc)
+
+        first = to_user_timezone(summer, "America/New_York")
+        second = to_user_timezone(winter, "America/New_York")
+
+        assert first.tzinfo is second.tzinfo
+        assert first.hour == 11  # EDT
+        assert second.hour == 10  # EST
+
 
 class TestTimezoneUtilityFunctions:
     """Test additional timezone utility functions."""